@@ -0,0 +1,508 @@
+"""
+Offline benchmarks for backend and agent hot paths.
+
+Every scenario runs against fixtures generated from a fixed seed and needs no
+browser, network or LLM. Timings depend on the machine, so only compare results
+with a baseline recorded on the same machine; the baseline is not committed, create
+it locally with --update-baseline before comparing.
+
+Usage:
+    python tests/benchmark_hot_paths.py                        # run all, compare with the baseline
+    python tests/benchmark_hot_paths.py -k graph -k sqlite     # only scenarios matching a keyword
+    python tests/benchmark_hot_paths.py --output results.json  # also write the results
+    python tests/benchmark_hot_paths.py --update-baseline      # store the results as the new baseline
+
+Exits with status 1 when a scenario fails, its median is slower than the
+baseline by more than --threshold, or the baseline file is missing.
+"""
+import argparse
+import asyncio
+import base64
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BASELINE = PROJECT_ROOT / 'tests' / 'benchmark_baseline.json'
+SEED = 20240501
+
+
+@dataclass
+class Scenario:
+    name: str
+    # Builds a fresh run for one iteration; only awaiting the returned run is timed
+    setup: Callable[['Fixtures'], Awaitable[Callable[[], Awaitable[Any]]]]
+    repeat: int
+    warmup: int
+
+
+SCENARIOS: List[Scenario] = []
+
+
+def benchmark(name: str, repeat: int = 10, warmup: int = 1):
+    def decorator(setup):
+        SCENARIOS.append(Scenario(name=name, setup=setup, repeat=repeat, warmup=warmup))
+        return setup
+
+    return decorator
+
+
+class Fixtures:
+    """Deterministic inputs shared by the scenarios, created lazily under a temporary directory."""
+
+    def __init__(self, root: Path, html_dir: Optional[Path] = None):
+        self.root = root
+        self.html_dir = html_dir
+        self._cache: Dict[str, Any] = {}
+
+    async def get(self, name: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        if name not in self._cache:
+            self._cache[name] = await factory()
+        return self._cache[name]
+
+    async def close(self):
+        db_manager = self._cache.get('sqlite')
+        if db_manager is not None:
+            await db_manager.close()
+
+
+# ---------------------------------------------------------------------------
+# Langflow graph execution
+# ---------------------------------------------------------------------------
+
+def _build_dag(width: int, depth: int):
+    """One text input fanning out into `width` chains of `depth` text outputs."""
+    from vibe_surf.langflow.components.input_output.text import TextInputComponent
+    from vibe_surf.langflow.components.input_output.text_output import TextOutputComponent
+    from vibe_surf.langflow.graph.graph.base import Graph
+
+    graph = Graph()
+    root = TextInputComponent(input_value='benchmark input')
+    root_id = graph.add_component(root, component_id='TextInput-root')
+    for chain in range(width):
+        source_id = root_id
+        for level in range(depth):
+            node_id = graph.add_component(TextOutputComponent(), component_id=f'TextOutput-{chain}-{level}')
+            graph.add_component_edge(source_id, ('text', 'input_value'), node_id)
+            source_id = node_id
+    graph.prepare()
+    return graph
+
+
+def _graph_scenario(width: int, depth: int):
+    @benchmark(f'graph_process_dag_{width}x{depth}', repeat=5)
+    async def setup(fixtures: Fixtures):
+        graph = _build_dag(width, depth)
+
+        async def run():
+            await graph.process(fallback_to_env_vars=False)
+
+        return run
+
+
+for _width, _depth in ((4, 4), (16, 8)):
+    _graph_scenario(_width, _depth)
+
+
+# ---------------------------------------------------------------------------
+# Screenshot highlighting
+# ---------------------------------------------------------------------------
+
+async def _make_screenshot() -> str:
+    from PIL import Image, ImageDraw
+
+    rng = random.Random(SEED)
+    image = Image.new('RGB', (1280, 2400), 'white')
+    draw = ImageDraw.Draw(image)
+    for _ in range(400):
+        x, y = rng.randrange(1200), rng.randrange(2350)
+        draw.rectangle([x, y, x + rng.randrange(20, 80), y + rng.randrange(10, 40)],
+                       fill=tuple(rng.randrange(256) for _ in range(3)))
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG')
+    return base64.b64encode(buffer.getvalue()).decode('utf-8')
+
+
+def _make_elements(count: int) -> List[List[Any]]:
+    rng = random.Random(SEED + count)
+    elements = []
+    for index in range(count):
+        x1, y1 = rng.uniform(0, 1180), rng.uniform(0, 2340)
+        elements.append([index, [x1, y1, x1 + rng.uniform(20, 100), y1 + rng.uniform(12, 60)]])
+    return elements
+
+
+def _highlight_scenario(count: int):
+    @benchmark(f'highlight_screenshot_{count}_elements', repeat=5)
+    async def setup(fixtures: Fixtures):
+        from vibe_surf.browser.utils import highlight_screenshot
+
+        screenshot = await fixtures.get('screenshot', _make_screenshot)
+        elements = _make_elements(count)
+
+        async def run():
+            highlight_screenshot(screenshot, elements)
+
+        return run
+
+
+for _count in (50, 250, 1000):
+    _highlight_scenario(_count)
+
+
+# ---------------------------------------------------------------------------
+# HTML to markdown extraction
+# ---------------------------------------------------------------------------
+
+def _make_html(sections: int) -> str:
+    rng = random.Random(SEED + sections)
+    words = ['browser', 'agent', 'workflow', 'session', 'market', 'report', 'search', 'result',
+             'profile', 'token', 'latency', 'page', 'table', 'summary', 'download', 'vibe']
+
+    def sentence(n: int) -> str:
+        return ' '.join(rng.choice(words) for _ in range(n)).capitalize() + '.'
+
+    parts = ['<html><head><title>Benchmark page</title><style>body{margin:0}</style>'
+             '<script>window.analytics = {};</script></head><body><nav>']
+    parts.extend(f'<a href="/nav/{i}">{sentence(2)}</a>' for i in range(20))
+    parts.append('</nav><main>')
+    for section in range(sections):
+        parts.append(f'<section id="s{section}"><h2>{sentence(4)}</h2>')
+        parts.extend(f'<p>{sentence(40)} <a href="https://example.com/{section}/{i}">{sentence(3)}</a></p>'
+                     for i in range(4))
+        parts.append('<ul>' + ''.join(f'<li>{sentence(6)}</li>' for _ in range(6)) + '</ul>')
+        parts.append('<table><tr><th>Name</th><th>Value</th><th>Change</th></tr>')
+        parts.extend(f'<tr><td>{sentence(2)}</td><td>{rng.random() * 1000:.2f}</td>'
+                     f'<td>{rng.uniform(-5, 5):+.2f}%</td></tr>' for _ in range(8))
+        parts.append('</table></section>')
+    parts.append('</main><footer>' + sentence(20) + '</footer></body></html>')
+    return ''.join(parts)
+
+
+async def _html_pages(fixtures: Fixtures) -> Dict[str, str]:
+    """Generated pages, plus any saved *.html pages passed with --html-dir."""
+    async def factory():
+        pages = {}
+        for sections in (10, 200):
+            path = fixtures.root / 'html' / f'generated_{sections}.html'
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(_make_html(sections), encoding='utf-8')
+            pages[path.stem] = path.read_text(encoding='utf-8')
+        if fixtures.html_dir:
+            for path in sorted(fixtures.html_dir.glob('*.html')):
+                pages[path.stem] = path.read_text(encoding='utf-8', errors='ignore')
+        return pages
+
+    return await fixtures.get('html_pages', factory)
+
+
+class _SavedPageDOMService:
+    """Serves a saved page in place of a live DOM tree."""
+
+    def __init__(self, html: str):
+        self.html = html
+
+    async def get_dom_tree(self, target_id: str):
+        return self.html
+
+
+def _markdown_scenario(page: str):
+    @benchmark(f'extract_clean_markdown_{page}', repeat=5)
+    async def setup(fixtures: Fixtures):
+        from unittest import mock
+        from browser_use.dom import markdown_extractor
+
+        html = (await _html_pages(fixtures))[page]
+
+        async def run():
+            # The DOM tree is already serialized, so only the markdown conversion is measured
+            with mock.patch.object(markdown_extractor.HTMLSerializer, 'serialize', lambda self, tree: tree):
+                await markdown_extractor.extract_clean_markdown(
+                    dom_service=_SavedPageDOMService(html), target_id='benchmark', extract_links=True
+                )
+
+        return run
+
+
+def _register_markdown_scenarios(html_dir: Optional[Path]):
+    pages = ['generated_10', 'generated_200']
+    if html_dir:
+        pages.extend(path.stem for path in sorted(html_dir.glob('*.html')))
+    for page in pages:
+        _markdown_scenario(page)
+
+
+# ---------------------------------------------------------------------------
+# Task and session queries on a seeded SQLite file
+# ---------------------------------------------------------------------------
+
+SEED_SESSIONS = 200
+SEED_TASKS_PER_SESSION = 10
+
+
+async def _seed_database(fixtures: Fixtures):
+    from vibe_surf.backend.database.manager import DatabaseManager
+    from vibe_surf.backend.database.queries import TaskQueries
+
+    db_path = fixtures.root / 'benchmark.db'
+    db_manager = DatabaseManager(f'sqlite+aiosqlite:///{db_path}')
+    await db_manager.create_tables(use_migrations=True)
+
+    rng = random.Random(SEED)
+    statuses = ['completed', 'completed', 'completed', 'failed', 'stopped']
+    async for db in db_manager.get_session():
+        for session_index in range(SEED_SESSIONS):
+            session_id = f'session-{session_index:05d}'
+            for task_index in range(SEED_TASKS_PER_SESSION):
+                await TaskQueries.save_task(
+                    db,
+                    task_id=f'{session_id}-task-{task_index:03d}',
+                    session_id=session_id,
+                    task_description=f'Benchmark task {task_index} ' + 'x' * rng.randrange(50, 500),
+                    llm_profile_name='benchmark',
+                    workspace_dir=str(fixtures.root),
+                    task_result='result ' * rng.randrange(10, 200),
+                    task_status=rng.choice(statuses),
+                )
+    return db_manager
+
+
+def _sqlite_scenario(name: str, query: Callable[[Any, Any], Awaitable[Any]]):
+    @benchmark(f'sqlite_{name}', repeat=20, warmup=2)
+    async def setup(fixtures: Fixtures):
+        from vibe_surf.backend.database.queries import TaskQueries
+
+        db_manager = await fixtures.get('sqlite', lambda: _seed_database(fixtures))
+
+        async def run():
+            async for db in db_manager.get_session():
+                await query(TaskQueries, db)
+
+        return run
+
+
+_MIDDLE_SESSION = f'session-{SEED_SESSIONS // 2:05d}'
+
+_sqlite_scenario('get_all_sessions_page', lambda queries, db: queries.get_all_sessions(db, limit=50))
+_sqlite_scenario('get_all_sessions_all', lambda queries, db: queries.get_all_sessions(db))
+_sqlite_scenario('get_tasks_by_session', lambda queries, db: queries.get_tasks_by_session(db, _MIDDLE_SESSION))
+_sqlite_scenario('get_recent_tasks', lambda queries, db: queries.get_recent_tasks(db, limit=100))
+_sqlite_scenario('get_task', lambda queries, db: queries.get_task(db, f'{_MIDDLE_SESSION}-task-005'))
+_sqlite_scenario('save_task_update', lambda queries, db: queries.save_task(
+    db,
+    task_id=f'{_MIDDLE_SESSION}-task-005',
+    session_id=_MIDDLE_SESSION,
+    task_description='Benchmark task 5',
+    llm_profile_name='benchmark',
+    task_status='completed',
+    task_result='updated result',
+))
+
+
+# ---------------------------------------------------------------------------
+# File system reads
+# ---------------------------------------------------------------------------
+
+def _file_scenario(size_mb: int):
+    @benchmark(f'file_system_read_file_{size_mb}mb', repeat=10)
+    async def setup(fixtures: Fixtures):
+        from vibe_surf.tools.file_system import CustomFileSystem
+
+        file_system = CustomFileSystem(fixtures.root / 'file_system')
+        filename = f'large_{size_mb}mb.md'
+
+        async def create():
+            rng = random.Random(SEED + size_mb)
+            line = ' '.join(f'word{rng.randrange(1000)}' for _ in range(16)) + '\n'
+            (file_system.data_dir / filename).write_text(line * (size_mb * 1024 * 1024 // len(line)),
+                                                         encoding='utf-8')
+
+        await fixtures.get(f'file_{size_mb}mb', create)
+
+        async def run():
+            content = await file_system.read_file(filename)
+            if content.startswith('Error:'):
+                raise RuntimeError(content)
+
+        return run
+
+
+for _size_mb in (1, 16):
+    _file_scenario(_size_mb)
+
+
+# ---------------------------------------------------------------------------
+# Langflow component discovery
+# ---------------------------------------------------------------------------
+
+COLD_IMPORT_SCRIPT = """
+import asyncio, time
+start = time.perf_counter()
+from vibe_surf.langflow.interface.components import import_langflow_components
+asyncio.run(import_langflow_components())
+print(time.perf_counter() - start)
+"""
+
+
+@benchmark('import_langflow_components_cold', repeat=3, warmup=0)
+async def _import_components_setup(fixtures: Fixtures):
+    async def run():
+        # A fresh interpreter each time, so nothing is already imported or cached in memory
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, '-c', COLD_IMPORT_SCRIPT,
+            cwd=str(PROJECT_ROOT),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        stdout, stderr = await process.communicate()
+        if process.returncode != 0:
+            raise RuntimeError(stderr.decode('utf-8', errors='ignore')[-2000:])
+        return float(stdout.decode().strip().splitlines()[-1])
+
+    return run
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def _summarize(samples: List[float]) -> Dict[str, Any]:
+    ordered = sorted(samples)
+    p95_index = min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))
+    return {
+        'runs': len(ordered),
+        'median_ms': round(statistics.median(ordered) * 1000, 3),
+        'p95_ms': round(ordered[p95_index] * 1000, 3),
+        'min_ms': round(ordered[0] * 1000, 3),
+        'mean_ms': round(statistics.fmean(ordered) * 1000, 3),
+    }
+
+
+async def run_scenario(scenario: Scenario, fixtures: Fixtures, repeat: Optional[int] = None) -> Dict[str, Any]:
+    samples = []
+    for iteration in range(scenario.warmup + (repeat or scenario.repeat)):
+        run = await scenario.setup(fixtures)
+        start = time.perf_counter()
+        measured = await run()
+        elapsed = time.perf_counter() - start
+        if iteration >= scenario.warmup:
+            # Subprocess scenarios report their own timing to exclude interpreter startup noise
+            samples.append(measured if isinstance(measured, float) else elapsed)
+    return _summarize(samples)
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+def compare_with_baseline(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Return a description of each scenario whose median regressed beyond the threshold."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get('results', {}).get(name)
+        if not base or 'median_ms' not in result or not base.get('median_ms'):
+            continue
+        ratio = result['median_ms'] / base['median_ms']
+        result['baseline_median_ms'] = base['median_ms']
+        result['ratio'] = round(ratio, 3)
+        if ratio > 1 + threshold:
+            regressions.append(f"{name}: {result['median_ms']:.1f} ms vs baseline {base['median_ms']:.1f} ms "
+                               f"({(ratio - 1) * 100:+.0f}%)")
+    return regressions
+
+
+async def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Offline benchmarks for VibeSurf hot paths')
+    parser.add_argument('-k', '--keyword', action='append', default=[],
+                        help='Only run scenarios whose name contains this keyword (repeatable)')
+    parser.add_argument('--list', action='store_true', help='List scenario names and exit')
+    parser.add_argument('--repeat', type=int, default=None, help='Override the number of timed runs')
+    parser.add_argument('--output', type=Path, help='Write the results as JSON to this file')
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE, help='Baseline results file')
+    parser.add_argument('--update-baseline', action='store_true', help='Store these results as the baseline')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Allowed slowdown of the median before a scenario counts as a regression')
+    parser.add_argument('--html-dir', type=Path, help='Directory of saved *.html pages to also benchmark')
+    args = parser.parse_args(argv)
+
+    _register_markdown_scenarios(args.html_dir)
+
+    selected = [s for s in SCENARIOS if not args.keyword or any(k in s.name for k in args.keyword)]
+    if args.list:
+        print('\n'.join(s.name for s in selected))
+        return 0
+
+    results: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory(prefix='vibesurf_bench_') as tmp_dir:
+        # Keep caches and settings written by the code under test out of the real workspace
+        os.environ['VIBESURF_WORKSPACE'] = tmp_dir
+        fixtures = Fixtures(Path(tmp_dir), html_dir=args.html_dir)
+        try:
+            for scenario in selected:
+                try:
+                    results[scenario.name] = await run_scenario(scenario, fixtures, args.repeat)
+                    print(f"{scenario.name:<45} median {results[scenario.name]['median_ms']:>10.2f} ms  "
+                          f"p95 {results[scenario.name]['p95_ms']:>10.2f} ms")
+                except Exception as e:
+                    results[scenario.name] = {'error': f'{type(e).__name__}: {e}'}
+                    print(f'{scenario.name:<45} failed: {type(e).__name__}: {e}')
+        finally:
+            await fixtures.close()
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': SEED,
+        },
+        'results': results,
+    }
+
+    regressions = []
+    missing_baseline = False
+    if not args.update_baseline:
+        if args.baseline.exists():
+            baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+            regressions = compare_with_baseline(results, baseline, args.threshold)
+            baseline_meta = baseline.get('meta', {})
+            report['meta']['baseline_commit'] = baseline_meta.get('commit')
+            if baseline_meta.get('platform') != report['meta']['platform']:
+                print(f"\nWarning: baseline was recorded on {baseline_meta.get('platform')}, "
+                      f"timings are not comparable with {report['meta']['platform']}")
+        else:
+            missing_baseline = True
+            print(f'\nWarning: no baseline at {args.baseline}, nothing was compared. '
+                  f'Run with --update-baseline on this machine first.')
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding='utf-8')
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2), encoding='utf-8')
+        print(f'Baseline written to {args.baseline}')
+
+    if regressions:
+        print('\nRegressions:')
+        print('\n'.join(f'  {line}' for line in regressions))
+    failed = any('error' in result for result in results.values())
+    return 1 if regressions or failed or missing_baseline else 0
+
+
+if __name__ == '__main__':
+    sys.exit(asyncio.run(main()))
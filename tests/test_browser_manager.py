@@ -0,0 +1,130 @@
+import asyncio
+import pdb
+from types import SimpleNamespace
+
+import vibe_surf.browser.browser_manager as browser_manager
+from vibe_surf.browser.browser_manager import BrowserManager, VISIBILITY_BINDING
+
+
+class _FakeDomain:
+    def __init__(self, client: '_FakeCDPClient', domain: str, register: bool):
+        self._client = client
+        self._domain = domain
+        self._register = register
+
+    def __getattr__(self, method: str):
+        name = f'{self._domain}.{method}'
+        if self._register:
+            return lambda handler: self._client.handlers.__setitem__(name, handler)
+
+        async def call(params=None, session_id=None):
+            return await self._client.handle(name, params or {}, session_id)
+
+        return call
+
+
+class _FakeCDPClient:
+    """CDP connection to a browser with a fixed set of tabs"""
+
+    targets = []
+    instances = []
+
+    def __init__(self, url: str):
+        self.handlers = {}
+        self.attached = []
+        self.register = SimpleNamespace(**{
+            domain: _FakeDomain(self, domain, register=True) for domain in ('Target', 'Runtime')
+        })
+        self.send = SimpleNamespace(**{
+            domain: _FakeDomain(self, domain, register=False) for domain in ('Target', 'Runtime', 'Page')
+        })
+        _FakeCDPClient.instances.append(self)
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+    async def handle(self, name: str, params: dict, session_id):
+        if name == 'Target.setDiscoverTargets':
+            # Chrome reports every existing target when discovery is turned on
+            for target_info in self.targets:
+                self.handlers['Target.targetCreated']({'targetInfo': target_info})
+        elif name == 'Target.getTargets':
+            return {'targetInfos': list(self.targets)}
+        elif name == 'Target.attachToTarget':
+            self.attached.append(params['targetId'])
+            return {'sessionId': f"session-{params['targetId']}-{len(self.attached)}"}
+        return {}
+
+
+def _page(target_id: str) -> dict:
+    return {'targetId': target_id, 'type': 'page', 'url': f'https://example.com/{target_id}', 'title': target_id}
+
+
+def _make_manager(monkeypatch, target_ids) -> BrowserManager:
+    _FakeCDPClient.targets = [_page(target_id) for target_id in target_ids]
+    _FakeCDPClient.instances = []
+    monkeypatch.setattr(browser_manager, 'CDPClient', _FakeCDPClient)
+    main_session = SimpleNamespace(
+        cdp_url='ws://browser',
+        _cdp_client_root=object(),
+        _is_valid_target=lambda target_info, **kwargs: target_info['type'] == 'page',
+    )
+    return BrowserManager(main_session)
+
+
+def _report(manager: BrowserManager, target_id: str, payload: str):
+    session_id = next(
+        session_id for session_id, watched in manager._visibility_sessions.items() if watched == target_id
+    )
+    manager._on_binding_called({'name': VISIBILITY_BINDING, 'payload': payload}, session_id)
+
+
+def test_existing_tabs_are_watched_once(monkeypatch):
+    """Tabs reported by both discovery and getTargets get a single visibility session"""
+    manager = _make_manager(monkeypatch, ['tab-1', 'tab-2'])
+
+    async def run():
+        assert await manager._ensure_target_tracking()
+        await asyncio.gather(*manager._tracking_tasks)
+
+    asyncio.run(run())
+
+    client = _FakeCDPClient.instances[-1]
+    assert sorted(client.attached) == ['tab-1', 'tab-2']
+    assert sorted(manager._visibility_sessions.values()) == ['tab-1', 'tab-2']
+    assert [tab.target_id for tab in asyncio.run(manager.get_all_tabs())] == ['tab-1', 'tab-2']
+
+
+def test_active_tab_follows_focus_not_last_report(monkeypatch):
+    """The active tab is the focused or switched-to tab, not whichever tab reported last"""
+    manager = _make_manager(monkeypatch, ['tab-1', 'tab-2', 'tab-3'])
+
+    async def run():
+        assert await manager._ensure_target_tracking()
+        await asyncio.gather(*manager._tracking_tasks)
+
+    asyncio.run(run())
+
+    # Initial reports: tab-1 is a background tab, tab-2 and tab-3 are front tabs of two windows
+    _report(manager, 'tab-1', 'initial:hidden')
+    _report(manager, 'tab-2', 'initial:visible')
+    _report(manager, 'tab-3', 'initial:visible')
+    assert manager._active_target_id == 'tab-2'
+
+    # The focused page wins even if it reports first
+    _report(manager, 'tab-3', 'focus:visible')
+    _report(manager, 'tab-2', 'initial:visible')
+    assert manager._active_target_id == 'tab-3'
+
+    # Switching tabs makes the newly shown tab active
+    _report(manager, 'tab-1', 'change:visible')
+    assert manager._active_target_id == 'tab-1'
+
+
+if __name__ == '__main__':
+    import pytest
+
+    pytest.main([__file__])
@@ -0,0 +1,80 @@
+import pdb
+
+from vibe_surf.browser.find_page_element import PageElementMap, SemanticExtractor, SemanticMapping
+
+
+def _entry(text: str, selector: str, element_id: str = '', label_text: str = '') -> dict:
+    return {
+        'class': '',
+        'id': element_id,
+        'selectors': selector,
+        'original_text': text,
+        'label_text': label_text,
+        'container_context': {},
+        'dom_path': '',
+    }
+
+
+def _sample_mapping() -> dict:
+    return {
+        'Emails': _entry('Emails', '#emails', element_id='emails'),
+        'Email address': _entry('Email address', 'input[name="news_email"][type="email"]'),
+        'Username': _entry('Username', 'input[name="username"][type="text"]'),
+        'Password': _entry('Password', 'input[name="password"][type="password"]'),
+        'Sign in': _entry('Sign in', '#signIn', element_id='signIn'),
+        'Submit (in Contact Form)': _entry('Submit', 'button[data-testid="contact-submit"]'),
+        'Submit (in Newsletter)': _entry('Submit', 'button[data-testid="news-submit"]'),
+        'firstName': _entry('firstName', 'input[name="first_name"]'),
+        'Search flights': _entry('Search flights', 'button.search'),
+    }
+
+
+def test_name_attribute_lookup():
+    """Name attributes are found through the index like in a plain mapping"""
+    extractor = SemanticExtractor()
+    mapping = _sample_mapping()
+
+    element = extractor.find_element_by_text(SemanticMapping(mapping), 'username')
+    assert element is not None
+    assert element['selectors'] == 'input[name="username"][type="text"]'
+    assert extractor.find_element_by_text(SemanticMapping(mapping), 'signIn')['selectors'] == '#signIn'
+
+
+def test_indexed_lookup_matches_full_scan():
+    """SemanticMapping lookups return what scanning the plain mapping returns"""
+    extractor = SemanticExtractor()
+    mapping = _sample_mapping()
+    indexed = SemanticMapping(mapping)
+
+    targets = [
+        'email', 'Email address', 'emails', 'username', 'user', 'pass', 'sign', 'Sign in now',
+        'Submit (in Newsletter)', 'Submit (Contact)', 'first name', 'firstName', 'flights',
+        'search', 'nothing like this', 'news_email', 'first_name',
+    ]
+    for target in targets:
+        assert extractor.find_element_by_text(indexed, target) == extractor.find_element_by_text(mapping, target), target
+
+    assert extractor.find_element_by_text(indexed, 'email')['selectors'] == '#emails'
+
+
+def test_partial_rescan_keeps_document_order():
+    """Elements added by a partial rescan take their document position"""
+    page_map = PageElementMap()
+    page_map.apply_changes({
+        'doc_id': 'doc', 'version': 1, 'reset': True,
+        'upserts': [{'vs_id': 1}, {'vs_id': 2}, {'vs_id': 3}], 'removed': [],
+    })
+    page_map.apply_changes({
+        'doc_id': 'doc', 'version': 2, 'reset': False,
+        'upserts': [{'vs_id': 4}, {'vs_id': 2, 'changed': True}], 'removed': [3],
+        'order': [1, 4, 2],
+    })
+
+    assert list(page_map.elements) == [1, 4, 2]
+    assert page_map.elements[2] == {'vs_id': 2, 'changed': True}
+
+
+if __name__ == '__main__':
+    test_name_attribute_lookup()
+    test_indexed_lookup_matches_full_scan()
+    test_partial_rescan_keeps_document_order()
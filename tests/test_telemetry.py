@@ -1,7 +1,8 @@
 import pdb
+import uuid
 
 import vibe_surf
-from vibe_surf.telemetry.service import ProductTelemetry
+from vibe_surf.telemetry.service import ProductTelemetry, LocalTelemetrySink
 from vibe_surf.telemetry.views import CLITelemetryEvent
 
 
@@ -26,5 +27,27 @@ def test_cli_telemetry_event():
     telemetry.flush()
 
 
+def test_buffered_telemetry_local_sink():
+    """Test that captured events are delivered in the background to a local sink."""
+    telemetry = ProductTelemetry()
+    # The service is a singleton: deliver what earlier tests buffered and stop their worker first
+    telemetry.shutdown()
+    sink = LocalTelemetrySink()
+    telemetry.set_sink(sink)
+
+    mode = f'test-{uuid.uuid4()}'
+    for action in ('start', 'startup_completed', 'interrupted'):
+        telemetry.capture(CLITelemetryEvent(
+            version=str(vibe_surf.__version__),
+            action=action,
+            mode=mode,
+        ))
+
+    telemetry.shutdown()
+    actions = [event['properties']['action'] for event in sink.events if event['properties'].get('mode') == mode]
+    assert actions == ['start', 'startup_completed', 'interrupted']
+
+
 if __name__ == '__main__':
     test_cli_telemetry_event()
+    test_buffered_telemetry_local_sink()
@@ -74,11 +74,89 @@ from browser_use.utils import (
 )
 from browser_use.llm.messages import BaseMessage, ContentPartImageParam, ContentPartTextParam, UserMessage
 from browser_use.agent.service import Agent, AgentHookFunc
+from vibe_surf.llm.token_cost import RunningTokenCost
 from vibe_surf.tools.file_system import CustomFileSystem
 from vibe_surf.telemetry.service import ProductTelemetry
+from vibe_surf.telemetry.metrics import metrics_agent, timed_phase
+from vibe_surf.browser.page_scripts import PersistentPageScript
 
 Context = TypeVar('Context')
 
+# Edge glow shown on pages an agent is working on. It is registered once per
+# target and re-applied by the browser after every navigation.
+GLOW_OVERLAY_SCRIPT = """
+(function() {
+    // Registered scripts also run in every iframe; only the top document gets the glow
+    if (window !== window.top) {
+        return;
+    }
+    if (window.__vibesurfGlow) {
+        window.__vibesurfGlow.show();
+        return;
+    }
+
+    const css = `
+        .browser-edge-glow {
+            position: fixed;
+            top: 0;
+            left: 0;
+            right: 0;
+            bottom: 0;
+            pointer-events: none;
+            z-index: 2147483647;
+            box-shadow: 
+                inset 0 0 50px rgba(0, 191, 255, 0.6),
+                inset 0 0 100px rgba(0, 191, 255, 0.4),
+                inset 0 0 200px rgba(0, 191, 255, 0.2);
+            animation: edge-glow-pulse 3s ease-in-out infinite;
+        }
+
+        @keyframes edge-glow-pulse {
+            0%, 100% { 
+                box-shadow: 
+                    inset 0 0 30px rgba(0, 191, 255, 0.3),
+                    inset 0 0 60px rgba(0, 191, 255, 0.2),
+                    inset 0 0 120px rgba(0, 191, 255, 0.1);
+            }
+            50% { 
+                box-shadow: 
+                    inset 0 0 80px rgba(0, 191, 255, 0.8),
+                    inset 0 0 160px rgba(0, 191, 255, 0.6),
+                    inset 0 0 320px rgba(0, 191, 255, 0.3);
+            }
+        }
+    `;
+
+    function show() {
+        if (!document.body) {
+            document.addEventListener('DOMContentLoaded', show, { once: true });
+            return;
+        }
+        if (document.querySelector('.browser-edge-glow')) {
+            return;
+        }
+
+        const style = document.createElement('style');
+        style.className = 'browser-edge-glow-style';
+        style.textContent = css;
+        (document.head || document.documentElement).appendChild(style);
+
+        const glowDiv = document.createElement('div');
+        glowDiv.className = 'browser-edge-glow';
+        document.body.appendChild(glowDiv);
+    }
+
+    function hide() {
+        document.querySelectorAll('.browser-edge-glow, .browser-edge-glow-style').forEach(el => el.remove());
+    }
+
+    window.__vibesurfGlow = { show: show, hide: hide };
+    show();
+})();
+"""
+
+GLOW_OVERLAY_TEARDOWN = "window.__vibesurfGlow && window.__vibesurfGlow.hide()"
+
 
 class BrowserUseAgent(Agent):
     @time_execution_sync('--init')
@@ -211,7 +289,7 @@ class BrowserUseAgent(Agent):
 
         # Token cost service
         if token_cost_service is None:
-            self.token_cost_service = TokenCost(include_cost=calculate_cost)
+            self.token_cost_service = RunningTokenCost(include_cost=calculate_cost)
         else:
             self.token_cost_service = token_cost_service
         self.token_cost_service.register_llm(llm)
@@ -400,6 +478,8 @@ class BrowserUseAgent(Agent):
         self._external_pause_event = asyncio.Event()
         self._external_pause_event.set()
 
+        self._glow_overlay = PersistentPageScript(GLOW_OVERLAY_SCRIPT, teardown=GLOW_OVERLAY_TEARDOWN)
+
     def _set_file_system(self, file_system_path: str | None = None) -> None:
         # Check for conflicting parameters
         if self.state.file_system_state and file_system_path:
@@ -460,22 +540,23 @@ class BrowserUseAgent(Agent):
         if not self.state.last_result:
             return
 
-        if browser_state_summary:
-            metadata = StepMetadata(
-                step_number=self.state.n_steps,
-                step_start_time=self.step_start_time,
-                step_end_time=step_end_time,
-            )
+        with timed_phase('persistence'):
+            if browser_state_summary:
+                metadata = StepMetadata(
+                    step_number=self.state.n_steps,
+                    step_start_time=self.step_start_time,
+                    step_end_time=step_end_time,
+                )
 
-            # Use _make_history_item like main branch
-            await self._make_history_item(self.state.last_model_output, browser_state_summary, self.state.last_result,
-                                          metadata, state_message=self._message_manager.last_state_message_text,)
+                # Use _make_history_item like main branch
+                await self._make_history_item(self.state.last_model_output, browser_state_summary, self.state.last_result,
+                                              metadata, state_message=self._message_manager.last_state_message_text,)
 
-        # Log step completion summary
-        self._log_step_completion_summary(self.step_start_time, self.state.last_result)
+            # Log step completion summary
+            self._log_step_completion_summary(self.step_start_time, self.state.last_result)
 
-        # Save file system state after step completion
-        self.save_file_system_state()
+            # Save file system state after step completion
+            self.save_file_system_state()
 
         # Emit both step created and executed events
         if browser_state_summary and self.state.last_model_output:
@@ -489,6 +570,18 @@ class BrowserUseAgent(Agent):
         # Increment step counter after step is fully completed
         self.state.n_steps += 1
 
+    async def step(self, step_info: AgentStepInfo | None = None) -> None:
+        with metrics_agent('browser_use_agent'), timed_phase('step'):
+            await super().step(step_info)
+
+    async def _prepare_context(self, step_info: AgentStepInfo | None = None) -> BrowserStateSummary:
+        with timed_phase('context_build'):
+            return await super()._prepare_context(step_info)
+
+    async def get_model_output(self, input_messages: list[BaseMessage]) -> AgentOutput:
+        with timed_phase('llm_call'):
+            return await super().get_model_output(input_messages)
+
     @observe_debug(ignore_input=True, ignore_output=True)
     @time_execution_async('--multi_act')
     async def multi_act(self, actions: list[ActionModel]) -> list[ActionResult]:
@@ -537,14 +630,15 @@ class BrowserUseAgent(Agent):
 
                 time_start = time.time()
 
-                result = await self.tools.act(
-                    action=action,
-                    browser_session=self.browser_session,
-                    file_system=self.file_system,
-                    page_extraction_llm=self.settings.page_extraction_llm,
-                    sensitive_data=self.sensitive_data,
-                    available_file_paths=self.available_file_paths,
-                )
+                with timed_phase('action'):
+                    result = await self.tools.act(
+                        action=action,
+                        browser_session=self.browser_session,
+                        file_system=self.file_system,
+                        page_extraction_llm=self.settings.page_extraction_llm,
+                        sensitive_data=self.sensitive_data,
+                        available_file_paths=self.available_file_paths,
+                    )
                 await self.add_glow_effect()
                 time_end = time.time()
                 time_elapsed = time_end - time_start
@@ -572,92 +666,20 @@ class BrowserUseAgent(Agent):
         self.state.follow_up_task = True
 
     async def add_glow_effect(self):
+        """Show the edge glow on the focused tab; only talks to the browser the first time per tab"""
         try:
-            glow_effect_js = """
-            (function() {
-                const existingGlow = document.querySelector('.browser-edge-glow');
-                if (existingGlow) {
-                    return { created: true };
-                }
-
-                const style = document.createElement('style');
-                style.textContent = `
-                    .browser-edge-glow {
-                        position: fixed;
-                        top: 0;
-                        left: 0;
-                        right: 0;
-                        bottom: 0;
-                        pointer-events: none;
-                        z-index: 2147483647;
-                        box-shadow: 
-                            inset 0 0 50px rgba(0, 191, 255, 0.6),
-                            inset 0 0 100px rgba(0, 191, 255, 0.4),
-                            inset 0 0 200px rgba(0, 191, 255, 0.2);
-                        animation: edge-glow-pulse 3s ease-in-out infinite;
-                    }
-
-                    @keyframes edge-glow-pulse {
-                        0%, 100% { 
-                            box-shadow: 
-                                inset 0 0 30px rgba(0, 191, 255, 0.3),
-                                inset 0 0 60px rgba(0, 191, 255, 0.2),
-                                inset 0 0 120px rgba(0, 191, 255, 0.1);
-                        }
-                        50% { 
-                            box-shadow: 
-                                inset 0 0 80px rgba(0, 191, 255, 0.8),
-                                inset 0 0 160px rgba(0, 191, 255, 0.6),
-                                inset 0 0 320px rgba(0, 191, 255, 0.3);
-                        }
-                    }
-                `;
-
-                document.head.appendChild(style);
-
-                const glowDiv = document.createElement('div');
-                glowDiv.className = 'browser-edge-glow';
-                document.body.appendChild(glowDiv);
-
-                return { created: true };
-            })();
-            """
-
             cdp_session = await self.browser_session.get_or_create_cdp_session()
-            result = await cdp_session.cdp_client.send.Runtime.evaluate(
-                params={'expression': glow_effect_js, 'returnByValue': True},
-                session_id=cdp_session.session_id,
-            )
-            return result
+            await self._glow_overlay.install(cdp_session)
         except Exception as e:
             logging.debug(str(e))
 
     async def remove_glow_effect(self):
-        try:
-            self.logger.info("Remove Glow Effect")
-            remove_effect_js = """
-            (function removeGlow() {
-                document.querySelectorAll('.browser-edge-glow').forEach(el => el.remove());
-                document.querySelectorAll('style').forEach(style => {
-                    if (style.textContent.includes('browser-edge-glow')) {
-                        style.remove();
-                    }
-                });
-            })();
-            """
-
-            cdp_session = await self.browser_session.get_or_create_cdp_session()
-            result = await cdp_session.cdp_client.send.Runtime.evaluate(
-                params={'expression': remove_effect_js, 'returnByValue': True},
-                session_id=cdp_session.session_id,
-            )
-            for cdp_session in self.browser_session._cdp_session_pool.values():
-                result = await cdp_session.cdp_client.send.Runtime.evaluate(
-                    params={'expression': remove_effect_js, 'returnByValue': True},
-                    session_id=cdp_session.session_id,
-                )
-        except Exception as e:
-            logging.debug(str(e))
+        self.logger.info("Remove Glow Effect")
+        for cdp_session in list(self.browser_session._cdp_session_pool.values()):
+            try:
+                await self._glow_overlay.uninstall(cdp_session)
+            except Exception as e:
+                logging.debug(str(e))
 
     @observe(name='agent.run', metadata={'task': '{{task}}', 'debug': '{{debug}}'})
     @time_execution_async('--run')
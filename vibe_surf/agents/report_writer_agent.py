@@ -17,6 +17,7 @@ from vibe_surf.tools.file_system import CustomFileSystem
 from vibe_surf.tools.report_writer_tools import ReportWriterTools
 from vibe_surf.agents.views import CustomAgentOutput
 from vibe_surf.telemetry.service import ProductTelemetry
+from vibe_surf.telemetry.metrics import timed_phase
 from vibe_surf.telemetry.views import ReportWriterTelemetryEvent
 
 from vibe_surf.logger import get_logger
@@ -201,7 +202,8 @@ Please analyze the task, determine if you need to read any additional files, the
                 logger.info(f"🔄 LLM iteration {iteration}")
                 self.message_history.append(UserMessage(content=f"Current step: {iteration} / {max_iterations}"))
                 # Get LLM response
-                response = await self.llm.ainvoke(self.message_history, output_format=self.AgentOutput)
+                with timed_phase("llm_call", agent="report_writer_agent"):
+                    response = await self.llm.ainvoke(self.message_history, output_format=self.AgentOutput)
                 parsed = response.completion
                 action = parsed.action
 
@@ -222,11 +224,12 @@ Please analyze the task, determine if you need to read any additional files, the
                 action_name = next(iter(action_data.keys())) if action_data else 'unknown'
                 logger.info(f"🛠️ Executing action: {action_name}")
 
-                result = await self.tools.act(
-                    action=action,
-                    file_system=self.file_system,
-                    llm=self.llm,
-                )
+                with timed_phase("action", agent="report_writer_agent"):
+                    result = await self.tools.act(
+                        action=action,
+                        file_system=self.file_system,
+                        llm=self.llm,
+                    )
 
                 time_end = time.time()
                 time_elapsed = time_end - time_start
@@ -294,7 +297,6 @@ Please analyze the task, determine if you need to read any additional files, the
                     report_type='html'
                 )
                 self.telemetry.capture(completion_event)
-                self.telemetry.flush()
                 
                 return ReportTaskResult(
                     success=True,
@@ -334,7 +336,6 @@ Please analyze the task, determine if you need to read any additional files, the
                 report_type='html'
             )
             self.telemetry.capture(error_event)
-            self.telemetry.flush()
             
             # Generate a simple fallback report
             fallback_path = await self._generate_fallback_report(report_data)
@@ -25,9 +25,9 @@ from browser_use.browser.session import BrowserSession
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.messages import UserMessage, SystemMessage, BaseMessage, AssistantMessage
 from browser_use.browser.views import TabInfo
-from browser_use.tokens.service import TokenCost
 
 from vibe_surf.agents.browser_use_agent import BrowserUseAgent
+from vibe_surf.llm.token_cost import RunningTokenCost
 from vibe_surf.agents.report_writer_agent import ReportWriterAgent, ReportTaskResult
 from vibe_surf.agents.views import CustomAgentOutput
 from vibe_surf.utils import check_latest_vibesurf_version, get_vibesurf_version
@@ -40,9 +40,11 @@ from vibe_surf.browser.browser_manager import BrowserManager
 from vibe_surf.tools.browser_use_tools import BrowserUseTools
 from vibe_surf.tools.vibesurf_tools import VibeSurfTools
 from vibe_surf.tools.file_system import CustomFileSystem
+from vibe_surf.tools.blob_store import get_blob_store
 from vibe_surf.agents.views import VibeSurfAgentSettings
 
 from vibe_surf.telemetry.service import ProductTelemetry
+from vibe_surf.telemetry.metrics import metrics_agent, timed_phase
 from vibe_surf.telemetry.views import (
     VibeSurfAgentTelemetryEvent,
     VibeSurfAgentParsedOutputEvent,
@@ -231,9 +233,8 @@ def process_agent_msg_file_links(agent_msg: str, agent_name: str, base_dir: Path
 
 async def log_agent_activity(state: VibeSurfState, agent_name: str, agent_status: str, agent_msg: str) -> None:
     """Log agent activity to the activity log"""
-    token_summary = await state.vibesurf_agent.token_cost_service.get_usage_summary()
-    token_summary_md = token_summary.model_dump_json(indent=2, exclude_none=True, exclude_unset=True)
-    logger.debug(token_summary_md)
+    # Running totals, kept up to date as responses come in
+    token_cost_service = state.vibesurf_agent.token_cost_service
 
     # Process file links in agent_msg to convert relative paths to absolute paths
     base_dir = state.vibesurf_agent.file_system.get_dir()
@@ -244,8 +245,8 @@ async def log_agent_activity(state: VibeSurfState, agent_name: str, agent_status
         "agent_status": agent_status,  # working, result, error
         "agent_msg": processed_agent_msg,
         "timestamp": datetime.now().isoformat(),
-        "total_tokens": token_summary.total_tokens,
-        "total_cost": token_summary.total_cost
+        "total_tokens": token_cost_service.total_tokens,
+        "total_cost": token_cost_service.total_cost
     }
     state.vibesurf_agent.activity_logs.append(activity_entry)
     logger.debug(f"📝 Logged activity: {agent_name} - {agent_status}:\n{processed_agent_msg}")
@@ -389,24 +390,11 @@ async def vibesurf_agent_node(state: VibeSurfState) -> VibeSurfState:
     return await control_aware_node(_vibesurf_agent_node_impl, state, "vibesurf_agent")
 
 
-async def _vibesurf_agent_node_impl(state: VibeSurfState) -> VibeSurfState:
-    """Implementation using thinking + action pattern similar to report_writer_agent"""
-
-    agent_name = "vibesurf_agent"
-
-    # Create action model and agent output using VibeSurfTools
-    vibesurf_agent = state.vibesurf_agent
-
-    vibesurf_action_names = vibesurf_agent.tools.get_all_action_names(exclude_actions=['mcp.', 'cpo.', 'get_browser_state'])
-    ActionModel = vibesurf_agent.tools.registry.create_action_model(include_actions=vibesurf_action_names)
-    if vibesurf_agent.settings.agent_mode == "thinking":
-        AgentOutput = CustomAgentOutput.type_with_custom_actions(ActionModel)
-    else:
-        AgentOutput = CustomAgentOutput.type_with_custom_actions_no_thinking(ActionModel)
-
+async def _build_vibesurf_context(state: VibeSurfState) -> str:
+    """Format the browser and previous results context for the next VibeSurf agent step"""
     # Get current browser context
-    browser_tabs = await vibesurf_agent.browser_manager.main_browser_session.get_tabs()
-    active_browser_tab = await vibesurf_agent.browser_manager.get_activate_tab()
+    browser_tabs = await state.vibesurf_agent.browser_manager.get_all_tabs()
+    active_browser_tab = await state.vibesurf_agent.browser_manager.get_activate_tab()
 
     # Format context information
     context_info = []
@@ -433,13 +421,40 @@ async def _vibesurf_agent_node_impl(state: VibeSurfState) -> VibeSurfState:
             context_info.append(f"Generated Report: ❌ Failed - {state.generated_report_result.msg}\nPath: {state.generated_report_result.report_path}\n")
 
     context_str = "\n".join(context_info) if context_info else "No additional context available."
+    return context_str
+
+
+async def _vibesurf_agent_node_impl(state: VibeSurfState) -> VibeSurfState:
+    """Implementation using thinking + action pattern similar to report_writer_agent"""
+
+    agent_name = "vibesurf_agent"
+    with metrics_agent(agent_name), timed_phase("step"):
+        return await _vibesurf_agent_step(state, agent_name)
+
+
+async def _vibesurf_agent_step(state: VibeSurfState, agent_name: str) -> VibeSurfState:
+    """One thinking + action step of the VibeSurf agent"""
+
+    # Create action model and agent output using VibeSurfTools
+    vibesurf_agent = state.vibesurf_agent
+
+    vibesurf_action_names = vibesurf_agent.tools.get_all_action_names(exclude_actions=['mcp.', 'cpo.', 'get_browser_state'])
+    ActionModel = vibesurf_agent.tools.registry.create_action_model(include_actions=vibesurf_action_names)
+    if vibesurf_agent.settings.agent_mode == "thinking":
+        AgentOutput = CustomAgentOutput.type_with_custom_actions(ActionModel)
+    else:
+        AgentOutput = CustomAgentOutput.type_with_custom_actions_no_thinking(ActionModel)
+
+    with timed_phase("context_build"):
+        context_str = await _build_vibesurf_context(state)
     logger.debug("VibeSurf State Message:\n")
     logger.debug(context_str)
     vibesurf_agent.message_history.append(UserMessage(content=context_str))
 
     try:
         # Get LLM response with action output format
-        response = await vibesurf_agent.llm.ainvoke(vibesurf_agent.message_history, output_format=AgentOutput)
+        with timed_phase("llm_call"):
+            response = await vibesurf_agent.llm.ainvoke(vibesurf_agent.message_history, output_format=AgentOutput)
         parsed = response.completion
         action = parsed.action
         vibesurf_agent.message_history.append(
@@ -462,7 +477,6 @@ async def _vibesurf_agent_node_impl(state: VibeSurfState) -> VibeSurfState:
             session_id=state.session_id,
         )
         vibesurf_agent.telemetry.capture(parsed_output_event)
-        vibesurf_agent.telemetry.flush()
 
         # Log thinking if present
         if hasattr(parsed, 'thinking') and parsed.thinking:
@@ -539,12 +553,13 @@ async def _vibesurf_agent_node_impl(state: VibeSurfState) -> VibeSurfState:
                 logger.debug(action_msg)
                 await log_agent_activity(state, agent_name, "working", action_msg)
 
-            result = await vibesurf_agent.tools.act(
-                action=action,
-                browser_manager=vibesurf_agent.browser_manager,
-                llm=vibesurf_agent.llm,
-                file_system=vibesurf_agent.file_system,
-            )
+            with timed_phase("action"):
+                result = await vibesurf_agent.tools.act(
+                    action=action,
+                    browser_manager=vibesurf_agent.browser_manager,
+                    llm=vibesurf_agent.llm,
+                    file_system=vibesurf_agent.file_system,
+                )
 
             state.current_step = "vibesurf_agent"
             state.current_action = 'vibesurf_action'
@@ -577,7 +592,6 @@ async def _vibesurf_agent_node_impl(state: VibeSurfState) -> VibeSurfState:
             function_name='_vibesurf_agent_node_impl'
         )
         vibesurf_agent.telemetry.capture(exception_event)
-        vibesurf_agent.telemetry.flush()
 
         state.final_response = f"Task execution failed: {str(e)}"
         state.is_complete = True
@@ -658,6 +672,7 @@ async def execute_parallel_browser_tasks(state: VibeSurfState) -> List[BrowserTa
     register_sessions = []
     task_id = nanoid.generate(size=5)
     bu_agents_workdir = state.vibesurf_agent.file_system.get_dir() / "bu_agents"
+    blob_store = get_blob_store(state.vibesurf_agent.workspace_dir)
     bu_agents_workdir.mkdir(parents=True, exist_ok=True)
 
     for i, task_info in enumerate(pending_tasks):
@@ -700,9 +715,9 @@ async def execute_parallel_browser_tasks(state: VibeSurfState) -> List[BrowserTa
                     upload_workdir.mkdir(parents=True, exist_ok=True)
                     task_file_path = state.vibesurf_agent.file_system.get_absolute_path(task_file)
                     if os.path.exists(task_file_path):
-                        logger.info(f"Copy {task_file_path} to {upload_workdir}")
-                        shutil.copy(task_file_path, str(upload_workdir))
-                        available_file_paths.append(os.path.join("upload_files", os.path.basename(task_file_path)))
+                        logger.info(f"Share {task_file_path} to {upload_workdir}")
+                        shared_file_path = await blob_store.share_file(task_file_path, upload_workdir)
+                        available_file_paths.append(os.path.join("upload_files", os.path.basename(shared_file_path)))
 
             # Create BrowserUseAgent for each task
             if available_file_paths:
@@ -810,6 +825,7 @@ async def execute_single_browser_tasks(state: VibeSurfState) -> BrowserTaskResul
     task_info = state.browser_tasks[0]
     task_id = nanoid.generate(size=5)
     bu_agents_workdir = state.vibesurf_agent.file_system.get_dir() / "bu_agents"
+    blob_store = get_blob_store(state.vibesurf_agent.workspace_dir)
     bu_agents_workdir.mkdir(parents=True, exist_ok=True)
     task_description = task_info.get('task', '')
     if not task_description:
@@ -844,9 +860,9 @@ async def execute_single_browser_tasks(state: VibeSurfState) -> BrowserTaskResul
                 upload_workdir.mkdir(parents=True, exist_ok=True)
                 task_file_path = state.vibesurf_agent.file_system.get_absolute_path(task_file)
                 if os.path.exists(task_file_path):
-                    logger.info(f"Copy {task_file_path} to {upload_workdir}")
-                    shutil.copy(task_file_path, str(upload_workdir))
-                    available_file_paths.append(os.path.join("upload_files", os.path.basename(task_file_path)))
+                    logger.info(f"Share {task_file_path} to {upload_workdir}")
+                    shared_file_path = await blob_store.share_file(task_file_path, upload_workdir)
+                    available_file_paths.append(os.path.join("upload_files", os.path.basename(shared_file_path)))
 
         # Create BrowserUseAgent for each task
         if available_file_paths:
@@ -1110,7 +1126,7 @@ class VibeSurfAgent:
         """Initialize VibeSurfAgent with required components"""
         self.llm: BaseChatModel = llm
         self.settings = settings or VibeSurfAgentSettings()
-        self.token_cost_service = TokenCost(include_cost=self.settings.calculate_cost)
+        self.token_cost_service = RunningTokenCost(include_cost=self.settings.calculate_cost)
         self.token_cost_service.register_llm(llm)
         self.browser_manager: BrowserManager = browser_manager
         self.tools: VibeSurfTools = tools
@@ -1794,7 +1810,6 @@ Please continue with your assigned work, incorporating this guidance only if it'
                 session_id=session_id
             )
             self.telemetry.capture(completion_event)
-            self.telemetry.flush()
             
             return result
 
@@ -1829,7 +1844,6 @@ Please continue with your assigned work, incorporating this guidance only if it'
                 session_id=session_id
             )
             self.telemetry.capture(error_event)
-            self.telemetry.flush()
             
             # Add error activity log
             if self.activity_logs:
@@ -1850,8 +1864,9 @@ Please continue with your assigned work, incorporating this guidance only if it'
             self.activity_logs.append(activity_entry)
             # Save session-specific data
             if self.cur_session_id:
-                self.save_message_history(self.cur_session_id)
-                self.save_activity_logs(self.cur_session_id)
+                with timed_phase("persistence", agent="vibesurf_agent"):
+                    self.save_message_history(self.cur_session_id)
+                    self.save_activity_logs(self.cur_session_id)
             async with self._control_lock:
                 self._current_state = None
                 self._execution_task = None
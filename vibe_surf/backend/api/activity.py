@@ -10,7 +10,7 @@ from typing import List, Optional
 import logging
 from datetime import datetime
 
-from ..database import get_db_session
+from ..database import get_db_read_session
 from ..database.queries import TaskQueries
 from .models import ActivityQueryRequest, SessionActivityQueryRequest
 
@@ -25,7 +25,7 @@ router = APIRouter(prefix="/activity", tags=["activity"])
 @router.get("/tasks")
 async def get_recent_tasks(
     limit: int = -1,
-    db: AsyncSession = Depends(get_db_session)
+    db: AsyncSession = Depends(get_db_read_session)
 ):
     """Get recent tasks across all sessions"""
     try:
@@ -62,21 +62,27 @@ async def get_recent_tasks(
 async def get_all_sessions(
     limit: int = -1,
     offset: int = 0,
-    db: AsyncSession = Depends(get_db_session)
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db_read_session)
 ):
-    """Get all sessions with task counts and metadata"""
+    """Get all sessions with task counts and metadata
+
+    Pass the returned `next_cursor` as `cursor` to fetch the following page.
+    """
     try:
         # Handle -1 as "get all" and validate other values
         if limit != -1 and (limit < 1 or limit > 1000):
             limit = -1
             
-        sessions = await TaskQueries.get_all_sessions(db, limit, offset)
+        sessions = await TaskQueries.get_all_sessions(db, limit, offset, cursor)
+        next_cursor = sessions[-1]["cursor"] if sessions and limit != -1 and len(sessions) == limit else None
         
         return {
             "sessions": sessions,
             "total_count": len(sessions),
             "limit": limit,
-            "offset": offset
+            "offset": offset,
+            "next_cursor": next_cursor
         }
     except Exception as e:
         logger.error(f"Failed to get all sessions: {e}")
@@ -85,7 +91,7 @@ async def get_all_sessions(
 @router.get("/sessions/{session_id}/tasks")
 async def get_session_tasks(
     session_id: str,
-    db: AsyncSession = Depends(get_db_session)
+    db: AsyncSession = Depends(get_db_read_session)
 ):
     """Get all tasks for a session from database"""
     try:
@@ -119,7 +125,7 @@ async def get_session_tasks(
 @router.get("/{task_id}")
 async def get_task_info(
     task_id: str,
-    db: AsyncSession = Depends(get_db_session)
+    db: AsyncSession = Depends(get_db_read_session)
 ):
     """Get task information and result from database"""
     try:
@@ -149,6 +155,31 @@ async def get_task_info(
         logger.error(f"Failed to get task info for {task_id}: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to get task info: {str(e)}")
 
+@router.get("/{task_id}/timings")
+async def get_task_timings(
+    task_id: str,
+    db: AsyncSession = Depends(get_db_read_session)
+):
+    """Get the per-phase timing summary of a running or finished task"""
+    try:
+        from vibe_surf.telemetry.metrics import get_task_timings as get_recorded_task_timings
+
+        timing_summary = get_recorded_task_timings(task_id)
+        if timing_summary is None:
+            task = await TaskQueries.get_task(db, task_id)
+            if not task:
+                raise HTTPException(status_code=404, detail="Task not found")
+            timing_summary = (task.task_metadata or {}).get("timing_summary")
+        if timing_summary is None:
+            raise HTTPException(status_code=404, detail="No timings recorded for this task")
+
+        return timing_summary
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to get task timings for {task_id}: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to get task timings: {str(e)}")
+
 # Real-time VibeSurf Agent Activity Log Endpoints
 
 @router.get("/sessions/{session_id}/activity")
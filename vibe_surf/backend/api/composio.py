@@ -198,6 +198,8 @@ async def _get_composio_instance():
     """Get or create Composio instance from shared state"""
     try:
         from .. import shared_state
+        # Startup may still be creating the instance
+        await shared_state.wait_for_components("composio")
         if shared_state.composio_instance is None:
             # Try to get API key from database first
             api_key = await _get_composio_api_key_from_db()
@@ -215,6 +217,7 @@ async def _get_composio_instance():
                 provider=LangchainProvider()
             )
             logger.info("✅ Composio instance created successfully")
+            shared_state.bump_composio_toolkit_revision()
 
         return shared_state.composio_instance
     except Exception as e:
@@ -322,6 +325,7 @@ async def get_composio_status(
 
                 # Store valid instance
                 shared_state.composio_instance = temp_composio
+                shared_state.bump_composio_toolkit_revision()
 
                 logger.info("✅ Composio instance recreated from stored API key")
                 return {
@@ -336,6 +340,7 @@ async def get_composio_status(
                 logger.warning(f"Stored API key validation failed: {e}")
                 # Clear invalid stored key
                 shared_state.composio_instance = None
+                shared_state.bump_composio_toolkit_revision()
                 return {
                     "connected": False,
                     "key_valid": False,
@@ -398,6 +403,7 @@ async def verify_composio_api_key(
 
             # Update shared state with new Composio instance
             shared_state.composio_instance = temp_composio
+            shared_state.bump_composio_toolkit_revision()
             await add_or_update_composio_apikey(request.api_key)
             return ComposioKeyVerifyResponse(
                 valid=True,
@@ -698,6 +704,8 @@ async def toggle_composio_toolkit(
             )
 
         await db.commit()
+        from .. import shared_state
+        shared_state.bump_composio_toolkit_revision()
 
         message = f"Toolkit '{toolkit.name}' {'enabled' if request.enabled else 'disabled'} successfully"
         requires_oauth = auth_url is not None
@@ -798,6 +806,8 @@ async def get_toolkit_tools(
                 )
                 if success:
                     await db.commit()
+                    from .. import shared_state
+                    shared_state.bump_composio_toolkit_revision()
                 else:
                     logger.warning(f"Failed to save tools to database for toolkit {slug}")
             except Exception as e:
@@ -891,6 +901,8 @@ async def update_toolkit_tools(
             )
 
         await db.commit()
+        from .. import shared_state
+        shared_state.bump_composio_toolkit_revision()
         logger.info(f"✅ Database commit successful for {slug}")
 
         # Get updated tools count
@@ -10,7 +10,7 @@ from fastapi.responses import FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional, Dict, Any
 import os
-import shutil
+import asyncio
 import logging
 from datetime import datetime
 from uuid_extensions import uuid7str
@@ -21,6 +21,7 @@ from ..database import get_db_session
 from ..database.queries import UploadedFileQueries
 from .models import FileListQueryRequest, SessionFilesQueryRequest
 
+from vibe_surf.tools.blob_store import get_blob_store, remove_link
 from vibe_surf.logger import get_logger
 
 logger = get_logger(__name__)
@@ -65,6 +66,7 @@ async def upload_files(
         from ..shared_state import workspace_dir
 
         upload_dir = get_upload_directory(session_id)
+        blob_store = get_blob_store(workspace_dir)
         uploaded_file_info = []
 
         for file in files:
@@ -76,28 +78,20 @@ async def upload_files(
 
             # Create safe filename
             filename = file.filename
-            file_path = os.path.join(upload_dir, filename)
-
-            # Handle duplicate filenames by adding suffix
-            counter = 1
-            base_name, ext = os.path.splitext(filename)
-            while os.path.exists(file_path):
-                new_filename = f"{base_name}_{counter}{ext}"
-                file_path = os.path.join(upload_dir, new_filename)
-                filename = new_filename
-                counter += 1
 
             # Ensure path is safe
-            if not is_safe_path(upload_dir, file_path):
+            if not is_safe_path(upload_dir, os.path.join(upload_dir, filename)):
                 raise HTTPException(status_code=400, detail=f"Invalid file path: {filename}")
 
             # Save file
             try:
-                with open(file_path, "wb") as buffer:
-                    shutil.copyfileobj(file.file, buffer)
+                # Stream into the blob store, then link it into the upload folder.
+                # Identical content is stored once; a taken name still gets a _N suffix.
+                digest, file_size = await blob_store.put_stream(file)
+                file_path = await blob_store.link_into(digest, upload_dir, filename, reuse_existing=False)
+                filename = os.path.basename(file_path)
 
                 # Get file info
-                file_size = os.path.getsize(file_path)
                 mime_type, _ = mimetypes.guess_type(file_path)
                 relative_path = os.path.relpath(file_path, workspace_dir)
 
@@ -260,9 +254,12 @@ async def delete_file(file_id: str, db: AsyncSession = Depends(get_db_session)):
         raise HTTPException(status_code=404, detail="File not found")
 
     try:
-        # Remove file from disk
+        from ..shared_state import workspace_dir
+
+        # Remove file from disk, and its stored content if nothing else links to it
         if os.path.exists(uploaded_file.file_path):
-            os.remove(uploaded_file.file_path)
+            remove_link(uploaded_file.file_path)
+            await asyncio.to_thread(get_blob_store(workspace_dir).collect_garbage)
 
         # Soft delete from database
         success = await UploadedFileQueries.delete_file(db, file_id)
@@ -342,6 +342,8 @@ async def update_workflow_expose_config(
         await db.commit()
         
         # Sync to shared_state.workflow_skills
+        from ..shared_state import wait_for_components
+        await wait_for_components("workflow_skills")
         from ..shared_state import workflow_skills
         if request.add_to_skill:
             # Add or update in workflow_skills
@@ -356,6 +358,9 @@ async def update_workflow_expose_config(
             if request.flow_id in workflow_skills:
                 del workflow_skills[request.flow_id]
                 logger.info(f"✅ Removed workflow {request.flow_id} from workflow_skills")
+
+        from ..utils.workflow_index import rebuild_workflow_index
+        rebuild_workflow_index(workflow_skills)
         
         return WorkflowExposeConfigResponse(
             success=True,
@@ -411,6 +416,8 @@ async def get_enabled_skills(db: AsyncSession = Depends(get_db_session)):
 async def get_workflow_skills():
     """Get all workflow skills from shared state (cached)"""
     try:
+        from ..shared_state import wait_for_components
+        await wait_for_components("workflow_skills")
         from ..shared_state import workflow_skills
         
         # Format the response similar to @flow-{flow_id[-4:]}: {flow name}
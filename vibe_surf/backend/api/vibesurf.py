@@ -20,7 +20,8 @@ from sqlmodel import select
 from ..database.manager import get_db_session
 from ..database.queries import CredentialQueries
 from vibe_surf.logger import get_logger
-from vibe_surf.tools.website_api.newsnow.client import NewsNowClient
+from vibe_surf.tools.ttl_cache import TTLCache
+from vibe_surf.tools.website_api.newsnow.client import global_client as news_client
 from vibe_surf.langflow.services.deps import session_scope, get_settings_service
 from vibe_surf.langflow.services.auth.utils import create_super_user
 from vibe_surf.langflow.api.v1.flows import _read_flow, _new_flow
@@ -661,9 +662,38 @@ class ExecuteWorkflowSkillResponse(BaseModel):
     result: Optional[str] = None
     error: Optional[str] = None
 
+# Dashboard data is cached so that opening new tabs does not call the upstream
+# services every time. Old values are served while they refresh in the background.
+IP_LOCATION_TTL = 60 * 60
+IP_LOCATION_STALE_TTL = 24 * 60 * 60
+WEATHER_TTL = 10 * 60
+WEATHER_STALE_TTL = 60 * 60
+NEWS_TTL = 5 * 60
+NEWS_STALE_TTL = 30 * 60
+
+_dashboard_cache = TTLCache("dashboard")
+_dashboard_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_dashboard_http_client() -> httpx.AsyncClient:
+    """Shared HTTP client for dashboard lookups, so connections are reused"""
+    global _dashboard_http_client
+    if _dashboard_http_client is None or _dashboard_http_client.is_closed:
+        # trust_env=False prevents httpx from using system proxy settings
+        _dashboard_http_client = httpx.AsyncClient(trust_env=False)
+    return _dashboard_http_client
+
+
+async def close_dashboard_http_client():
+    global _dashboard_http_client
+    if _dashboard_http_client is not None:
+        await _dashboard_http_client.aclose()
+        _dashboard_http_client = None
+
+
 async def get_ip_location() -> IPLocationData:
     """
-    Get IP location information using ipinfo.io
+    Get IP location information using ipinfo.io, cached for IP_LOCATION_TTL seconds
 
     Returns:
         IPLocationData with city, country, and coordinates
@@ -674,29 +704,39 @@ async def get_ip_location() -> IPLocationData:
         if location.detected:
             print(f"City: {location.city}, Country: {location.country}")
     """
+    # Failed detections are not cached, so the next request tries again
+    return await _dashboard_cache.get_or_fetch(
+        "ip_location",
+        _lookup_ip_location,
+        ttl=IP_LOCATION_TTL,
+        stale_ttl=IP_LOCATION_STALE_TTL,
+        should_cache=lambda location: location.detected,
+    )
+
+
+async def _lookup_ip_location() -> IPLocationData:
     result = IPLocationData()
 
     try:
-        # trust_env=False prevents httpx from using system proxy settings
-        async with httpx.AsyncClient(trust_env=False) as client:
-            response = await client.get("http://ipinfo.io/json", timeout=2.0)
-            if response.status_code == 200:
-                ip_data = response.json()
-                result.city = ip_data.get("city", "")
-                result.country = ip_data.get("country", "")
-                result.loc = ip_data.get("loc", "")
-
-                # Parse coordinates
-                if result.loc and "," in result.loc:
-                    lat_str, lon_str = result.loc.split(",")
-                    try:
-                        result.latitude = float(lat_str.strip())
-                        result.longitude = float(lon_str.strip())
-                    except ValueError:
-                        logger.warning(f"Invalid coordinates format: {result.loc}")
-
-                result.detected = bool(result.country)
-                logger.debug(f"IP location detected: city={result.city}, country={result.country}")
+        client = _get_dashboard_http_client()
+        response = await client.get("http://ipinfo.io/json", timeout=2.0)
+        if response.status_code == 200:
+            ip_data = response.json()
+            result.city = ip_data.get("city", "")
+            result.country = ip_data.get("country", "")
+            result.loc = ip_data.get("loc", "")
+
+            # Parse coordinates
+            if result.loc and "," in result.loc:
+                lat_str, lon_str = result.loc.split(",")
+                try:
+                    result.latitude = float(lat_str.strip())
+                    result.longitude = float(lon_str.strip())
+                except ValueError:
+                    logger.warning(f"Invalid coordinates format: {result.loc}")
+
+            result.detected = bool(result.country)
+            logger.debug(f"IP location detected: city={result.city}, country={result.country}")
 
     except (httpx.TimeoutException, httpx.RequestError, ValueError) as e:
         logger.warning(f"Error getting IP location (using defaults): {e}")
@@ -709,95 +749,103 @@ async def get_ip_location() -> IPLocationData:
 async def get_weather():
     """Get weather information based on IP location using open-meteo.com"""
     try:
-        # Default to San Francisco coordinates if geolocation fails
-        latitude = 37.7749
-        longitude = -122.4194
-        display_location = "San Francisco, US"
+        return await _dashboard_cache.get_or_fetch(
+            "weather",
+            _fetch_weather,
+            ttl=WEATHER_TTL,
+            stale_ttl=WEATHER_STALE_TTL,
+        )
+    except Exception as e:
+        logger.error(f"Error getting weather: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to get weather: {str(e)}")
 
-        # Get location from IP using shared function
-        ip_location = await get_ip_location()
 
-        if ip_location.detected:
-            # Use detected location
-            if ip_location.latitude is not None and ip_location.longitude is not None:
-                latitude = ip_location.latitude
-                longitude = ip_location.longitude
+async def _fetch_weather() -> WeatherResponse:
+    # Default to San Francisco coordinates if geolocation fails
+    latitude = 37.7749
+    longitude = -122.4194
+    display_location = "San Francisco, US"
 
-            if ip_location.city and ip_location.country:
-                display_location = f"{ip_location.city}, {ip_location.country}"
-            elif ip_location.country:
-                display_location = ip_location.country
+    # Get location from IP using shared function
+    ip_location = await get_ip_location()
 
-            logger.debug(f"Location detected: {display_location} ({latitude}, {longitude})")
-        
-        # Get weather from open-meteo.com
-        weather_url = "https://api.open-meteo.com/v1/forecast"
-        params = {
-            "latitude": latitude,
-            "longitude": longitude,
-            "current_weather": "true"
-        }
-        
-        async with httpx.AsyncClient(trust_env=False) as client:
-            response = await client.get(weather_url, params=params, timeout=3.0)
-            if response.status_code != 200:
-                raise HTTPException(status_code=response.status_code, detail="Failed to fetch weather data")
-            weather_data = response.json()
-        
-        # Extract current weather data
-        current = weather_data.get("current_weather", {})
-        temp_c = current.get("temperature", 0)
-        wind_speed = current.get("windspeed", 0)
-        weather_code = current.get("weathercode", 0)
-        
-        # Map WMO weather codes to descriptions
-        # https://open-meteo.com/en/docs
-        weather_code_map = {
-            0: "Clear sky",
-            1: "Mainly clear",
-            2: "Partly cloudy",
-            3: "Overcast",
-            45: "Foggy",
-            48: "Depositing rime fog",
-            51: "Light drizzle",
-            53: "Moderate drizzle",
-            55: "Dense drizzle",
-            61: "Slight rain",
-            63: "Moderate rain",
-            65: "Heavy rain",
-            71: "Slight snow",
-            73: "Moderate snow",
-            75: "Heavy snow",
-            77: "Snow grains",
-            80: "Slight rain showers",
-            81: "Moderate rain showers",
-            82: "Violent rain showers",
-            85: "Slight snow showers",
-            86: "Heavy snow showers",
-            95: "Thunderstorm",
-            96: "Thunderstorm with slight hail",
-            99: "Thunderstorm with heavy hail"
+    if ip_location.detected:
+        # Use detected location
+        if ip_location.latitude is not None and ip_location.longitude is not None:
+            latitude = ip_location.latitude
+            longitude = ip_location.longitude
+
+        if ip_location.city and ip_location.country:
+            display_location = f"{ip_location.city}, {ip_location.country}"
+        elif ip_location.country:
+            display_location = ip_location.country
+
+        logger.debug(f"Location detected: {display_location} ({latitude}, {longitude})")
+    
+    # Get weather from open-meteo.com
+    weather_url = "https://api.open-meteo.com/v1/forecast"
+    params = {
+        "latitude": latitude,
+        "longitude": longitude,
+        "current_weather": "true"
+    }
+    
+    client = _get_dashboard_http_client()
+    response = await client.get(weather_url, params=params, timeout=3.0)
+    if response.status_code != 200:
+        raise HTTPException(status_code=response.status_code, detail="Failed to fetch weather data")
+    weather_data = response.json()
+    
+    # Extract current weather data
+    current = weather_data.get("current_weather", {})
+    temp_c = current.get("temperature", 0)
+    wind_speed = current.get("windspeed", 0)
+    weather_code = current.get("weathercode", 0)
+    
+    # Map WMO weather codes to descriptions
+    # https://open-meteo.com/en/docs
+    weather_code_map = {
+        0: "Clear sky",
+        1: "Mainly clear",
+        2: "Partly cloudy",
+        3: "Overcast",
+        45: "Foggy",
+        48: "Depositing rime fog",
+        51: "Light drizzle",
+        53: "Moderate drizzle",
+        55: "Dense drizzle",
+        61: "Slight rain",
+        63: "Moderate rain",
+        65: "Heavy rain",
+        71: "Slight snow",
+        73: "Moderate snow",
+        75: "Heavy snow",
+        77: "Snow grains",
+        80: "Slight rain showers",
+        81: "Moderate rain showers",
+        82: "Violent rain showers",
+        85: "Slight snow showers",
+        86: "Heavy snow showers",
+        95: "Thunderstorm",
+        96: "Thunderstorm with slight hail",
+        99: "Thunderstorm with heavy hail"
+    }
+    
+    condition = weather_code_map.get(weather_code, "Unknown")
+    
+    return WeatherResponse(
+        location=display_location,
+        temp_c=str(int(temp_c)),
+        condition=condition,
+        wind_speed=str(int(wind_speed)),
+        details={
+            "temperature": temp_c,
+            "windspeed": wind_speed,
+            "weathercode": weather_code,
+            "time": current.get("time", ""),
+            "winddirection": current.get("winddirection", 0)
         }
-        
-        condition = weather_code_map.get(weather_code, "Unknown")
-        
-        return WeatherResponse(
-            location=display_location,
-            temp_c=str(int(temp_c)),
-            condition=condition,
-            wind_speed=str(int(wind_speed)),
-            details={
-                "temperature": temp_c,
-                "windspeed": wind_speed,
-                "weathercode": weather_code,
-                "time": current.get("time", ""),
-                "winddirection": current.get("winddirection", 0)
-            }
-        )
-        
-    except Exception as e:
-        logger.error(f"Error getting weather: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get weather: {str(e)}")
+    )
 
 @router.get("/news/sources", response_model=NewsSourcesResponse)
 async def get_news_sources(news_type: Optional[str] = None):
@@ -807,8 +855,7 @@ async def get_news_sources(news_type: Optional[str] = None):
         news_type: Optional filter by news type ("realtime", "hottest", or None for all)
     """
     try:
-        client = NewsNowClient()
-        sources = client.get_available_sources(news_type=news_type)
+        sources = news_client.get_available_sources(news_type=news_type)
         return NewsSourcesResponse(sources=sources)
     except Exception as e:
         logger.error(f"Error getting news sources: {e}")
@@ -828,20 +875,25 @@ async def get_news(
         count: Maximum number of news items to return per source (default: 10)
     """
     try:
-        client = NewsNowClient()
-
-        # Client handles all filtering logic internally
-        news_data = await client.get_news(
-            source_id=source_id,
-            news_type=news_type,
-            count=count
+        # Cache every item of a source, so requests with different counts share an entry.
+        # Client handles all filtering logic internally; empty results are not cached.
+        all_news = await _dashboard_cache.get_or_fetch(
+            ("news", source_id, news_type),
+            lambda: news_client.get_news(source_id=source_id, news_type=news_type, count=0),
+            ttl=NEWS_TTL,
+            stale_ttl=NEWS_STALE_TTL,
+            should_cache=bool,
         )
+        news_data = {
+            sid: items[:count] if count > 0 else list(items)
+            for sid, items in all_news.items()
+        }
 
         # Get metadata for the sources that have news
         sources_metadata = {}
         for sid in news_data.keys():
-            if sid in client.sources:
-                metadata = client.sources[sid]
+            if sid in news_client.sources:
+                metadata = news_client.sources[sid]
                 sources_metadata[sid] = {
                     "name": metadata.get("name", ""),
                     "home": metadata.get("home", ""),
@@ -901,15 +953,17 @@ async def get_location_language():
 @router.get("/search-workflow-skills", response_model=SearchWorkflowSkillsResponse)
 async def search_workflow_skills(
     key_words: Optional[str] = None,
-    workflow_id: Optional[str] = None
+    workflow_id: Optional[str] = None,
+    top_k: Optional[int] = None
 ):
     """
     Search available workflows by keywords or workflow ID
 
     Args:
-        key_words: Comma-separated keywords to search in workflow name and description.
-                   Use None or empty to return all workflows. Example: "search,data,analysis"
+        key_words: Comma-separated keywords to search in workflow name, description and
+                   adjustable parameters. Use None or empty to return all workflows. Example: "search,data,analysis"
         workflow_id: Optional full workflow UUID for direct lookup (36 characters)
+        top_k: Optional maximum number of keyword matches, ranked by relevance
 
     Returns workflow information including:
     - workflow_id (full UUID)
@@ -918,103 +972,48 @@ async def search_workflow_skills(
     - adjustable components with input parameters
     """
     try:
+        from vibe_surf.backend.shared_state import wait_for_components
+        await wait_for_components("workflow_skills")
         from vibe_surf.backend.shared_state import workflow_skills
+        from vibe_surf.backend.utils.workflow_index import get_workflow_index
 
-        # Get all workflows
-        all_workflows = workflow_skills
-
-        if not all_workflows:
+        if not workflow_skills:
             return SearchWorkflowSkillsResponse(
                 success=False,
                 message="No workflows available. Please configure workflows in the skill management system.",
                 workflows=None
             )
 
-        # Filter workflows
-        filtered_workflows = {}
+        index = get_workflow_index(workflow_skills)
 
         # Normalize empty strings to None
         workflow_id = workflow_id if workflow_id and workflow_id.strip() else None
         key_words = key_words if key_words and key_words.strip() else None
 
         # If workflow_id is provided, prioritize it
-        if workflow_id:
-            # Direct lookup by full workflow ID
-            if workflow_id in all_workflows:
-                filtered_workflows[workflow_id] = all_workflows[workflow_id]
+        entries = []
+        if workflow_id and index.get(workflow_id):
+            entries = [index.get(workflow_id)]
 
         # If no workflow_id match or not provided, search by keywords
-        if not filtered_workflows:
-            # Check if we should return all workflows
+        if not entries:
             if not key_words or key_words in ['None', '*']:
-                filtered_workflows = all_workflows
+                entries = index.all()
             else:
-                # Filter by keywords
-                keywords = [kw.strip().lower() for kw in key_words.split(',')]
-                for flow_id, workflow_data in all_workflows.items():
-                    name = workflow_data.get('name', '').lower()
-                    description = workflow_data.get('description', '').lower()
-                    search_text = f"{name} {description}"
-
-                    if any(keyword in search_text for keyword in keywords):
-                        filtered_workflows[flow_id] = workflow_data
+                entries = [entry for entry, _ in index.search(key_words, top_k=top_k)]
 
-        if not filtered_workflows:
+        if not entries:
             return SearchWorkflowSkillsResponse(
                 success=False,
                 message=f"No workflows found matching criteria. Keywords: {key_words}, Workflow ID: {workflow_id}",
                 workflows=None
             )
 
-        # Format results
-        workflows_list = []
-        for flow_id, workflow_data in filtered_workflows.items():
-            workflow_name = workflow_data.get('name', 'Unnamed Workflow')
-            workflow_desc = workflow_data.get('description', 'No description')
-            workflow_expose_config = workflow_data.get('workflow_expose_config', {})
-
-            workflow_info = {
-                "workflow_id": flow_id,
-                "name": workflow_name,
-                "description": workflow_desc,
-                "adjustable_parameters": {}
-            }
-
-            # List adjustable parameters
-            if workflow_expose_config:
-                for component_id, component_data in workflow_expose_config.items():
-                    component_name = component_data.get('component_name', component_id)
-                    inputs = component_data.get('inputs', {})
-
-                    # Only show exposed inputs
-                    exposed_inputs = {k: v for k, v in inputs.items() if v.get('is_expose', False)}
-
-                    if exposed_inputs:
-                        workflow_info["adjustable_parameters"][component_id] = {
-                            "component_name": component_name,
-                            "inputs": {}
-                        }
-
-                        for input_name, input_data in exposed_inputs.items():
-                            display_name = input_data.get('display_name', input_name)
-                            input_type = input_data.get('type', 'str')
-                            info = input_data.get('info', '')
-                            current_value = input_data.get('value', '')
-
-                            workflow_info["adjustable_parameters"][component_id]["inputs"][input_name] = {
-                                "display_name": display_name,
-                                "type": input_type,
-                                "info": info,
-                                "current_value": current_value
-                            }
-
-            workflows_list.append(workflow_info)
-
-        logger.info(f'🔍 Found {len(filtered_workflows)} workflows')
+        logger.info(f'🔍 Found {len(entries)} workflows')
         return SearchWorkflowSkillsResponse(
             success=True,
-            message=f"Found {len(filtered_workflows)} workflows",
-            workflows=workflows_list
+            message=f"Found {len(entries)} workflows",
+            workflows=[entry.to_dict() for entry in entries]
         )
 
     except Exception as e:
@@ -1028,109 +1027,149 @@ async def search_workflow_skills(
             workflows=None
         )
 
-@router.post("/execute-workflow-skill", response_model=ExecuteWorkflowSkillResponse)
-async def execute_workflow_skill(request: ExecuteWorkflowAction):
+# Caches for workflow skill execution. Agents call the same skills repeatedly,
+# so the superuser is resolved once and a flow is re-read only when its
+# updated_at changes.
+_workflow_superuser = None
+_workflow_flow_cache: Dict[str, Any] = {}
+_workflow_exposed_inputs_cache: Dict[str, tuple] = {}
+
+
+def _get_exposed_inputs(workflow_id: str, workflow_expose_config: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Map component IDs to their exposed inputs, cached per expose config"""
+    cached = _workflow_exposed_inputs_cache.get(workflow_id)
+    if cached and cached[0] is workflow_expose_config:
+        return cached[1]
+
+    valid_components = {}
+    for component_id, component_data in workflow_expose_config.items():
+        inputs = component_data.get('inputs', {})
+        exposed_inputs = {k: v for k, v in inputs.items() if v.get('is_expose', False)}
+        if exposed_inputs:
+            valid_components[component_id] = exposed_inputs
+
+    _workflow_exposed_inputs_cache[workflow_id] = (workflow_expose_config, valid_components)
+    return valid_components
+
+
+async def _load_workflow_flow(flow_uuid):
+    """Return the superuser and the flow, reading the full flow only when it changed"""
+    global _workflow_superuser
+    from vibe_surf.langflow.services.database.models.flow.model import Flow
+
+    async with session_scope() as langflow_session:
+        if _workflow_superuser is None:
+            settings_service = get_settings_service()
+            _workflow_superuser = await create_super_user(
+                db=langflow_session,
+                username=settings_service.auth_settings.SUPERUSER,
+                password=settings_service.auth_settings.SUPERUSER_PASSWORD
+            )
+
+        flow_version = (
+            await langflow_session.exec(
+                select(Flow.id, Flow.updated_at)
+                .where(Flow.id == flow_uuid)
+                .where(Flow.user_id == _workflow_superuser.id)
+            )
+        ).first()
+        if not flow_version:
+            _workflow_flow_cache.pop(str(flow_uuid), None)
+            return _workflow_superuser, None
+
+        cached_flow = _workflow_flow_cache.get(str(flow_uuid))
+        if cached_flow is not None and cached_flow.updated_at == flow_version.updated_at:
+            return _workflow_superuser, cached_flow
+
+        db_flow = await _read_flow(session=langflow_session, flow_id=flow_uuid, user_id=_workflow_superuser.id)
+        if db_flow:
+            _workflow_flow_cache[str(flow_uuid)] = db_flow
+        return _workflow_superuser, db_flow
+
+
+async def _prepare_workflow_skill_run(request: ExecuteWorkflowAction):
     """
-    Execute a workflow with optional parameter tweaks
+    Validate a workflow skill request and load its flow
 
-    Uses tweak_params to customize workflow inputs
+    Returns:
+        (error_response, db_flow, current_user, tweaks); error_response is set when the request cannot run
     """
-    try:
-        from vibe_surf.backend.shared_state import workflow_skills
-        from vibe_surf.langflow.api.v1.endpoints import simple_run_flow
-        from vibe_surf.langflow.api.v1.schemas import SimplifiedAPIRequest
-        from uuid import UUID
+    from vibe_surf.backend.shared_state import wait_for_components
+    await wait_for_components("workflow_skills")
+    from vibe_surf.backend.shared_state import workflow_skills
+    from uuid import UUID
 
-        # Get the workflow directly using full workflow_id
-        workflow_id = request.workflow_id
+    def _error(message: str):
+        return ExecuteWorkflowSkillResponse(success=False, message=message, result=None, error=message), None, None, None
 
-        if workflow_id not in workflow_skills:
-            return ExecuteWorkflowSkillResponse(
-                success=False,
-                message=f'Workflow with ID "{workflow_id}" not found',
-                result=None,
-                error=f'Workflow with ID "{workflow_id}" not found'
-            )
+    # Get the workflow directly using full workflow_id
+    workflow_id = request.workflow_id
 
-        # Parse tweak_params
-        tweaks = {}
-        if request.tweak_params:
-            try:
-                from json_repair import repair_json
-                tweaks = json.loads(repair_json(request.tweak_params))
-            except json.JSONDecodeError as e:
-                return ExecuteWorkflowSkillResponse(
-                    success=False,
-                    message=f'Invalid tweak_params JSON: {str(e)}',
-                    result=None,
-                    error=f'Invalid tweak_params JSON: {str(e)}'
-                )
+    if workflow_id not in workflow_skills:
+        return _error(f'Workflow with ID "{workflow_id}" not found')
 
-        # Validate tweak_params against workflow expose config
-        if tweaks:
-            # Get workflow expose config
-            workflow_data = workflow_skills.get(workflow_id, {})
-            workflow_expose_config = workflow_data.get('workflow_expose_config', {})
-
-            # Build valid exposed inputs map
-            valid_components = {}
-            for component_id, component_data in workflow_expose_config.items():
-                inputs = component_data.get('inputs', {})
-                exposed_inputs = {k: v for k, v in inputs.items() if v.get('is_expose', False)}
-                if exposed_inputs:
-                    valid_components[component_id] = exposed_inputs
-
-            # Validate tweak keys
-            invalid_tweaks = []
-            for component_id, component_tweaks in tweaks.items():
-                if component_id not in valid_components:
-                    invalid_tweaks.append(f"Component '{component_id}' is not found in exposed components")
-                else:
-                    for input_name in component_tweaks.keys():
-                        if input_name not in valid_components[component_id]:
-                            invalid_tweaks.append(f"Input '{input_name}' in component '{component_id}' is not exposed")
+    # Parse tweak_params
+    tweaks = {}
+    if request.tweak_params:
+        try:
+            from json_repair import repair_json
+            tweaks = json.loads(repair_json(request.tweak_params))
+        except json.JSONDecodeError as e:
+            return _error(f'Invalid tweak_params JSON: {str(e)}')
+
+    # Validate tweak_params against workflow expose config
+    if tweaks:
+        workflow_data = workflow_skills.get(workflow_id, {})
+        valid_components = _get_exposed_inputs(workflow_id, workflow_data.get('workflow_expose_config', {}))
+
+        # Validate tweak keys
+        invalid_tweaks = []
+        for component_id, component_tweaks in tweaks.items():
+            if component_id not in valid_components:
+                invalid_tweaks.append(f"Component '{component_id}' is not found in exposed components")
+            else:
+                for input_name in component_tweaks.keys():
+                    if input_name not in valid_components[component_id]:
+                        invalid_tweaks.append(f"Input '{input_name}' in component '{component_id}' is not exposed")
+
+        # If invalid tweaks found, return error with adjustable parameters
+        if invalid_tweaks:
+            result_text = "Invalid tweak parameters:\n"
+            for error in invalid_tweaks:
+                result_text += f"- {error}\n"
+            return _error(result_text)
+
+    # Get the flow from database
+    try:
+        flow_uuid = UUID(workflow_id)
+    except ValueError:
+        return _error(f'Invalid flow ID format: {workflow_id}')
 
-            # If invalid tweaks found, return error with adjustable parameters
-            if invalid_tweaks:
-                result_text = "Invalid tweak parameters:\n"
-                for error in invalid_tweaks:
-                    result_text += f"- {error}\n"
+    current_user, db_flow = await _load_workflow_flow(flow_uuid)
+    if not db_flow:
+        return _error(f'Workflow not found in database: {workflow_id}')
 
-                return ExecuteWorkflowSkillResponse(
-                    success=False,
-                    message=result_text,
-                    result=None,
-                    error=result_text
-                )
+    return None, db_flow, current_user, tweaks
 
-        # Get the flow from database
-        try:
-            flow_uuid = UUID(workflow_id)
-        except ValueError:
-            return ExecuteWorkflowSkillResponse(
-                success=False,
-                message=f'Invalid flow ID format: {workflow_id}',
-                result=None,
-                error=f'Invalid flow ID format: {workflow_id}'
-            )
 
-        # Get settings for authentication
-        settings_service = get_settings_service()
-        username = settings_service.auth_settings.SUPERUSER
-        password = settings_service.auth_settings.SUPERUSER_PASSWORD
+@router.post("/execute-workflow-skill", response_model=ExecuteWorkflowSkillResponse)
+async def execute_workflow_skill(request: ExecuteWorkflowAction):
+    """
+    Execute a workflow with optional parameter tweaks
 
-        # Fetch workflow from langflow database (only read flow in session scope)
-        async with session_scope() as langflow_session:
-            current_user = await create_super_user(db=langflow_session, username=username, password=password)
-            db_flow = await _read_flow(session=langflow_session, flow_id=flow_uuid, user_id=current_user.id)
+    Uses tweak_params to customize workflow inputs
+    """
+    try:
+        from vibe_surf.backend.shared_state import wait_for_components
+        await wait_for_components("workflow_skills")
+        from vibe_surf.backend.shared_state import workflow_skills
+        from vibe_surf.langflow.api.v1.endpoints import simple_run_flow
+        from vibe_surf.langflow.api.v1.schemas import SimplifiedAPIRequest
 
-            if not db_flow:
-                return ExecuteWorkflowSkillResponse(
-                    success=False,
-                    message=f'Workflow not found in database: {workflow_id}',
-                    result=None,
-                    error=f'Workflow not found in database: {workflow_id}'
-                )
+        workflow_id = request.workflow_id
+        error_response, db_flow, current_user, tweaks = await _prepare_workflow_skill_run(request)
+        if error_response:
+            return error_response
 
         # Create request with tweaks
         input_request = SimplifiedAPIRequest(
@@ -1196,4 +1235,56 @@ async def execute_workflow_skill(request: ExecuteWorkflowAction):
             message=error_msg,
             result=None,
             error=error_msg
-        )
\ No newline at end of file
+        )
+
+
+@router.post("/execute-workflow-skill/stream")
+async def execute_workflow_skill_stream(request: ExecuteWorkflowAction):
+    """
+    Execute a workflow and stream component results as they finish
+
+    Emits newline-delimited JSON events: "end_vertex" for each finished component,
+    "token" for streamed LLM output, then "end" with the full run result or "error".
+    """
+    import asyncio
+    from fastapi.responses import StreamingResponse
+    from vibe_surf.langflow.api.v1.endpoints import consume_and_yield, run_flow_generator
+    from vibe_surf.langflow.api.v1.schemas import SimplifiedAPIRequest
+    from vibe_surf.langflow.events.event_manager import create_stream_tokens_event_manager
+
+    error_response, db_flow, current_user, tweaks = await _prepare_workflow_skill_run(request)
+    if error_response:
+        return error_response
+
+    input_request = SimplifiedAPIRequest(
+        input_value=None,
+        input_type="chat",
+        output_type="any",
+        tweaks=tweaks,
+    )
+
+    asyncio_queue: asyncio.Queue = asyncio.Queue()
+    asyncio_queue_client_consumed: asyncio.Queue = asyncio.Queue()
+    event_manager = create_stream_tokens_event_manager(queue=asyncio_queue)
+    # Graph.process emits per-component results only to managers registering on_end_component
+    event_manager.register_event("on_end_component", "end_vertex")
+    event_manager.register_event("on_error", "error")
+
+    async def event_stream():
+        main_task = asyncio.create_task(
+            run_flow_generator(
+                flow=db_flow,
+                input_request=input_request,
+                api_key_user=current_user,
+                event_manager=event_manager,
+                client_consumed_queue=asyncio_queue_client_consumed,
+            )
+        )
+        try:
+            async for event in consume_and_yield(asyncio_queue, asyncio_queue_client_consumed):
+                yield event
+        finally:
+            if not main_task.done():
+                main_task.cancel()
+
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
\ No newline at end of file
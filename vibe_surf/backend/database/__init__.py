@@ -4,7 +4,7 @@ VibeSurf Backend Database Package - Simplified
 Single table design for task tracking and execution.
 """
 
-from .manager import get_db_session
+from .manager import get_db_session, get_db_read_session
 from .models import (
     Base,
     Task,
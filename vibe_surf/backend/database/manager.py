@@ -14,15 +14,40 @@ from pathlib import Path
 from typing import AsyncGenerator, List, Tuple, Optional
 import logging
 import aiosqlite
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import StaticPool, AsyncAdaptedQueuePool
 from .models import Base
 
 from vibe_surf.logger import get_logger
 
 logger = get_logger(__name__)
 
+# SQLite busy timeout in seconds, shared by the driver and the busy_timeout pragma
+SQLITE_BUSY_TIMEOUT = 30
+# WAL allows concurrent readers next to the writer connections
+SQLITE_READER_POOL_SIZE = 5
+# Extra writer connections for sessions opened while another one is still held
+# (e.g. a helper opening its own session inside a request). SQLite itself still
+# serializes the writes, waiting up to the busy timeout for the write lock.
+SQLITE_WRITER_MAX_OVERFLOW = 4
+
+
+def _set_sqlite_pragmas(dbapi_connection, read_only: bool = False):
+    """Apply per-connection SQLite pragmas for WAL-based concurrent access"""
+    cursor = dbapi_connection.cursor()
+    try:
+        # journal_mode is persistent in the database file, only the writer switches it
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON;")
+        else:
+            cursor.execute("PRAGMA journal_mode=WAL;")
+        cursor.execute("PRAGMA synchronous=NORMAL;")
+        cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT * 1000};")
+    finally:
+        cursor.close()
+
 
 class DBMigrationManager:
     """Simplified database migration manager."""
@@ -89,6 +114,10 @@ class DBMigrationManager:
         db_dir = os.path.dirname(self.db_path)
         os.makedirs(db_dir, exist_ok=True)
         
+        # Switch to WAL once so readers never block on the writer
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute("PRAGMA journal_mode=WAL;")
+        
         current_version = await self.get_db_version()
         
         if current_version == 0:
@@ -161,17 +190,52 @@ class DatabaseManager:
         )
 
         # Configure engine based on database type
-        if self.database_url.startswith('sqlite'):
-            # SQLite configuration for development
+        if self.database_url.startswith('sqlite') and ':memory:' in self.database_url:
+            # In-memory SQLite only exists on a single shared connection
             self.engine = create_async_engine(
                 self.database_url,
                 poolclass=StaticPool,
                 connect_args={
                     "check_same_thread": False,
-                    "timeout": 30
+                    "timeout": SQLITE_BUSY_TIMEOUT
                 },
                 echo=False  # Set to True for SQL debugging
             )
+            self.read_engine = self.engine
+        elif self.database_url.startswith('sqlite'):
+            # SQLite in WAL mode: a small writer pool, a pool of reader connections
+            self.engine = create_async_engine(
+                self.database_url,
+                poolclass=AsyncAdaptedQueuePool,
+                pool_size=1,
+                max_overflow=SQLITE_WRITER_MAX_OVERFLOW,
+                pool_timeout=SQLITE_BUSY_TIMEOUT,
+                connect_args={
+                    "check_same_thread": False,
+                    "timeout": SQLITE_BUSY_TIMEOUT
+                },
+                echo=False  # Set to True for SQL debugging
+            )
+            self.read_engine = create_async_engine(
+                self.database_url,
+                poolclass=AsyncAdaptedQueuePool,
+                pool_size=SQLITE_READER_POOL_SIZE,
+                max_overflow=SQLITE_READER_POOL_SIZE,
+                pool_timeout=SQLITE_BUSY_TIMEOUT,
+                connect_args={
+                    "check_same_thread": False,
+                    "timeout": SQLITE_BUSY_TIMEOUT
+                },
+                echo=False
+            )
+            event.listen(
+                self.engine.sync_engine, "connect",
+                lambda dbapi_connection, _: _set_sqlite_pragmas(dbapi_connection)
+            )
+            event.listen(
+                self.read_engine.sync_engine, "connect",
+                lambda dbapi_connection, _: _set_sqlite_pragmas(dbapi_connection, read_only=True)
+            )
         else:
             # PostgreSQL/MySQL configuration for production
             self.engine = create_async_engine(
@@ -182,12 +246,18 @@ class DatabaseManager:
                 pool_recycle=3600,
                 echo=False
             )
+            self.read_engine = self.engine
 
         self.async_session_factory = sessionmaker(
             self.engine,
             class_=AsyncSession,
             expire_on_commit=False
         )
+        self.async_read_session_factory = sessionmaker(
+            self.read_engine,
+            class_=AsyncSession,
+            expire_on_commit=False
+        )
         
         # Initialize migration manager for SQLite databases
         if self.database_url.startswith('sqlite'):
@@ -238,6 +308,18 @@ class DatabaseManager:
             finally:
                 await session.close()
 
+    async def get_read_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """Get async database session for read-only queries
+
+        Uses the reader connection pool, so reads do not queue behind writes.
+        """
+        async with self.async_read_session_factory() as session:
+            try:
+                yield session
+            finally:
+                await session.rollback()
+                await session.close()
+
     async def apply_migrations(self, target_version: Optional[int] = None) -> int:
         """Apply database migrations
         
@@ -270,6 +352,8 @@ class DatabaseManager:
     async def close(self):
         """Close database connections"""
         await self.engine.dispose()
+        if self.read_engine is not self.engine:
+            await self.read_engine.dispose()
 
 
 # Dependency for FastAPI
@@ -284,6 +368,17 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+async def get_db_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency for read-only database sessions"""
+    from .. import shared_state
+
+    if not shared_state.db_manager:
+        raise RuntimeError("Database manager not initialized. Call initialize_vibesurf_components() first.")
+
+    async for session in shared_state.db_manager.get_read_session():
+        yield session
+
+
 # Database initialization script
 async def init_database():
     """Initialize database with tables"""
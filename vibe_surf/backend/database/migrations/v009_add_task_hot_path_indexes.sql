@@ -0,0 +1,15 @@
+-- Migration v009: Add composite indexes for task history queries
+-- Created: 2026-10-18
+
+-- Session listing groups by session_id and aggregates created_at/status;
+-- per-session task lists filter by session_id and order by created_at
+CREATE INDEX IF NOT EXISTS idx_tasks_session_created ON tasks(session_id, created_at, status);
+
+-- Tasks per LLM profile are ordered by created_at
+CREATE INDEX IF NOT EXISTS idx_tasks_llm_profile_created ON tasks(llm_profile_name, created_at);
+
+-- Superseded by the composite indexes above
+DROP INDEX IF EXISTS idx_tasks_session;
+DROP INDEX IF EXISTS idx_tasks_llm_profile;
+
+ANALYZE tasks;
@@ -0,0 +1,77 @@
+-- Migration v010: Add materialized sessions table for session listing
+-- Created: 2026-10-18
+
+-- One row per session, kept up to date by the triggers below so listing
+-- sessions no longer aggregates the whole tasks table
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id VARCHAR(36) PRIMARY KEY,
+    title TEXT,
+    task_count INTEGER NOT NULL DEFAULT 0,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    last_activity DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    latest_status VARCHAR(20),
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Keyset pagination orders by (last_activity, session_id)
+CREATE INDEX IF NOT EXISTS idx_sessions_last_activity ON sessions(last_activity, session_id);
+
+-- Backfill from existing task history
+INSERT OR IGNORE INTO sessions (session_id, title, task_count, created_at, last_activity, latest_status)
+SELECT
+    t.session_id,
+    (SELECT substr(first.task_description, 1, 200) FROM tasks first
+        WHERE first.session_id = t.session_id ORDER BY first.created_at ASC LIMIT 1),
+    COUNT(*),
+    MIN(t.created_at),
+    MAX(t.created_at),
+    (SELECT latest.status FROM tasks latest
+        WHERE latest.session_id = t.session_id ORDER BY latest.created_at DESC LIMIT 1)
+FROM tasks t
+GROUP BY t.session_id;
+
+-- A new task counts towards its session and becomes its latest task
+CREATE TRIGGER IF NOT EXISTS sessions_on_task_insert
+    AFTER INSERT ON tasks
+    FOR EACH ROW
+    BEGIN
+        INSERT OR IGNORE INTO sessions (session_id, title, task_count, created_at, last_activity, latest_status)
+        VALUES (NEW.session_id, substr(NEW.task_description, 1, 200), 0, NEW.created_at, NEW.created_at, NEW.status);
+        UPDATE sessions SET
+            task_count = task_count + 1,
+            created_at = MIN(created_at, NEW.created_at),
+            latest_status = CASE WHEN NEW.created_at >= last_activity THEN NEW.status ELSE latest_status END,
+            last_activity = MAX(last_activity, NEW.created_at),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE session_id = NEW.session_id;
+    END;
+
+-- Status changes of the session's latest task update the session status
+CREATE TRIGGER IF NOT EXISTS sessions_on_task_status_update
+    AFTER UPDATE OF status ON tasks
+    FOR EACH ROW
+    WHEN NEW.status IS NOT OLD.status
+    BEGIN
+        UPDATE sessions SET
+            latest_status = NEW.status,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE session_id = NEW.session_id AND last_activity <= NEW.created_at;
+    END;
+
+-- Deleting a task recomputes its session, dropping it once it has no tasks left
+CREATE TRIGGER IF NOT EXISTS sessions_on_task_delete
+    AFTER DELETE ON tasks
+    FOR EACH ROW
+    BEGIN
+        DELETE FROM sessions
+        WHERE session_id = OLD.session_id
+            AND NOT EXISTS (SELECT 1 FROM tasks WHERE session_id = OLD.session_id);
+        UPDATE sessions SET
+            task_count = (SELECT COUNT(*) FROM tasks WHERE session_id = OLD.session_id),
+            created_at = (SELECT MIN(created_at) FROM tasks WHERE session_id = OLD.session_id),
+            last_activity = (SELECT MAX(created_at) FROM tasks WHERE session_id = OLD.session_id),
+            latest_status = (SELECT status FROM tasks WHERE session_id = OLD.session_id
+                ORDER BY created_at DESC LIMIT 1),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE session_id = OLD.session_id;
+    END;
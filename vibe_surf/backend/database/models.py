@@ -4,7 +4,7 @@ Database Models for VibeSurf Backend - With LLM Profile Management
 SQLAlchemy models for task execution system with LLM profile management.
 """
 
-from sqlalchemy import Column, String, Text, DateTime, Enum, JSON, Boolean, Index, BigInteger
+from sqlalchemy import Column, String, Text, DateTime, Enum, JSON, Boolean, Index, BigInteger, Integer
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
 from datetime import datetime
@@ -135,6 +135,24 @@ class Task(Base):
     def __repr__(self):
         return f"<Task(task_id={self.task_id}, status={self.status.value}, llm_profile={self.llm_profile_name})>"
 
+class SessionSummary(Base):
+    """Per-session summary of tasks, maintained by database triggers on the tasks table"""
+    __tablename__ = 'sessions'
+
+    session_id = Column(String(36), primary_key=True)
+    title = Column(Text, nullable=True)  # Description of the first task
+    task_count = Column(Integer, nullable=False, default=0)
+
+    # Activity window, from the first and latest task's created_at
+    created_at = Column(DateTime, nullable=False, default=func.now())
+    last_activity = Column(DateTime, nullable=False, default=func.now())
+    latest_status = Column(Enum(TaskStatus, values_callable=lambda obj: [e.value for e in obj]), nullable=True)
+
+    updated_at = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<SessionSummary(session_id={self.session_id}, task_count={self.task_count})>"
+
 class UploadedFile(Base):
     """Model for tracking uploaded files"""
     __tablename__ = "uploaded_files"
@@ -161,10 +179,13 @@ Index('idx_llm_profiles_default', LLMProfile.is_default)
 Index('idx_llm_profiles_provider', LLMProfile.provider)
 
 Index('idx_tasks_status', Task.status)
-Index('idx_tasks_session', Task.session_id)
-Index('idx_tasks_llm_profile', Task.llm_profile_name)
+Index('idx_tasks_session_created', Task.session_id, Task.created_at, Task.status)
+Index('idx_tasks_llm_profile_created', Task.llm_profile_name, Task.created_at)
 Index('idx_tasks_created', Task.created_at)
 
+# Session summary indexes
+Index('idx_sessions_last_activity', SessionSummary.last_activity, SessionSummary.session_id)
+
 class McpProfile(Base):
     """MCP Profile model for managing MCP server configurations"""
     __tablename__ = 'mcp_profiles'
@@ -4,11 +4,12 @@ Database Query Operations for VibeSurf Backend - With LLM Profile Management
 Centralized database operations for Task and LLMProfile tables.
 """
 import pdb
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func, desc, and_, or_
+from sqlalchemy import select, update, delete, func, desc, and_, or_, type_coerce, String, text
 from sqlalchemy.orm import selectinload
-from .models import Task, TaskStatus, LLMProfile, UploadedFile, McpProfile, VoiceProfile, VoiceModelType, ComposioToolkit, Credential, Schedule, WorkflowSkill
+from .models import Task, TaskStatus, SessionSummary, LLMProfile, UploadedFile, McpProfile, VoiceProfile, VoiceModelType, ComposioToolkit, Credential, Schedule, WorkflowSkill
 from ..utils.encryption import encrypt_api_key, decrypt_api_key
 import logging
 import json
@@ -17,6 +18,9 @@ from vibe_surf.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Database URL -> whether the v010 triggers keep the sessions table up to date
+_session_triggers_by_url: Dict[str, bool] = {}
+
 
 class LLMProfileQueries:
     """Query operations for LLMProfile model"""
@@ -572,18 +576,32 @@ class TaskQueries:
     async def get_all_sessions(
             db: AsyncSession,
             limit: int = -1,
-            offset: int = 0
+            offset: int = 0,
+            cursor: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        """Get all unique sessions with task counts and metadata"""
+        """
+        Get all sessions with task counts and metadata, most recent first
+
+        Reads the trigger-maintained sessions table, or aggregates the tasks table
+        where those triggers are not installed. Pass the `cursor` of the last
+        returned session to get the next page without scanning skipped rows.
+        """
         try:
-            # Get distinct session_ids with aggregated data
-            query = select(
-                Task.session_id,
-                func.count(Task.task_id).label('task_count'),
-                func.min(Task.created_at).label('created_at'),
-                func.max(Task.created_at).label('last_activity'),
-                func.max(Task.status).label('latest_status')
-            ).group_by(Task.session_id).order_by(desc(func.max(Task.created_at)))
+            if not await TaskQueries._sessions_table_maintained(db):
+                return await TaskQueries._aggregate_sessions(db, limit, offset, cursor)
+
+            query = select(SessionSummary).order_by(
+                desc(SessionSummary.last_activity), desc(SessionSummary.session_id)
+            )
+
+            if cursor:
+                last_activity, session_id = TaskQueries.decode_session_cursor(cursor)
+                # Compare against the stored text so the index on last_activity is used
+                last_activity = type_coerce(last_activity, String)
+                query = query.where(or_(
+                    SessionSummary.last_activity < last_activity,
+                    and_(SessionSummary.last_activity == last_activity, SessionSummary.session_id < session_id)
+                ))
 
             # Handle -1 as "get all records"
             if limit != -1:
@@ -596,13 +614,15 @@ class TaskQueries:
             result = await db.execute(query)
 
             sessions = []
-            for row in result.all():
+            for session in result.scalars().all():
                 sessions.append({
-                    'session_id': row.session_id,
-                    'task_count': row.task_count,
-                    'created_at': row.created_at.isoformat() if row.created_at else None,
-                    'last_activity': row.last_activity.isoformat() if row.last_activity else None,
-                    'status': row.latest_status.value if row.latest_status else 'unknown'
+                    'session_id': session.session_id,
+                    'title': session.title,
+                    'task_count': session.task_count,
+                    'created_at': session.created_at.isoformat() if session.created_at else None,
+                    'last_activity': session.last_activity.isoformat() if session.last_activity else None,
+                    'status': session.latest_status.value if session.latest_status else 'unknown',
+                    'cursor': TaskQueries.encode_session_cursor(session.last_activity, session.session_id)
                 })
 
             return sessions
@@ -610,6 +630,94 @@ class TaskQueries:
             logger.error(f"Failed to get all sessions: {e}")
             raise
 
+    @staticmethod
+    async def _sessions_table_maintained(db: AsyncSession) -> bool:
+        """Whether the sessions table is kept up to date by the v010 migration triggers"""
+        bind = db.get_bind()
+        url = str(bind.url)
+        maintained = _session_triggers_by_url.get(url)
+        if maintained is None:
+            # Tables created through the create_all fallback or on other databases have no triggers
+            maintained = False
+            if bind.dialect.name == 'sqlite':
+                result = await db.execute(text(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'sessions_on_task_insert'"
+                ))
+                maintained = result.first() is not None
+            if not maintained:
+                logger.info("Sessions table is not trigger-maintained, listing sessions from the tasks table")
+            _session_triggers_by_url[url] = maintained
+        return maintained
+
+    @staticmethod
+    async def _aggregate_sessions(
+            db: AsyncSession,
+            limit: int = -1,
+            offset: int = 0,
+            cursor: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Build session summaries by grouping the tasks table"""
+        first_task = Task.__table__.alias('first_task')
+        latest_task = Task.__table__.alias('latest_task')
+        title = select(func.substr(first_task.c.task_description, 1, 200)).where(
+            first_task.c.session_id == Task.session_id
+        ).order_by(first_task.c.created_at.asc()).limit(1).correlate(Task).scalar_subquery()
+        latest_status = select(latest_task.c.status).where(
+            latest_task.c.session_id == Task.session_id
+        ).order_by(latest_task.c.created_at.desc()).limit(1).correlate(Task).scalar_subquery()
+        last_activity = func.max(Task.created_at)
+
+        query = select(
+            Task.session_id,
+            title.label('title'),
+            func.count(Task.task_id).label('task_count'),
+            func.min(Task.created_at).label('created_at'),
+            last_activity.label('last_activity'),
+            latest_status.label('latest_status')
+        ).group_by(Task.session_id).order_by(desc(last_activity), desc(Task.session_id))
+
+        if cursor:
+            cursor_activity, session_id = TaskQueries.decode_session_cursor(cursor)
+            cursor_activity = type_coerce(cursor_activity, String)
+            query = query.having(or_(
+                type_coerce(last_activity, String) < cursor_activity,
+                and_(type_coerce(last_activity, String) == cursor_activity, Task.session_id < session_id)
+            ))
+
+        if limit != -1:
+            query = query.limit(limit)
+        if offset > 0:
+            query = query.offset(offset)
+
+        result = await db.execute(query)
+
+        sessions = []
+        for row in result.all():
+            status = row.latest_status
+            sessions.append({
+                'session_id': row.session_id,
+                'title': row.title,
+                'task_count': row.task_count,
+                'created_at': row.created_at.isoformat() if row.created_at else None,
+                'last_activity': row.last_activity.isoformat() if row.last_activity else None,
+                'status': (status.value if isinstance(status, TaskStatus) else status) or 'unknown',
+                'cursor': TaskQueries.encode_session_cursor(row.last_activity, row.session_id)
+            })
+
+        return sessions
+
+    @staticmethod
+    def encode_session_cursor(last_activity: datetime, session_id: str) -> str:
+        """Build the keyset pagination cursor for a session"""
+        # str() matches SQLite's "YYYY-MM-DD HH:MM:SS" storage format
+        return f"{last_activity}|{session_id}"
+
+    @staticmethod
+    def decode_session_cursor(cursor: str) -> Tuple[str, str]:
+        """Split a cursor produced by encode_session_cursor"""
+        last_activity, _, session_id = cursor.partition("|")
+        return last_activity, session_id
+
     @staticmethod
     async def update_task_status(
             db: AsyncSession,
@@ -708,7 +816,8 @@ class TaskQueries:
             task_result: Optional[str] = None,
             task_status: str = "completed",
             error_message: Optional[str] = None,
-            report_path: Optional[str] = None
+            report_path: Optional[str] = None,
+            task_metadata: Optional[Dict[str, Any]] = None
     ) -> bool:
         """Update task completion status and results"""
         try:
@@ -723,6 +832,8 @@ class TaskQueries:
                 update_data['error_message'] = error_message
             if report_path is not None:
                 update_data['report_path'] = report_path
+            if task_metadata is not None:
+                update_data['task_metadata'] = task_metadata
 
             result = await db.execute(
                 update(Task).where(Task.task_id == task_id).values(**update_data)
@@ -14,6 +14,8 @@ class TaskMetadata(BaseModel):
     # Execution summary
     execution_duration_seconds: Optional[float] = None
     total_actions: Optional[int] = None
+    # Time per agent and step phase, see vibe_surf.telemetry.metrics
+    timing_summary: Optional[Dict[str, Any]] = None
     
     # Results summary
     generated_report_path: Optional[str] = None
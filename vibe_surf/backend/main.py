@@ -378,6 +378,9 @@ def get_lifespan():
 
             await shared_state.shutdown_schedule_manager()
 
+            from .api.vibesurf import close_dashboard_http_client
+            await close_dashboard_http_client()
+
             # Capture telemetry shutdown event
             telemetry = ProductTelemetry()
             import vibe_surf
@@ -480,8 +483,8 @@ def get_lifespan():
 
             logger.info("VibeSurf Backend API stopped")
 
-            # Flush telemetry before shutdown
-            telemetry.flush()
+            # Deliver buffered telemetry before shutdown
+            telemetry.shutdown()
 
     return lifespan
 
@@ -663,6 +666,14 @@ def create_app() -> FastAPI:
             "version": "2.0.0"
         }
 
+    @app.get("/metrics")
+    async def agent_metrics():
+        """Agent step timing histograms in Prometheus text format"""
+        from vibe_surf.telemetry.metrics import render_metrics
+
+        content, content_type = render_metrics()
+        return Response(content=content, media_type=content_type)
+
     # Session ID generation endpoint
     @app.get("/generate-session-id")
     async def generate_session_id(prefix: str = ""):
@@ -695,6 +706,7 @@ def create_app() -> FastAPI:
             "system_status": "operational",
             "active_task": task_info,
             "langflow_status": langflow_status,
+            "components_ready": shared_state.get_startup_status(),
             "timestamp": datetime.now().isoformat()
         }
 
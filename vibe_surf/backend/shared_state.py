@@ -5,13 +5,14 @@ Contains global state variables shared between main.py and routers
 to avoid circular import issues.
 """
 import pdb
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Set, Tuple
 from datetime import datetime, timezone
 import logging
 import os
 import json
 import platform
 import asyncio
+import heapq
 from pathlib import Path
 from composio import Composio
 from composio_langchain import LangchainProvider
@@ -31,6 +32,8 @@ from vibe_surf.llm.openai_compatible import ChatOpenAICompatible
 from vibe_surf.browser.agent_browser_session import AgentBrowserSession
 from vibe_surf.browser.agen_browser_profile import AgentBrowserProfile
 from vibe_surf.logger import get_logger
+from vibe_surf.telemetry.metrics import get_task_timings, track_task_timings
+from vibe_surf.tools.blob_store import get_blob_store
 
 logger = get_logger(__name__)
 
@@ -56,12 +59,75 @@ envs: Dict[str, str] = {}
 # MCP server management
 active_mcp_server: Dict[str, str] = {}  # Dict[mcp_id: mcp_server_name]
 
+# Composio toolkit configuration revision. The toolkit API endpoints bump it after changing
+# enabled toolkits, their tools or the Composio instance; tasks re-sync tools only when it moved.
+composio_toolkit_revision: int = 0
+_applied_composio_revision: Optional[int] = None
+
 # Workflow skills management - workflow_id: {name, description, workflow_expose_config}
 workflow_skills: Dict[str, Dict[str, Any]] = {}
 
 # Single task execution tracking
 active_task: Optional[Dict[str, Any]] = None
 
+# Startup steps that finish in the background after the backend starts serving.
+# Code that needs one of them waits with wait_for_components().
+BACKGROUND_COMPONENTS = ("mcp", "composio", "workflow_skills")
+COMPONENT_READY_TIMEOUT = 120
+_component_ready: Dict[str, asyncio.Event] = {name: asyncio.Event() for name in BACKGROUND_COMPONENTS}
+_startup_tasks: Set[asyncio.Task] = set()
+
+
+def is_component_ready(name: str) -> bool:
+    return _component_ready[name].is_set()
+
+
+def get_startup_status() -> Dict[str, bool]:
+    """Readiness of each background startup component"""
+    return {name: event.is_set() for name, event in _component_ready.items()}
+
+
+async def wait_for_components(*names: str, timeout: float = COMPONENT_READY_TIMEOUT) -> bool:
+    """
+    Wait until the named background components have finished loading
+
+    Returns:
+        False if they were not ready within timeout; the caller then goes on without them
+    """
+    pending = [name for name in names if not _component_ready[name].is_set()]
+    if not pending:
+        return True
+    logger.info(f"⏳ Waiting for startup components: {pending}")
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*(_component_ready[name].wait() for name in pending)),
+            timeout=timeout
+        )
+        return True
+    except asyncio.TimeoutError:
+        logger.warning(f"Startup components not ready after {timeout}s: "
+                       f"{[name for name in pending if not _component_ready[name].is_set()]}")
+        return False
+
+
+def _start_background_component(name: str, coro):
+    """Run a startup step in the background and mark its component ready when it ends, also on failure"""
+    _component_ready[name].clear()
+
+    async def run():
+        try:
+            await coro
+            logger.info(f"✅ Startup component ready: {name}")
+        except Exception as e:
+            logger.error(f"❌ Failed to load startup component {name}: {e}")
+        finally:
+            _component_ready[name].set()
+
+    task = asyncio.create_task(run())
+    _startup_tasks.add(task)
+    task.add_done_callback(_startup_tasks.discard)
+    return task
+
 
 def get_all_components():
     """Get all components as a dictionary"""
@@ -122,6 +188,17 @@ def set_components(**kwargs):
         workflow_skills = kwargs["workflow_skills"]
 
 
+def _task_timing_metadata(task_id: str) -> Optional[Dict[str, Any]]:
+    """Task metadata holding the timing summary of a finished task"""
+    timing_summary = get_task_timings(task_id)
+    if not timing_summary:
+        return None
+    return {
+        "execution_duration_seconds": timing_summary["wall_seconds"],
+        "timing_summary": timing_summary,
+    }
+
+
 async def execute_task_background(
         task_id: str,
         session_id: str,
@@ -137,6 +214,9 @@ async def execute_task_background(
     try:
         current_llm_profile_name = llm_profile_name
 
+        # Let MCP servers and Composio tools finish registering before the task can use them
+        await wait_for_components("mcp", "composio")
+
         # Check if MCP server configuration needs update
         await _check_and_update_mcp_servers(db_session)
 
@@ -163,13 +243,16 @@ async def execute_task_background(
         if vibesurf_agent:
             vibesurf_agent.workspace_dir = workspace_dir
 
-        # Execute the task
-        result = await vibesurf_agent.run(
-            task=task,
-            upload_files=upload_files,
-            session_id=session_id,
-            agent_mode=agent_mode
-        )
+        # Execute the task, collecting where its time goes
+        with track_task_timings(task_id) as task_timings:
+            result = await vibesurf_agent.run(
+                task=task,
+                upload_files=upload_files,
+                session_id=session_id,
+                agent_mode=agent_mode
+            )
+            if active_task and active_task.get("status") == "stopped":
+                task_timings.status = "stopped"
 
         # Update task status to completed
         if active_task and active_task.get("status") != "stopped":
@@ -200,7 +283,8 @@ async def execute_task_background(
                     task_id=task_id,
                     task_result=result,
                     task_status=active_task.get("status", "completed") if active_task else "completed",
-                    report_path=report_path
+                    report_path=report_path,
+                    task_metadata=_task_timing_metadata(task_id)
                 )
                 await db_session.commit()
             except Exception as e:
@@ -227,7 +311,8 @@ async def execute_task_background(
                     task_id=task_id,
                     task_result=None,
                     task_status="failed",
-                    error_message=str(e)
+                    error_message=str(e),
+                    task_metadata=_task_timing_metadata(task_id)
                 )
                 await db_session.commit()
             except Exception as e:
@@ -253,6 +338,13 @@ def get_active_task_info() -> Optional[Dict[str, Any]]:
     return active_task.copy() if active_task else None
 
 
+def bump_composio_toolkit_revision() -> int:
+    """Mark the Composio toolkit configuration as changed, so the next task re-syncs its tools"""
+    global composio_toolkit_revision
+    composio_toolkit_revision += 1
+    return composio_toolkit_revision
+
+
 def clear_active_task():
     """Clear the active task (used when stopping)"""
     global active_task
@@ -296,54 +388,47 @@ async def _check_and_update_mcp_servers(db_session):
 
 
 async def _check_and_update_composio_tools(db_session):
-    """Check if Composio tools configuration has changed and update tools if needed"""
-    global vibesurf_tools, composio_instance
+    """Re-sync Composio tools if the toolkit configuration changed since they were registered"""
+    global vibesurf_tools, composio_instance, _applied_composio_revision
 
     try:
-        if not db_session:
+        if not db_session or _applied_composio_revision == composio_toolkit_revision:
             return
+        revision = composio_toolkit_revision
 
         from .database.queries import ComposioToolkitQueries
 
         # Get current enabled Composio toolkits from database
         enabled_toolkits = await ComposioToolkitQueries.get_enabled_toolkits(db_session)
+        current_toolkit_tools = _parse_toolkit_tools(enabled_toolkits)
 
-        # Build toolkit_tools_dict from enabled toolkits
-        current_toolkit_tools = {}
-        for toolkit in enabled_toolkits:
-            if toolkit.tools:
-                try:
-                    tools_data = json.loads(toolkit.tools)
-                    current_toolkit_tools[toolkit.slug] = tools_data
-                except (json.JSONDecodeError, TypeError) as e:
-                    logger.warning(f"Failed to parse tools for toolkit {toolkit.slug}: {e}")
-
-        # Check if Composio tools need to be updated
-        tools_changed = False
-        if vibesurf_tools and vibesurf_tools.composio_client:
-            # Compare current tools with registered tools
-            if vibesurf_tools.composio_client._toolkit_tools != current_toolkit_tools:
-                tools_changed = True
-        elif current_toolkit_tools:
-            # No composio client but we have enabled tools - need to register
-            tools_changed = True
-
-        if tools_changed:
-            logger.info(f"Composio tools configuration changed. Updating tools...")
-            logger.info(f"New toolkit tools: {list(current_toolkit_tools.keys())}")
-
-            # Update Composio tools in vibesurf_tools
-            if vibesurf_tools:
-                await vibesurf_tools.update_composio_tools(
-                    composio_instance=composio_instance,
-                    toolkit_tools_dict=current_toolkit_tools
-                )
-                logger.info("✅ Composio tools configuration updated successfully")
+        logger.info(f"Composio toolkit configuration changed (revision {revision}). Updating tools...")
+        logger.info(f"Enabled toolkits: {list(current_toolkit_tools.keys())}")
+
+        # Only tools that were added, removed or changed are re-registered
+        if vibesurf_tools and await vibesurf_tools.sync_composio_tools(
+                composio_instance=composio_instance,
+                toolkit_tools_dict=current_toolkit_tools
+        ):
+            _applied_composio_revision = revision
+            logger.info("✅ Composio tools configuration updated successfully")
 
     except Exception as e:
         logger.error(f"Failed to check and update Composio tools: {e}")
 
 
+def _parse_toolkit_tools(enabled_toolkits) -> Dict[str, Any]:
+    """Build toolkit_tools_dict from enabled toolkits"""
+    toolkit_tools_dict = {}
+    for toolkit in enabled_toolkits:
+        if toolkit.tools:
+            try:
+                toolkit_tools_dict[toolkit.slug] = json.loads(toolkit.tools)
+            except (json.JSONDecodeError, TypeError) as e:
+                logger.warning(f"Failed to parse tools for toolkit {toolkit.slug}: {e}")
+    return toolkit_tools_dict
+
+
 async def _build_mcp_server_config(active_profiles) -> Dict[str, Any]:
     """Build MCP server configuration from active profiles"""
     mcp_server_config = {
@@ -407,16 +492,7 @@ async def _load_enabled_composio_toolkits():
             try:
                 # Get all enabled Composio toolkits
                 enabled_toolkits = await ComposioToolkitQueries.get_enabled_toolkits(db)
-
-                # Build toolkit_tools_dict from enabled toolkits
-                toolkit_tools_dict = {}
-                for toolkit in enabled_toolkits:
-                    if toolkit.tools:
-                        try:
-                            tools_data = json.loads(toolkit.tools)
-                            toolkit_tools_dict[toolkit.slug] = tools_data
-                        except (json.JSONDecodeError, TypeError) as e:
-                            logger.warning(f"Failed to parse tools for toolkit {toolkit.slug}: {e}")
+                toolkit_tools_dict = _parse_toolkit_tools(enabled_toolkits)
 
                 logger.info(
                     f"✅ Loaded {len(toolkit_tools_dict)} enabled Composio toolkits: {list(toolkit_tools_dict.keys())}")
@@ -463,6 +539,9 @@ async def _load_workflow_skills():
                 # Update shared state
                 workflow_skills = loaded_skills.copy()
 
+                from .utils.workflow_index import rebuild_workflow_index
+                rebuild_workflow_index(workflow_skills)
+
                 logger.info(f"✅ Loaded {len(workflow_skills)} workflow skills: {list(workflow_skills.keys())}")
 
                 return workflow_skills
@@ -478,7 +557,8 @@ async def _load_workflow_skills():
 
 async def load_composio():
     # Load and register Composio tools from enabled toolkits
-    global composio_instance
+    global composio_instance, _applied_composio_revision
+    revision = composio_toolkit_revision
     from .api.composio import _get_composio_api_key_from_db
     api_key = await _get_composio_api_key_from_db()
     if api_key:
@@ -493,12 +573,55 @@ async def load_composio():
             logger.error(f"Failed to create Composio instance: {e}")
             composio_instance = None
     toolkit_tools_dict = await _load_enabled_composio_toolkits()
-    if toolkit_tools_dict:
-        await vibesurf_tools.register_composio_clients(
+    if await vibesurf_tools.sync_composio_tools(
             composio_instance=composio_instance,
             toolkit_tools_dict=toolkit_tools_dict
-        )
-        logger.info(f"✅ Registered Composio tools from {len(toolkit_tools_dict)} enabled toolkits")
+    ):
+        _applied_composio_revision = revision
+        if toolkit_tools_dict:
+            logger.info(f"✅ Registered Composio tools from {len(toolkit_tools_dict)} enabled toolkits")
+
+
+async def _register_active_mcp_servers():
+    """Load active MCP servers from database and register their tools"""
+    mcp_server_config = await _load_active_mcp_servers()
+    vibesurf_tools.mcp_server_config = mcp_server_config
+
+    # Register MCP clients if there are any active MCP servers
+    if mcp_server_config and mcp_server_config.get("mcpServers"):
+        await vibesurf_tools.register_mcp_clients()
+        logger.info(f"✅ Registered {len(mcp_server_config['mcpServers'])} MCP servers")
+
+
+async def _start_main_browser_session(backend_url: str) -> AgentBrowserSession:
+    """Start the main browser, or reuse the running one"""
+    if browser_manager:
+        return browser_manager.main_browser_session
+
+    from screeninfo import get_monitors
+    primary_monitor = get_monitors()[0]
+    _update_extension_backend_url(envs["VIBESURF_EXTENSION"], backend_url)
+
+    # Get headless mode from environment variable (set by CLI --headless flag)
+    headless_mode = os.getenv("BROWSER_HEADLESS", "false").lower() == "true"
+    if headless_mode:
+        logger.info("🖥️  Browser running in headless mode")
+
+    browser_profile = AgentBrowserProfile(
+        executable_path=browser_execution_path,
+        user_data_dir=browser_user_data,
+        headless=headless_mode,
+        keep_alive=True,
+        auto_download_pdfs=False,
+        highlight_elements=False,
+        custom_extensions=[envs["VIBESURF_EXTENSION"]],
+        window_size={"width": primary_monitor.width, "height": primary_monitor.height}
+    )
+
+    # Initialize components
+    main_browser_session = AgentBrowserSession(browser_profile=browser_profile)
+    await main_browser_session.start()
+    return main_browser_session
 
 
 async def initialize_vibesurf_components():
@@ -595,59 +718,33 @@ async def initialize_vibesurf_components():
 
         db_manager = DatabaseManager(database_url)
 
-        # Initialize database tables with migration support
-        await db_manager.create_tables(use_migrations=True)
-        logger.info("✅ Database manager initialized successfully")
-
-        # Initialize LLM from default profile (if available) or fallback to environment variables
-        llm = await _initialize_default_llm()
-
-        # Load active MCP servers from database
-        mcp_server_config = await _load_active_mcp_servers()
-
-        # Initialize vibesurf tools with MCP server config
-        vibesurf_tools = VibeSurfTools(mcp_server_config=mcp_server_config)
-
-        # Register MCP clients if there are any active MCP servers
-        if mcp_server_config and mcp_server_config.get("mcpServers"):
-            await vibesurf_tools.register_mcp_clients()
-            logger.info(f"✅ Registered {len(mcp_server_config['mcpServers'])} MCP servers")
-        load_composio_task = asyncio.create_task(load_composio())
-        
-        # Load workflow skills from database in background
-        load_skills_task = asyncio.create_task(_load_workflow_skills())
-        
-        # Initialize browser manager
-        if browser_manager:
-            main_browser_session = browser_manager.main_browser_session
-        else:
-            from screeninfo import get_monitors
-            primary_monitor = get_monitors()[0]
-            _update_extension_backend_url(envs["VIBESURF_EXTENSION"], backend_url)
-
-            # Get headless mode from environment variable (set by CLI --headless flag)
-            headless_mode = os.getenv("BROWSER_HEADLESS", "false").lower() == "true"
-            if headless_mode:
-                logger.info("🖥️  Browser running in headless mode")
-
-            browser_profile = AgentBrowserProfile(
-                executable_path=browser_execution_path,
-                user_data_dir=browser_user_data,
-                headless=headless_mode,
-                keep_alive=True,
-                auto_download_pdfs=False,
-                highlight_elements=False,
-                custom_extensions=[envs["VIBESURF_EXTENSION"]],
-                window_size={"width": primary_monitor.width, "height": primary_monitor.height}
-            )
+        async def init_database_and_llm():
+            # Initialize database tables with migration support
+            await db_manager.create_tables(use_migrations=True)
+            logger.info("✅ Database manager initialized successfully")
+
+            # Initialize LLM from default profile (if available) or fallback to environment variables
+            return await _initialize_default_llm()
+
+        # The database and the browser do not depend on each other, so they start together
+        llm, main_browser_session, _ = await asyncio.gather(
+            init_database_and_llm(),
+            _start_main_browser_session(backend_url),
+            # Drop stored upload contents whose files were deleted with their sessions
+            asyncio.to_thread(get_blob_store(workspace_dir).collect_garbage),
+        )
+
+        # MCP servers, Composio tools and workflow skills load in the background, so a
+        # slow server does not hold up startup. Tasks wait for them with wait_for_components().
+        vibesurf_tools = VibeSurfTools(mcp_server_config={"mcpServers": {}})
+        _start_background_component("mcp", _register_active_mcp_servers())
+        _start_background_component("composio", load_composio())
+        _start_background_component("workflow_skills", _load_workflow_skills())
 
-            # Initialize components
-            main_browser_session = AgentBrowserSession(browser_profile=browser_profile)
-            await main_browser_session.start()
         browser_manager = BrowserManager(
             main_browser_session=main_browser_session
         )
-        
+
         # Initialize VibeSurfAgent
         vibesurf_agent = VibeSurfAgent(
             llm=llm,
@@ -808,14 +905,58 @@ def _update_extension_backend_url(extension_path: str, backend_url: str):
 
 
 class ScheduleManager:
-    """Manager for handling scheduled workflow execution"""
-
-    def __init__(self):
+    """
+    Manager for handling scheduled workflow execution
+
+    Keeps a heap of next fire times and sleeps exactly until the earliest one;
+    `reload_schedules` wakes the loop immediately. Due flows are run in-process
+    with at most `max_concurrent_runs` flows executing at once.
+
+    Overlap policies (when a flow fires while a previous run is still going):
+        - "skip": drop the new run
+        - "queue": run after the previous run finishes
+        - "parallel": run alongside the previous run
+
+    Catch-up policies (when next_execution_at was missed, e.g. backend was down):
+        - "skip": do not run, schedule the next fire time
+        - "run_once": run once immediately if missed by less than `misfire_grace_seconds`
+    """
+
+    OVERLAP_POLICIES = ("skip", "queue", "parallel")
+    CATCHUP_POLICIES = ("skip", "run_once")
+
+    # Upper bound on a single sleep so wall clock changes are picked up
+    MAX_SLEEP_SECONDS = 300
+
+    def __init__(
+            self,
+            max_concurrent_runs: Optional[int] = None,
+            overlap_policy: Optional[str] = None,
+            catchup_policy: Optional[str] = None,
+            misfire_grace_seconds: Optional[int] = None,
+    ):
         self.schedules = {}  # Dict[flow_id, schedule_dict]
         self.running = False
-        self.check_interval = 60  # Check every minute
         self._task = None
 
+        self.max_concurrent_runs = max_concurrent_runs or int(os.getenv("VIBESURF_SCHEDULE_MAX_CONCURRENT", "4"))
+        self.overlap_policy = overlap_policy or os.getenv("VIBESURF_SCHEDULE_OVERLAP_POLICY", "skip")
+        self.catchup_policy = catchup_policy or os.getenv("VIBESURF_SCHEDULE_CATCHUP_POLICY", "skip")
+        self.misfire_grace_seconds = misfire_grace_seconds or int(
+            os.getenv("VIBESURF_SCHEDULE_MISFIRE_GRACE_SECONDS", "3600"))
+        if self.overlap_policy not in self.OVERLAP_POLICIES:
+            raise ValueError(f"Unknown schedule overlap policy: {self.overlap_policy}")
+        if self.catchup_policy not in self.CATCHUP_POLICIES:
+            raise ValueError(f"Unknown schedule catch-up policy: {self.catchup_policy}")
+
+        # (fire_time, generation, flow_id); entries with an outdated generation are ignored
+        self._heap: List[Tuple[datetime, int, str]] = []
+        self._generations: Dict[str, int] = {}
+        self._wakeup = asyncio.Event()
+        self._run_slots = asyncio.Semaphore(self.max_concurrent_runs)
+        self._flow_locks: Dict[str, asyncio.Lock] = {}
+        self._active_runs: Dict[str, Set[asyncio.Task]] = {}
+
     async def start(self):
         """Start the schedule manager"""
         if self.running:
@@ -829,16 +970,53 @@ class ScheduleManager:
     async def stop(self):
         """Stop the schedule manager"""
         self.running = False
+        self._wakeup.set()
         if self._task and not self._task.done():
             self._task.cancel()
             try:
                 await self._task
             except asyncio.CancelledError:
                 pass
+
+        runs = [run for flow_runs in self._active_runs.values() for run in flow_runs]
+        for run in runs:
+            run.cancel()
+        if runs:
+            await asyncio.gather(*runs, return_exceptions=True)
         logger.info("Schedule manager stopped")
 
+    @staticmethod
+    def _compute_next_execution(cron_expr: str, base_time: Optional[datetime] = None) -> datetime:
+        """Next fire time (UTC) of a cron expression evaluated in local time, strictly after base_time"""
+        local_base = (base_time or datetime.now(timezone.utc)).astimezone()
+        cron = croniter(cron_expr, local_base)
+        local_next = cron.get_next(datetime)
+        # Make sure the result has timezone info
+        if local_next.tzinfo is None:
+            local_next = local_next.replace(tzinfo=local_base.tzinfo)
+        # Convert to UTC for storage
+        return local_next.astimezone(timezone.utc)
+
+    @staticmethod
+    def _as_utc(value) -> Optional[datetime]:
+        """Parse a stored timestamp into an aware UTC datetime"""
+        if not value:
+            return None
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value
+
+    def _push(self, flow_id: str, fire_time: datetime):
+        """Schedule the next fire of a flow, replacing any earlier entry"""
+        generation = self._generations.get(flow_id, 0) + 1
+        self._generations[flow_id] = generation
+        heapq.heappush(self._heap, (fire_time, generation, flow_id))
+        self._wakeup.set()
+
     async def reload_schedules(self):
-        """Reload schedules from the database"""
+        """Reload schedules from the database and wake the schedule loop"""
         try:
             global db_manager
             if not db_manager:
@@ -864,45 +1042,48 @@ class ScheduleManager:
 
                 now = datetime.now(timezone.utc)
                 self.schedules = {}
+                self._heap = []
+                self._generations = {}
+                fire_times = {}
 
                 for schedule in schedules:
                     logger.info(f"Loading flow: {schedule.flow_id} into schedule")
 
-                    # Check if next_execution_at is in the past and recalculate if needed
-                    next_execution = schedule.next_execution_at
-                    if next_execution:
-                        if isinstance(next_execution, str):
-                            next_execution = datetime.fromisoformat(next_execution.replace('Z', '+00:00'))
-                        if next_execution.tzinfo is None:
-                            next_execution = next_execution.replace(tzinfo=timezone.utc)
-
-                        # If next_execution is in the past, recalculate it
-                        if next_execution < now:
-                            logger.info(
-                                f"Schedule for flow {schedule.flow_id} has expired next_execution_at ({next_execution}), recalculating...")
-                            try:
-                                local_now = datetime.now().astimezone()
-                                cron = croniter(schedule.cron_expression, local_now)
-                                local_next = cron.get_next(datetime)
-                                if local_next.tzinfo is None:
-                                    local_next = local_next.replace(tzinfo=local_now.tzinfo)
-                                next_execution = local_next.astimezone(timezone.utc)
-
-                                # Update in database
-                                await session.execute(
-                                    update(Schedule)
-                                    .where(Schedule.flow_id == schedule.flow_id)
-                                    .values(
-                                        next_execution_at=next_execution,
-                                        updated_at=now
-                                    )
-                                )
+                    next_execution = self._as_utc(schedule.next_execution_at)
+                    fire_time = next_execution
+                    try:
+                        if next_execution is None:
+                            next_execution = self._compute_next_execution(schedule.cron_expression, now)
+                            fire_time = next_execution
+                        elif next_execution < now:
+                            # Missed run: optionally catch up once, then continue on the cron cadence
+                            missed_by = (now - next_execution).total_seconds()
+                            if self.catchup_policy == "run_once" and missed_by <= self.misfire_grace_seconds:
+                                logger.info(
+                                    f"Schedule for flow {schedule.flow_id} missed {next_execution}, catching up now")
+                                fire_time = now
+                            else:
                                 logger.info(
-                                    f"Updated next_execution_at for flow {schedule.flow_id} to {next_execution}")
-                            except (ValueError, TypeError) as e:
-                                logger.error(
-                                    f"Failed to recalculate next_execution_at for flow {schedule.flow_id}: {e}")
-                                next_execution = None
+                                    f"Schedule for flow {schedule.flow_id} has expired next_execution_at ({next_execution}), recalculating...")
+                                next_execution = self._compute_next_execution(schedule.cron_expression, now)
+                                fire_time = next_execution
+
+                            # Update in database
+                            await session.execute(
+                                update(Schedule)
+                                .where(Schedule.flow_id == schedule.flow_id)
+                                .values(
+                                    next_execution_at=next_execution,
+                                    updated_at=now
+                                )
+                            )
+                            logger.info(
+                                f"Updated next_execution_at for flow {schedule.flow_id} to {next_execution}")
+                    except (ValueError, TypeError, KeyError) as e:
+                        logger.error(
+                            f"Failed to calculate next_execution_at for flow {schedule.flow_id}: {e}")
+                        next_execution = None
+                        fire_time = None
 
                     schedule_dict = {
                         'id': schedule.id,
@@ -917,10 +1098,16 @@ class ScheduleManager:
                         'updated_at': schedule.updated_at
                     }
                     self.schedules[schedule.flow_id] = schedule_dict
+                    if fire_time:
+                        fire_times[schedule.flow_id] = fire_time
 
                 # Commit all updates
                 await session.commit()
 
+                for flow_id, fire_time in fire_times.items():
+                    self._push(flow_id, fire_time)
+                self._wakeup.set()
+
                 logger.info(f"✅ Successfully reloaded {len(self.schedules)} active schedules")
                 break  # Exit after processing to avoid multiple iterations
 
@@ -931,131 +1118,137 @@ class ScheduleManager:
             logger.error(f"Schedule reload traceback: {traceback.format_exc()}")
 
     async def _schedule_loop(self):
-        """Main schedule checking loop"""
+        """Sleep until the earliest fire time (or a schedule change) and dispatch due flows"""
         while self.running:
             try:
-                await self._check_and_execute_schedules()
-                await asyncio.sleep(self.check_interval)
+                self._wakeup.clear()
+                now = datetime.now(timezone.utc)
+
+                # Dispatch every due entry, dropping outdated ones
+                while self._heap and self._heap[0][0] <= now:
+                    fire_time, generation, flow_id = heapq.heappop(self._heap)
+                    if self._generations.get(flow_id) != generation or flow_id not in self.schedules:
+                        continue
+                    await self._dispatch_schedule(flow_id, fire_time)
+
+                timeout = self.MAX_SLEEP_SECONDS
+                if self._heap:
+                    timeout = min(timeout, max((self._heap[0][0] - datetime.now(timezone.utc)).total_seconds(), 0))
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Error in schedule loop: {e}")
-                await asyncio.sleep(self.check_interval)
+                await asyncio.sleep(1)
 
-    async def _check_and_execute_schedules(self):
-        """Check for schedules that need to be executed"""
+    async def _dispatch_schedule(self, flow_id: str, fire_time: datetime):
+        """Start a run of a due flow according to the overlap policy and schedule its next fire"""
+        schedule = self.schedules[flow_id]
+        active_runs = self._active_runs.setdefault(flow_id, set())
         now = datetime.now(timezone.utc)
 
-        for flow_id, schedule in self.schedules.items():
-            try:
-                # Check if it's time to execute this schedule
-                if await self._should_execute_schedule(schedule, now):
-                    await self._execute_scheduled_flow(flow_id, schedule)
-
-            except Exception as e:
-                logger.error(f"Error checking schedule for flow {flow_id}: {e}")
-
-    async def _should_execute_schedule(self, schedule: dict, now: datetime) -> bool:
-        """Check if a schedule should be executed now"""
+        # Schedule the next fire before persisting it, so a failed database write cannot
+        # leave the past fire time in place and re-dispatch the flow in a tight loop
+        cron_expr = schedule.get('cron_expression')
+        next_execution = None
         try:
-            cron_expr = schedule.get('cron_expression')
-            if not cron_expr:
-                return False
-
-            # Check if we have a next execution time
-            next_execution_str = schedule.get('next_execution_at')
-            if not next_execution_str:
-                # Calculate and update next execution time
-                await self._update_next_execution_time(schedule['flow_id'], cron_expr)
-                return False
-
-            # Parse next execution time
-            if isinstance(next_execution_str, str):
-                next_execution = datetime.fromisoformat(next_execution_str.replace('Z', '+00:00'))
-            else:
-                next_execution = next_execution_str
-
-            # Make sure next_execution is timezone-aware
-            if next_execution.tzinfo is None:
-                next_execution = next_execution.replace(tzinfo=timezone.utc)
-
-            # Check for minimum execution interval (prevent rapid re-execution)
-            last_execution = schedule.get('last_execution_at')
-            if last_execution:
-                if isinstance(last_execution, str):
-                    last_execution = datetime.fromisoformat(last_execution.replace('Z', '+00:00'))
-                if last_execution.tzinfo is None:
-                    last_execution = last_execution.replace(tzinfo=timezone.utc)
-
-                # Prevent execution if less than 30 seconds have passed
-                min_interval = 30  # seconds
-                if (now - last_execution).total_seconds() < min_interval:
-                    return False
-
-            # Check if it's time to execute (with a small buffer for timing precision)
-            return now >= next_execution
-
-        except Exception as e:
-            logger.error(f"Error checking schedule execution time: {e}")
-            return False
+            next_execution = self._compute_next_execution(cron_expr, max(now, fire_time or now))
+            logger.info(f"Next execution for flow {flow_id}: {next_execution} UTC")
+        except (ValueError, TypeError, KeyError):
+            logger.error(f"Invalid cron expression for flow {flow_id}: {cron_expr}")
+
+        old_next = schedule.get('next_execution_at')
+        schedule.update({
+            'next_execution_at': next_execution,
+            'updated_at': now
+        })
+        logger.debug(f"Next execution for flow {flow_id} changed from {old_next} to {next_execution}")
+        if next_execution:
+            self._push(flow_id, next_execution)
+
+        if active_runs and self.overlap_policy == "skip":
+            logger.warning(f"Skipping scheduled run of flow {flow_id}: previous run is still in progress")
+            if next_execution:
+                await self._update_next_execution_time(flow_id, next_execution, now)
+        else:
+            schedule.update({
+                'last_execution_at': now,
+                'execution_count': (schedule.get('execution_count') or 0) + 1
+            })
+            run = asyncio.create_task(self._execute_scheduled_flow(flow_id, schedule))
+            active_runs.add(run)
+            run.add_done_callback(active_runs.discard)
+            await self._update_execution_tracking(flow_id, next_execution, now)
+
+    async def _run_flow(self, flow_id: str):
+        """Run a flow in-process through Langflow, as the superuser"""
+        from uuid import UUID
+        from .database.queries import CredentialQueries
+        from .api.vibesurf import validate_vibesurf_api_key
+        from vibe_surf.langflow.api.v1.endpoints import simple_run_flow
+        from vibe_surf.langflow.api.v1.flows import _read_flow
+        from vibe_surf.langflow.api.v1.schemas import SimplifiedAPIRequest
+        from vibe_surf.langflow.services.auth.utils import create_super_user
+        from vibe_surf.langflow.services.deps import session_scope, get_settings_service
+
+        # Same gate as the build endpoint
+        async for db_session in db_manager.get_session():
+            stored_key = await CredentialQueries.get_credential(db_session, 'VIBESURF_API_KEY')
+            if not stored_key or not validate_vibesurf_api_key(stored_key):
+                raise RuntimeError("Please configure correct VIBESURF_API_KEY first!")
+            break
+
+        settings_service = get_settings_service()
+        username = settings_service.auth_settings.SUPERUSER
+        password = settings_service.auth_settings.SUPERUSER_PASSWORD
+
+        async with session_scope() as langflow_session:
+            current_user = await create_super_user(db=langflow_session, username=username, password=password)
+            db_flow = await _read_flow(session=langflow_session, flow_id=UUID(flow_id), user_id=current_user.id)
+            if not db_flow:
+                raise RuntimeError(f"Flow with id {flow_id} not found")
+
+        input_request = SimplifiedAPIRequest(
+            input_value=None,
+            input_type="chat",
+            output_type="any",
+        )
+        await simple_run_flow(
+            flow=db_flow,
+            input_request=input_request,
+            stream=False,
+            api_key_user=current_user,
+        )
 
     async def _execute_scheduled_flow(self, flow_id: str, schedule: dict):
         """Execute a scheduled flow"""
+        flow_lock = None
+        if self.overlap_policy == "queue":
+            flow_lock = self._flow_locks.setdefault(flow_id, asyncio.Lock())
+            await flow_lock.acquire()
         try:
-            logger.info(f"Executing scheduled flow: {flow_id}")
-
-            # Import here to avoid circular imports
-            import httpx
-
-            # Get backend URL from environment
-            backend_port = os.getenv("VIBESURF_BACKEND_PORT", "9335")
-            backend_url = f"http://127.0.0.1:{backend_port}"
-
-            # Make API call to execute the flow
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{backend_url}/api/v1/build/{flow_id}/flow",
-                    json={}  # Empty request body for now
-                )
-
-                if response.status_code == 200:
-                    logger.info(f"Successfully triggered scheduled flow {flow_id}")
-                else:
-                    logger.error(f"Failed to trigger scheduled flow {flow_id}: {response.status_code} {response.text}")
-
-            # Update execution tracking
-            await self._update_execution_tracking(flow_id, schedule)
-
+            async with self._run_slots:
+                logger.info(f"Executing scheduled flow: {flow_id}")
+                await self._run_flow(flow_id)
+                logger.info(f"Successfully executed scheduled flow {flow_id}")
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             logger.error(f"Error executing scheduled flow {flow_id}: {e}")
+        finally:
+            if flow_lock:
+                flow_lock.release()
 
-    async def _update_execution_tracking(self, flow_id: str, schedule: dict):
-        """Update execution tracking in the database"""
+    async def _update_execution_tracking(self, flow_id: str, next_execution: Optional[datetime], now: datetime):
+        """Persist a dispatched run and the next execution time to the database"""
         try:
             global db_manager
             if not db_manager:
                 return
 
-            now = datetime.now(timezone.utc)
-
-            # Calculate next execution time using local timezone
-            cron_expr = schedule.get('cron_expression')
-            next_execution = None
-            if cron_expr:
-                try:
-                    local_now = datetime.now().astimezone()
-                    cron = croniter(cron_expr, local_now)
-                    local_next = cron.get_next(datetime)
-                    # Make sure the result has timezone info
-                    if local_next.tzinfo is None:
-                        local_next = local_next.replace(tzinfo=local_now.tzinfo)
-                    # Convert to UTC for storage
-                    next_execution = local_next.astimezone(timezone.utc)
-                    logger.info(
-                        f"Updated next execution for flow {flow_id}: {next_execution} UTC (local: {local_next})")
-                except (ValueError, TypeError):
-                    logger.error(f"Invalid cron expression for flow {flow_id}: {cron_expr}")
-
             async for session in db_manager.get_session():
                 # Import Schedule model
                 from .database.models import Schedule
@@ -1073,49 +1266,18 @@ class ScheduleManager:
                 )
 
                 await session.commit()
-
-                # Update local schedule cache AFTER successful database update
-                if flow_id in self.schedules:
-                    old_next = self.schedules[flow_id].get('next_execution_at')
-                    self.schedules[flow_id].update({
-                        'last_execution_at': now,
-                        'next_execution_at': next_execution,
-                        'execution_count': schedule.get('execution_count', 0) + 1,
-                        'updated_at': now
-                    })
-                    logger.info(
-                        f"Local cache updated for flow {flow_id}: next_execution changed from {old_next} to {next_execution}")
-                else:
-                    logger.warning(f"Flow {flow_id} not found in local cache during execution tracking update")
-
                 break  # Exit after processing to avoid multiple iterations
 
         except Exception as e:
             logger.error(f"Error updating execution tracking for flow {flow_id}: {e}")
 
-    async def _update_next_execution_time(self, flow_id: str, cron_expr: str):
-        """Update next execution time for a schedule"""
+    async def _update_next_execution_time(self, flow_id: str, next_execution: datetime, now: datetime):
+        """Persist the next execution time of a schedule to the database"""
         try:
             global db_manager
             if not db_manager:
                 return
 
-            now = datetime.now(timezone.utc)
-
-            try:
-                local_now = datetime.now().astimezone()
-                cron = croniter(cron_expr, local_now)
-                local_next = cron.get_next(datetime)
-                # Make sure the result has timezone info
-                if local_next.tzinfo is None:
-                    local_next = local_next.replace(tzinfo=local_now.tzinfo)
-                # Convert to UTC for storage
-                next_execution = local_next.astimezone(timezone.utc)
-                logger.info(f"Calculated next execution for flow {flow_id}: {next_execution} UTC (local: {local_next})")
-            except (ValueError, TypeError):
-                logger.error(f"Invalid cron expression for flow {flow_id}: {cron_expr}")
-                return
-
             async for session in db_manager.get_session():
                 # Import Schedule model
                 from .database.models import Schedule
@@ -1131,19 +1293,6 @@ class ScheduleManager:
                 )
 
                 await session.commit()
-
-                # Update local schedule cache AFTER successful database update
-                if flow_id in self.schedules:
-                    old_next = self.schedules[flow_id].get('next_execution_at')
-                    self.schedules[flow_id].update({
-                        'next_execution_at': next_execution,
-                        'updated_at': now
-                    })
-                    logger.info(
-                        f"Local cache updated for flow {flow_id}: next_execution changed from {old_next} to {next_execution}")
-                else:
-                    logger.warning(f"Flow {flow_id} not found in local cache during next execution time update")
-
                 break  # Exit after processing to avoid multiple iterations
 
         except Exception as e:
@@ -11,7 +11,7 @@ from browser_use.llm import (
     ChatGroq, ChatOllama, ChatOpenRouter, ChatDeepSeek,
     ChatAWSBedrock, ChatAnthropicBedrock
 )
-from vibe_surf.llm import ChatOpenAICompatible
+from vibe_surf.llm import ChatOpenAICompatible, enable_llm_cache
 
 from ..llm_config import get_supported_providers, is_provider_supported
 
@@ -21,7 +21,14 @@ logger = get_logger(__name__)
 
 
 def create_llm_from_profile(llm_profile) -> BaseChatModel:
-    """Create LLM instance from LLMProfile database record (dict or object)"""
+    """Create LLM instance from LLMProfile database record (dict or object)
+
+    Identical concurrent requests are coalesced and deterministic ones are cached, see vibe_surf.llm.cache.
+    """
+    return enable_llm_cache(_create_llm(llm_profile))
+
+
+def _create_llm(llm_profile) -> BaseChatModel:
     try:
 
         # Handle both dict and object access patterns
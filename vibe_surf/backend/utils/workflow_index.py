@@ -0,0 +1,225 @@
+"""
+Workflow Index - Ranked keyword search over workflow skills
+
+Builds an inverted index over the names, descriptions and exposed component
+inputs of the configured workflow skills and ranks matches with BM25. The
+index also precomputes the adjustable parameters and the markdown blocks
+that search results are rendered from, so a lookup does not walk or
+re-serialize every workflow.
+"""
+
+import math
+import re
+import threading
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from vibe_surf.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Repeat name tokens so that a match in the workflow name outranks one in a
+# component description
+NAME_WEIGHT = 3
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_CJK_RE = re.compile(r"[一-鿿぀-ヿ가-힯]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens, plus character bigrams for CJK runs"""
+    if not text:
+        return []
+    text = str(text).lower()
+    tokens = _WORD_RE.findall(text)
+    for run in _CJK_RE.findall(text):
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def _exposed_parameters(workflow_expose_config: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Collect the exposed inputs of each component"""
+    adjustable_parameters = {}
+    for component_id, component_data in (workflow_expose_config or {}).items():
+        inputs = component_data.get('inputs', {})
+        exposed_inputs = {k: v for k, v in inputs.items() if v.get('is_expose', False)}
+        if not exposed_inputs:
+            continue
+
+        adjustable_parameters[component_id] = {
+            "component_name": component_data.get('component_name', component_id),
+            "inputs": {
+                input_name: {
+                    "display_name": input_data.get('display_name', input_name),
+                    "type": input_data.get('type', 'str'),
+                    "info": input_data.get('info', ''),
+                    "current_value": input_data.get('value', '')
+                }
+                for input_name, input_data in exposed_inputs.items()
+            }
+        }
+    return adjustable_parameters
+
+
+def _format_parameters(adjustable_parameters: Dict[str, Dict[str, Any]]) -> str:
+    """Render adjustable parameters as markdown"""
+    if not adjustable_parameters:
+        return "**No adjustable parameters configured**\n\n"
+
+    text = "**Adjustable Parameters:**\n\n"
+    for component_id, component in adjustable_parameters.items():
+        text += f"- **{component['component_name']}** (`{component_id}`):\n"
+        for input_name, input_data in component["inputs"].items():
+            text += f"  - `{input_name}` ({input_data['display_name']})\n"
+            text += f"    - Type: {input_data['type']}\n"
+            if input_data['info']:
+                text += f"    - Description: {input_data['info']}\n"
+            text += f"    - Current/Default Value: {input_data['current_value']}\n"[:100]
+    return text
+
+
+class WorkflowEntry:
+    """Precomputed search and display data of a single workflow"""
+
+    def __init__(self, flow_id: str, workflow_data: Dict[str, Any]):
+        self.flow_id = flow_id
+        self.name = workflow_data.get('name') or 'Unnamed Workflow'
+        self.description = workflow_data.get('description') or 'No description'
+        self.adjustable_parameters = _exposed_parameters(workflow_data.get('workflow_expose_config', {}))
+
+        self.summary = (
+            f"## @flow-{flow_id[-4:]}: {self.name}\n\n"
+            f"**Full ID:** {flow_id}\n\n"
+            f"**Description:** {self.description}\n\n"
+        )
+        self.parameters_text = _format_parameters(self.adjustable_parameters)
+
+        tokens = tokenize(workflow_data.get('name', '')) * NAME_WEIGHT
+        tokens += tokenize(workflow_data.get('description', ''))
+        for component in self.adjustable_parameters.values():
+            tokens += tokenize(component["component_name"])
+            for input_name, input_data in component["inputs"].items():
+                tokens += tokenize(input_name)
+                tokens += tokenize(input_data["display_name"])
+                tokens += tokenize(input_data["info"])
+        self.term_freqs = Counter(tokens)
+        self.length = len(tokens)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "workflow_id": self.flow_id,
+            "name": self.name,
+            "description": self.description,
+            "adjustable_parameters": self.adjustable_parameters
+        }
+
+
+class WorkflowIndex:
+    """
+    Inverted index with BM25 ranking over workflow skills
+
+    Example:
+        >>> index = get_workflow_index(workflow_skills)
+        >>> for entry, score in index.search("stock, report", top_k=5):
+        ...     print(entry.summary)
+    """
+
+    def __init__(self, workflow_skills: Dict[str, Dict[str, Any]]):
+        self.entries: Dict[str, WorkflowEntry] = {}
+        self.postings: Dict[str, Dict[str, int]] = defaultdict(dict)
+        for flow_id, workflow_data in workflow_skills.items():
+            entry = WorkflowEntry(flow_id, workflow_data)
+            self.entries[flow_id] = entry
+            for term, freq in entry.term_freqs.items():
+                self.postings[term][flow_id] = freq
+
+        self.avg_length = (
+            sum(entry.length for entry in self.entries.values()) / len(self.entries)
+            if self.entries else 0.0
+        )
+        self.signature = _signature(workflow_skills)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, flow_id: str) -> Optional[WorkflowEntry]:
+        return self.entries.get(flow_id)
+
+    def find_by_suffix(self, suffix: str) -> Optional[WorkflowEntry]:
+        """Look up a workflow by the trailing digits of its ID"""
+        for flow_id, entry in self.entries.items():
+            if flow_id.endswith(suffix):
+                return entry
+        return None
+
+    def all(self) -> List[WorkflowEntry]:
+        return list(self.entries.values())
+
+    def _expand_term(self, term: str) -> List[str]:
+        """Map a query term to indexed terms, falling back to substring matches on the vocabulary"""
+        if term in self.postings:
+            return [term]
+        return [indexed for indexed in self.postings if term in indexed]
+
+    def search(self, key_words: str, top_k: Optional[int] = None) -> List[Tuple[WorkflowEntry, float]]:
+        """
+        Rank workflows against comma- or space-separated keywords
+
+        Args:
+            key_words: Keywords to search for
+            top_k: Maximum number of results, all matches when None
+
+        Returns:
+            (entry, score) pairs ordered by descending score
+        """
+        query_terms = set()
+        for keyword in key_words.split(','):
+            query_terms.update(tokenize(keyword))
+
+        n_docs = len(self.entries)
+        scores: Dict[str, float] = defaultdict(float)
+        for query_term in query_terms:
+            for term in self._expand_term(query_term):
+                postings = self.postings[term]
+                idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                for flow_id, freq in postings.items():
+                    length_norm = 1 - BM25_B + BM25_B * self.entries[flow_id].length / (self.avg_length or 1)
+                    scores[flow_id] += idf * freq * (BM25_K1 + 1) / (freq + BM25_K1 * length_norm)
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        if top_k is not None:
+            ranked = ranked[:top_k]
+        return [(self.entries[flow_id], score) for flow_id, score in ranked]
+
+
+def _signature(workflow_skills: Dict[str, Dict[str, Any]]) -> tuple:
+    # Workflow skills are replaced with new dicts whenever they change, so
+    # object identity is enough to notice updates
+    return id(workflow_skills), tuple((flow_id, id(data)) for flow_id, data in workflow_skills.items())
+
+
+_workflow_index: Optional[WorkflowIndex] = None
+_workflow_index_lock = threading.Lock()
+
+
+def rebuild_workflow_index(workflow_skills: Dict[str, Dict[str, Any]]) -> WorkflowIndex:
+    """Build the workflow index from scratch, call after loading or changing workflow skills"""
+    global _workflow_index
+    index = WorkflowIndex(workflow_skills)
+    with _workflow_index_lock:
+        _workflow_index = index
+    logger.debug(f"Indexed {len(index)} workflow skills ({len(index.postings)} terms)")
+    return index
+
+
+def get_workflow_index(workflow_skills: Dict[str, Dict[str, Any]]) -> WorkflowIndex:
+    """Return the workflow index, rebuilding it if the workflow skills changed since it was built"""
+    index = _workflow_index
+    if index is None or index.signature != _signature(workflow_skills):
+        index = rebuild_workflow_index(workflow_skills)
+    return index
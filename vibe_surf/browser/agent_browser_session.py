@@ -18,6 +18,7 @@ from browser_use.browser.profile import BrowserProfile
 from browser_use.browser.views import BrowserStateSummary
 from browser_use.dom.views import TargetInfo
 from vibe_surf.browser.agen_browser_profile import AgentBrowserProfile
+from vibe_surf.telemetry.metrics import timed_phase
 from typing import Self
 from uuid_extensions import uuid7str
 import httpx
@@ -841,11 +842,12 @@ class AgentBrowserSession(BrowserSession):
                 self.logger.debug('⚠️ Cached browser state has 0 interactive elements, fetching fresh state')
             # Fall through to fetch fresh state
 
-        browser_state = await self._dom_watchdog.get_browser_state_no_event_bus(
-            include_dom=True,
-            include_screenshot=include_screenshot,
-            include_recent_events=include_recent_events
-        )
+        with timed_phase('browser_state'):
+            browser_state = await self._dom_watchdog.get_browser_state_no_event_bus(
+                include_dom=True,
+                include_screenshot=include_screenshot,
+                include_recent_events=include_recent_events
+            )
         return browser_state
 
     @observe_debug(ignore_input=True, ignore_output=True, name='get_tabs')
@@ -20,6 +20,74 @@ from vibe_surf.logger import get_logger
 
 logger = get_logger(__name__)
 
+VISIBILITY_BINDING = '__vibesurfVisibilityChanged'
+
+# Reports the page's visibility to the manager through a CDP binding as "<reason>:<state>",
+# where reason is "initial" (script installed), "change" (tab switched) or "focus" (page has focus)
+VISIBILITY_SCRIPT = """
+(() => {
+    if (window.__vibesurfVisibilityWatch || typeof window.%(binding)s !== 'function') {
+        return;
+    }
+    window.__vibesurfVisibilityWatch = true;
+    const report = (reason) => {
+        try {
+            window.%(binding)s(reason + ':' + (document.hidden ? 'hidden' : document.visibilityState));
+        } catch (e) {}
+    };
+    document.addEventListener('visibilitychange', () => report('change'));
+    window.addEventListener('focus', () => report('focus'));
+    report(document.hasFocus() ? 'focus' : 'initial');
+})();
+""" % {'binding': VISIBILITY_BINDING}
+
+
+class TargetOwnerPool(dict):
+    """CDP session pool of an agent that records its targets in the manager's target-to-owner index."""
+
+    def __init__(self, agent_id: str, owners: Dict[str, str], *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.agent_id = agent_id
+        self.owners = owners
+        for target_id in self:
+            self.owners[target_id] = agent_id
+
+    def _release(self, target_id: str):
+        if self.owners.get(target_id) == self.agent_id:
+            del self.owners[target_id]
+
+    def __setitem__(self, target_id, session):
+        super().__setitem__(target_id, session)
+        self.owners[target_id] = self.agent_id
+
+    def __delitem__(self, target_id):
+        super().__delitem__(target_id)
+        self._release(target_id)
+
+    def pop(self, target_id, *default):
+        if target_id in self:
+            self._release(target_id)
+        return super().pop(target_id, *default)
+
+    def popitem(self):
+        target_id, session = super().popitem()
+        self._release(target_id)
+        return target_id, session
+
+    def setdefault(self, target_id, session=None):
+        if target_id not in self:
+            self[target_id] = session
+        return self[target_id]
+
+    def update(self, *args, **kwargs):
+        for target_id, session in dict(*args, **kwargs).items():
+            self[target_id] = session
+
+    def clear(self):
+        for target_id in list(self):
+            self._release(target_id)
+        super().clear()
+
 
 class BrowserManager:
     """Manages isolated browser sessions for multiple agents with enhanced security."""
@@ -30,6 +98,18 @@ class BrowserManager:
         # Store a list of sessions for each agent
         self._agent_sessions: Dict[str, AgentBrowserSession] = {}
 
+        # Target registry kept current by CDP target and visibility events
+        self._target_owners: Dict[str, str] = {}
+        self._page_targets: Dict[str, TargetInfo] = {}
+        self._visibility_sessions: Dict[str, str] = {}
+        self._visible_targets: Set[str] = set()
+        self._active_target_id: Optional[str] = None
+        self._tracking_client: Optional[CDPClient] = None
+        # Root client of the main session when tracking started, to notice reconnects
+        self._tracking_root_client: Optional[CDPClient] = None
+        self._tracking_lock = asyncio.Lock()
+        self._tracking_tasks: Set[asyncio.Task] = set()
+
     @property
     def _root_cdp_client(self) -> Optional[CDPClient]:
         """Get the root CDP client from the shared browser session."""
@@ -64,6 +144,9 @@ class BrowserManager:
                 main_browser_session=self.main_browser_session,
             )
             agent_session._cdp_client_root = await self._get_root_cdp_client()
+            agent_session._cdp_session_pool = TargetOwnerPool(
+                agent_id, self._target_owners, agent_session.get_cdp_session_pool()
+            )
             logger.info(f"🚀 Starting agent session for {agent_id} to initialize watchdogs...")
             await agent_session.start()
 
@@ -159,14 +242,16 @@ class BrowserManager:
 
     def get_target_owner(self, target_id: str) -> Optional[str]:
         """Get the agent ID that owns a specific target."""
-        for agent_id in self._agent_sessions:
-            agent_target_ids = self.get_agent_target_ids(agent_id)
-            if target_id in agent_target_ids:
-                return agent_id
+        agent_id = self._target_owners.get(target_id)
+        agent_session = self._agent_sessions.get(agent_id) if agent_id else None
+        if agent_session is not None and target_id in agent_session.get_cdp_session_pool():
+            return agent_id
         return None
 
     async def close(self) -> None:
         """Close all agent sessions but preserve the shared browser session."""
+        await self._stop_target_tracking()
+
         # Unregister all agents first
         agent_ids = list(self._agent_sessions.keys())
         for agent_id in agent_ids:
@@ -200,9 +285,174 @@ class BrowserManager:
                 logger.error(f"Connect failed: {e}")
         return False
 
+    def _track_task(self, coro):
+        task = asyncio.create_task(coro)
+        self._tracking_tasks.add(task)
+        task.add_done_callback(self._tracking_tasks.discard)
+
+    def _is_tab_target(self, target_info: TargetInfo) -> bool:
+        return self.main_browser_session._is_valid_target(
+            target_info, include_http=True, include_about=True, include_pages=True,
+            include_iframes=False, include_workers=False
+        )
+
+    def _is_tracking_current(self) -> bool:
+        """Whether the tracking connection is open and belongs to the main session's current connection."""
+        client = self._tracking_client
+        if client is None:
+            return False
+        if self._root_cdp_client is not self._tracking_root_client:
+            return False
+        message_task = getattr(client, '_message_handler_task', None)
+        if message_task is not None and message_task.done():
+            return False
+        ws = getattr(client, 'ws', None)
+        if ws is not None:
+            state = getattr(ws, 'state', None)
+            if getattr(ws, 'closed', False) or getattr(state, 'name', None) in ('CLOSING', 'CLOSED'):
+                return False
+        return True
+
+    async def _ensure_target_tracking(self) -> bool:
+        """Start following target and visibility events on a dedicated CDP connection."""
+        if self._is_tracking_current():
+            return True
+
+        async with self._tracking_lock:
+            if self._is_tracking_current():
+                return True
+            if self._tracking_client is not None:
+                # The websocket closed or the main session reconnected, so the registry may be stale
+                logger.debug("Browser target tracking connection lost, restarting it")
+                await self._stop_target_tracking()
+            try:
+                root_client = await self._get_root_cdp_client()
+                client = CDPClient(self.main_browser_session.cdp_url)
+                await client.start()
+
+                client.register.Target.targetCreated(self._on_target_created)
+                client.register.Target.targetInfoChanged(self._on_target_info_changed)
+                client.register.Target.targetDestroyed(self._on_target_destroyed)
+                client.register.Target.detachedFromTarget(self._on_detached_from_target)
+                client.register.Runtime.bindingCalled(self._on_binding_called)
+                await client.send.Target.setDiscoverTargets(params={'discover': True})
+
+                targets = await client.send.Target.getTargets()
+                self._tracking_client = client
+                self._tracking_root_client = root_client
+                for target_info in targets.get('targetInfos', []):
+                    self._on_target_created({'targetInfo': target_info})
+                logger.debug(f"Tracking {len(self._page_targets)} browser tabs via CDP events")
+                return True
+            except Exception as e:
+                logger.warning(f"Failed to start browser target tracking: {e}")
+                return False
+
+    async def _stop_target_tracking(self):
+        client, self._tracking_client = self._tracking_client, None
+        self._tracking_root_client = None
+        for task in list(self._tracking_tasks):
+            task.cancel()
+        self._page_targets.clear()
+        self._visibility_sessions.clear()
+        self._visible_targets.clear()
+        self._active_target_id = None
+        if client is not None:
+            try:
+                await client.stop()
+            except Exception as e:
+                logger.debug(f"Error stopping target tracking client: {e}")
+
+    async def _watch_target_visibility(self, target_id: str):
+        """Attach to a tab and report its visibility changes through a binding."""
+        client = self._tracking_client
+        if client is None:
+            return
+        try:
+            attached = await client.send.Target.attachToTarget(params={'targetId': target_id, 'flatten': True})
+            session_id = attached['sessionId']
+            self._visibility_sessions[session_id] = target_id
+            await client.send.Runtime.addBinding(params={'name': VISIBILITY_BINDING}, session_id=session_id)
+            await client.send.Page.addScriptToEvaluateOnNewDocument(
+                params={'source': VISIBILITY_SCRIPT}, session_id=session_id
+            )
+            await client.send.Runtime.evaluate(params={'expression': VISIBILITY_SCRIPT}, session_id=session_id)
+            await client.send.Runtime.runIfWaitingForDebugger(session_id=session_id)
+        except Exception as e:
+            logger.debug(f"Could not watch visibility of target {target_id}: {e}")
+
+    def _on_target_created(self, event: dict, session_id: Optional[str] = None):
+        target_info = event['targetInfo']
+        if not self._is_tab_target(target_info):
+            return
+        target_id = target_info['targetId']
+        if target_id in self._page_targets:
+            # setDiscoverTargets and the getTargets that follows both report existing tabs
+            return
+        self._page_targets[target_id] = target_info
+        if self._active_target_id is None:
+            self._active_target_id = target_id
+        self._track_task(self._watch_target_visibility(target_id))
+
+    def _on_target_info_changed(self, event: dict, session_id: Optional[str] = None):
+        target_info = event['targetInfo']
+        target_id = target_info['targetId']
+        if target_id in self._page_targets:
+            if self._is_tab_target(target_info):
+                self._page_targets[target_id] = target_info
+            else:
+                self._page_targets.pop(target_id, None)
+        elif self._is_tab_target(target_info):
+            self._on_target_created(event)
+
+    def _on_target_destroyed(self, event: dict, session_id: Optional[str] = None):
+        self._forget_target(event['targetId'])
+
+    def _on_detached_from_target(self, event: dict, session_id: Optional[str] = None):
+        self._visibility_sessions.pop(event.get('sessionId'), None)
+
+    def _on_binding_called(self, event: dict, session_id: Optional[str] = None):
+        if event.get('name') != VISIBILITY_BINDING:
+            return
+        target_id = self._visibility_sessions.get(session_id)
+        if target_id is None:
+            return
+        reason, _, state = str(event.get('payload', '')).partition(':')
+        if state != 'visible':
+            self._visible_targets.discard(target_id)
+            return
+        self._visible_targets.add(target_id)
+        if reason in ('change', 'focus'):
+            self._active_target_id = target_id
+        elif self._active_target_id not in self._visible_targets:
+            # Every window's front tab reports visible when first watched; keep the first
+            # one unless the page has focus, instead of whichever reported last
+            self._active_target_id = target_id
+
+    def _forget_target(self, target_id: str):
+        self._page_targets.pop(target_id, None)
+        self._visible_targets.discard(target_id)
+        for session_id, watched_target_id in list(self._visibility_sessions.items()):
+            if watched_target_id == target_id:
+                del self._visibility_sessions[session_id]
+        if self._active_target_id == target_id:
+            self._active_target_id = next(iter(self._page_targets), None)
+
     async def _get_active_target(self) -> str:
         """Get current focused target, or an available target, or create a new one."""
-        tab_infos = await self.get_all_tabs()
+        if not await self._ensure_target_tracking():
+            return await self._poll_active_target()
+
+        if self._active_target_id is None:
+            self._active_target_id = next(iter(self._page_targets), None)
+        if self._active_target_id is None:
+            self._active_target_id = await self.main_browser_session.navigate_to_url(
+                url="chrome://newtab/", new_tab=True)
+        return self._active_target_id
+
+    async def _poll_active_target(self) -> str:
+        """Find the focused target by asking every tab, used when target tracking is unavailable."""
+        tab_infos = await self.main_browser_session.get_tabs()
         # 1. Check for a focused page among ALL pages (not just unassigned)
         for tab_info in tab_infos:
             target_id = tab_info.target_id
@@ -246,7 +496,6 @@ class BrowserManager:
             active_target_id = await self._get_active_target()
             if active_target_id is None:
                 return None
-            # Get target information from CDP
             tab_infos = await self.get_all_tabs()
 
             # Find the active target in the targets list
@@ -264,5 +513,12 @@ class BrowserManager:
             return None
 
     async def get_all_tabs(self) -> list[TabInfo]:
-        tabs = await self.main_browser_session.get_tabs()
+        if not await self._ensure_target_tracking():
+            return await self.main_browser_session.get_tabs()
+
+        tabs = []
+        for target_id, target_info in self._page_targets.items():
+            url = target_info.get('url', '')
+            title = target_info.get('title', '') or url
+            tabs.append(TabInfo(url=url, title=title, target_id=target_id))
         return tabs
@@ -1,19 +1,824 @@
 import asyncio
+import json
 import logging
 import pdb
 import re
+from collections import OrderedDict, defaultdict
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-import aiofiles
-
 if TYPE_CHECKING:
     from browser_use.actor.page import Page
 
 from vibe_surf.logger import get_logger
 from vibe_surf.browser.agent_browser_session import AgentBrowserSession
+from vibe_surf.browser.page_scripts import PersistentPageScript
 
 logger = get_logger(__name__)
 
+# Installed once per document. It keeps a map of interactive elements that a
+# MutationObserver keeps current, so later lookups only transfer the elements
+# that changed since the previous call.
+SEMANTIC_MAP_SCRIPT = r"""
+(() => {
+    // Registered scripts also run in every iframe; only the top document is mapped
+    if (window !== window.top || window.__vibesurfSemanticMap) {
+        return;
+    }
+
+    const debugMode = false;
+
+    function debugMessage(msg, data = null) {
+        if (debugMode) {
+            console.log('[SEMANTIC_DEBUG]', msg, data);
+        }
+    }
+
+    // Enhanced selector for complex UI widgets
+    const interactiveSelectors = [
+        'button', 'input', 'select', 'textarea', 'a[href]',
+        '[role="button"]', '[role="link"]', '[role="tab"]', '[role="menuitem"]',
+        '[role="option"]', '[role="checkbox"]', '[role="radio"]',
+        '[role="combobox"]', '[role="listbox"]', '[role="slider"]',
+        '[role="spinbutton"]', '[role="searchbox"]', '[role="switch"]',
+        '[onclick]', '[onchange]', '[onsubmit]',
+        // Calendar and date picker elements
+        '[role="gridcell"]', '[role="calendar"]', '[role="datepicker"]',
+        '.calendar-day', '.date-picker', '.day', '.month', '.year',
+        '[data-date]', '[data-day]', '[data-month]', '[data-year]',
+        // Dropdown and menu elements
+        '[role="menu"]', '[role="menubar"]', '[role="menuitem"]',
+        '.dropdown', '.menu-item', '.option', '.select-option',
+        '[data-value]', '[data-option]',
+        // Dynamic content elements
+        '[data-testid]', '[data-cy]', '[data-qa]',
+        // Flight/travel specific elements
+        '.flight-option', '.price', '.select-flight', '.book-now',
+        '[data-flight]', '[data-price]', '.fare-option'
+    ].join(', ');
+
+    // Attributes that can change an element's description or visibility
+    const observedAttributes = [
+        'id', 'class', 'style', 'hidden', 'name', 'type', 'role', 'value', 'href',
+        'title', 'placeholder', 'disabled', 'aria-label', 'aria-hidden', 'aria-expanded',
+        'aria-selected', 'data-value', 'data-date', 'data-testid'
+    ];
+
+    // Above this many pending mutation roots a full rescan is cheaper
+    const maxDirtyNodes = 500;
+
+
+    // Enhanced context extraction functions with error handling
+    function safeGetWidgetType(el) {
+        try {
+            // Detect widget types based on various indicators
+            const role = el.getAttribute('role') || '';
+            const className = (el.className || '').toString().toLowerCase();
+            const tagName = el.tagName.toLowerCase();
+            const dataAttrs = Array.from(el.attributes || [])
+                .filter(attr => attr.name && attr.name.startsWith('data-'))
+                .map(attr => attr.name);
+
+            // Calendar detection
+            if (role === 'gridcell' || role === 'calendar' || 
+                className.includes('calendar') || className.includes('date') ||
+                dataAttrs.some(attr => attr.includes('date') || attr.includes('day'))) {
+                return 'calendar';
+            }
+
+            // Dropdown detection
+            if (role === 'option' || role === 'menuitem' || role === 'combobox' ||
+                className.includes('dropdown') || className.includes('option') ||
+                className.includes('menu')) {
+                return 'dropdown';
+            }
+
+            // Flight/booking specific
+            if (className.includes('flight') || className.includes('select') ||
+                className.includes('book') || className.includes('fare') ||
+                dataAttrs.some(attr => attr.includes('flight') || attr.includes('price'))) {
+                return 'booking';
+            }
+
+            // Form controls
+            if (tagName === 'input' || tagName === 'select' || tagName === 'textarea') {
+                return 'form';
+            }
+
+            // Navigation/action buttons
+            if (tagName === 'button' || role === 'button' || tagName === 'a') {
+                return 'action';
+            }
+
+            return 'generic';
+        } catch (error) {
+            debugMessage('Error in safeGetWidgetType', { element: el.tagName, error: error.message });
+            return 'error';
+        }
+    }
+
+    function safeGetCalendarContext(el) {
+        try {
+            const context = {};
+
+            // Try to find date information
+            const dateAttr = el.getAttribute('data-date') || 
+                           el.getAttribute('data-day') ||
+                           el.getAttribute('aria-label');
+
+            if (dateAttr) {
+                context.date_value = dateAttr;
+            }
+
+            // Find calendar container
+            const calendar = el.closest('[role="calendar"], .calendar, .date-picker, .datepicker');
+            if (calendar) {
+                context.calendar_type = calendar.className || 'calendar';
+
+                // Try to determine if it's departure or return date
+                const calendarContainer = calendar.closest('[data-testid], [class*="depart"], [class*="return"]');
+                if (calendarContainer) {
+                    const containerClass = (calendarContainer.className || '').toLowerCase();
+                    if (containerClass.includes('depart')) {
+                        context.date_type = 'departure';
+                    } else if (containerClass.includes('return')) {
+                        context.date_type = 'return';
+                    }
+                }
+            }
+
+            // Check for month/year context
+            const monthYear = el.closest('.month, .year, [data-month], [data-year]');
+            if (monthYear) {
+                context.period_context = monthYear.textContent?.trim() || monthYear.getAttribute('data-month') || monthYear.getAttribute('data-year');
+            }
+
+            return context;
+        } catch (error) {
+            debugMessage('Error in safeGetCalendarContext', error.message);
+            return {};
+        }
+    }
+
+    function safeGetDropdownContext(el) {
+        try {
+            const context = {};
+
+            // Find dropdown container
+            const dropdown = el.closest('[role="listbox"], [role="menu"], .dropdown, .select-menu');
+            if (dropdown) {
+                context.dropdown_type = dropdown.className || 'dropdown';
+
+                // Try to determine dropdown purpose
+                const label = dropdown.closest('label') || 
+                             document.querySelector(`label[for="${dropdown.id}"]`) ||
+                             dropdown.previousElementSibling;
+
+                if (label) {
+                    context.dropdown_purpose = label.textContent?.trim();
+                }
+            }
+
+            // Get option value and text
+            const value = el.getAttribute('data-value') || el.getAttribute('value');
+            if (value) {
+                context.option_value = value;
+            }
+
+            return context;
+        } catch (error) {
+            debugMessage('Error in safeGetDropdownContext', error.message);
+            return {};
+        }
+    }
+
+    function safeGetBookingContext(el) {
+        try {
+            const context = {};
+
+            // Find flight/booking container
+            const bookingContainer = el.closest('.flight-option, .booking-option, [data-flight]');
+            if (bookingContainer) {
+                // Extract flight details
+                const priceEl = bookingContainer.querySelector('.price, [data-price], .fare');
+                if (priceEl) {
+                    context.price = priceEl.textContent?.trim();
+                }
+
+                const airlineEl = bookingContainer.querySelector('.airline, .carrier');
+                if (airlineEl) {
+                    context.airline = airlineEl.textContent?.trim();
+                }
+
+                const timeEl = bookingContainer.querySelector('.time, .departure, .arrival');
+                if (timeEl) {
+                    context.time_info = timeEl.textContent?.trim();
+                }
+
+                // Try to determine if it's outbound or return flight
+                const flightType = bookingContainer.closest('[data-direction], [class*="outbound"], [class*="return"]');
+                if (flightType) {
+                    const typeClass = (flightType.className || '').toLowerCase();
+                    if (typeClass.includes('outbound')) {
+                        context.flight_direction = 'outbound';
+                    } else if (typeClass.includes('return')) {
+                        context.flight_direction = 'return';
+                    }
+                }
+            }
+
+            return context;
+        } catch (error) {
+            debugMessage('Error in safeGetBookingContext', error.message);
+            return {};
+        }
+    }
+
+    // Helper functions that were missing (with error handling)
+    function safeGetContainerContext(el) {
+        try {
+            const context = {};
+
+            // Find the closest meaningful container
+            const container = el.closest('section, form, fieldset, div[class], div[id], article, main, aside');
+            if (container) {
+                context.type = container.tagName.toLowerCase();
+                context.id = container.id || '';
+                context.className = container.className || '';
+
+                // Get container text (first few words)
+                const containerText = container.textContent?.trim();
+                if (containerText) {
+                    const words = containerText.split(/\\s+/).slice(0, 5).join(' ');
+                    context.text = words.length < containerText.length ? words + '...' : words;
+                }
+            }
+
+            return context;
+        } catch (error) {
+            debugMessage('Error in safeGetContainerContext', error.message);
+            return {};
+        }
+    }
+
+    function safeGetSiblingContext(el) {
+        try {
+            const context = {};
+            const parent = el.parentElement;
+
+            if (parent) {
+                const siblings = Array.from(parent.children).filter(child => 
+                    child.tagName === el.tagName || 
+                    child.getAttribute('role') === el.getAttribute('role')
+                );
+
+                if (siblings.length > 1) {
+                    context.position = siblings.indexOf(el);
+                    context.total = siblings.length;
+                }
+            }
+
+            return context;
+        } catch (error) {
+            debugMessage('Error in safeGetSiblingContext', error.message);
+            return {};
+        }
+    }
+
+    function safeGetDOMPath(el) {
+        try {
+            const path = [];
+            let current = el;
+
+            while (current && current !== document.body && path.length < 5) {
+                let selector = current.tagName.toLowerCase();
+
+                if (current.id) {
+                    selector += `#${current.id}`;
+                    path.unshift(selector);
+                    break;
+                } else if (current.className) {
+                    const firstClass = (current.className || '').toString().split(' ')[0];
+                    if (firstClass && firstClass.match(/^[a-zA-Z_-][a-zA-Z0-9_-]*$/)) {
+                        selector += `.${firstClass}`;
+                    }
+                }
+
+                // Add nth-of-type if needed
+                const siblings = Array.from(current.parentElement?.children || [])
+                    .filter(el => el.tagName === current.tagName);
+                if (siblings.length > 1) {
+                    const index = siblings.indexOf(current) + 1;
+                    selector += `:nth-of-type(${index})`;
+                }
+
+                path.unshift(selector);
+                current = current.parentElement;
+            }
+
+            return path.join(' > ');
+        } catch (error) {
+            debugMessage('Error in safeGetDOMPath', error.message);
+            return '';
+        }
+    }
+
+    function safeGetLabelText(el) {
+        try {
+            // Try to find associated label
+            let labelText = '';
+
+            if (el.id) {
+                const label = document.querySelector(`label[for="${el.id}"]`);
+                if (label) {
+                    labelText = label.textContent?.trim() || '';
+                }
+            }
+
+            if (!labelText) {
+                const label = el.closest('label');
+                if (label) {
+                    labelText = label.textContent?.trim() || '';
+                }
+            }
+
+            if (!labelText) {
+                const prevElement = el.previousElementSibling;
+                if (prevElement && (prevElement.tagName === 'LABEL' || prevElement.textContent)) {
+                    labelText = prevElement.textContent?.trim() || '';
+                }
+            }
+
+            // IMPORTANT: Handle table structures where label is in previous <td>
+            if (!labelText) {
+                const parentCell = el.closest('td, th');
+                if (parentCell) {
+                    const prevCell = parentCell.previousElementSibling;
+                    if (prevCell && (prevCell.tagName === 'TD' || prevCell.tagName === 'TH')) {
+                        const cellText = prevCell.textContent?.trim() || '';
+                        // Only use if it looks like a label (short text, ends with colon, etc.)
+                        if (cellText && cellText.length < 50) {
+                            labelText = cellText.replace(/[:：]\s*$/, '').trim();
+                        }
+                    }
+                }
+            }
+
+            return labelText;
+        } catch (error) {
+            debugMessage('Error in safeGetLabelText', error.message);
+            return '';
+        }
+    }
+
+    function safeGetParentText(el) {
+        try {
+            const parent = el.parentElement;
+            if (!parent) return '';
+
+            // Get direct text content of parent (not including children)
+            const parentText = Array.from(parent.childNodes)
+                .filter(node => node.nodeType === Node.TEXT_NODE)
+                .map(node => node.textContent?.trim())
+                .filter(text => text)
+                .join(' ');
+
+            return parentText;
+        } catch (error) {
+            debugMessage('Error in safeGetParentText', error.message);
+            return '';
+        }
+    }
+
+    function safeGetEnhancedContainerContext(el) {
+        try {
+            const context = safeGetContainerContext(el);
+
+            // Add widget-specific context
+            const widgetType = safeGetWidgetType(el);
+            context.widget_type = widgetType;
+
+            switch (widgetType) {
+                case 'calendar':
+                    Object.assign(context, safeGetCalendarContext(el));
+                    break;
+                case 'dropdown':
+                    Object.assign(context, safeGetDropdownContext(el));
+                    break;
+                case 'booking':
+                    Object.assign(context, safeGetBookingContext(el));
+                    break;
+            }
+
+            return context;
+        } catch (error) {
+            debugMessage('Error in safeGetEnhancedContainerContext', { element: el.tagName, error: error.message });
+            return { widget_type: 'error' };
+        }
+    }
+
+    function safeGetInteractionHints(el) {
+        try {
+            const hints = [];
+            const widgetType = safeGetWidgetType(el);
+
+            switch (widgetType) {
+                case 'calendar':
+                    hints.push('click_date');
+                    if (el.getAttribute('aria-selected') === 'true') {
+                        hints.push('selected_date');
+                    }
+                    break;
+                case 'dropdown':
+                    hints.push('select_option');
+                    if (el.getAttribute('aria-expanded') === 'true') {
+                        hints.push('expanded');
+                    }
+                    break;
+                case 'booking':
+                    hints.push('select_flight');
+                    if (el.textContent?.toLowerCase().includes('select')) {
+                        hints.push('selection_button');
+                    }
+                    break;
+            }
+
+            return hints;
+        } catch (error) {
+            debugMessage('Error in safeGetInteractionHints', error.message);
+            return [];
+        }
+    }
+
+    function describe(el) {
+        const rect = el.getBoundingClientRect();
+
+        // Skip hidden elements
+        if (rect.width === 0 || rect.height === 0 || 
+            getComputedStyle(el).visibility === 'hidden' ||
+            getComputedStyle(el).display === 'none') {
+            return null;
+        }
+
+        // Get enhanced context with error handling
+        const containerContext = safeGetEnhancedContainerContext(el);
+        const interactionHints = safeGetInteractionHints(el);
+
+        // Generate selector with error handling
+        let selector = '';
+        let hierarchicalSelector = '';
+
+        try {
+            if (el.id) {
+                selector = `#${el.id}`;
+            } else {
+                selector = el.tagName.toLowerCase();
+
+                // Add specific attributes based on widget type
+                const widgetType = containerContext.widget_type;
+                if (widgetType === 'calendar' && el.getAttribute('data-date')) {
+                    selector += `[data-date="${el.getAttribute('data-date')}"]`;
+                } else if (widgetType === 'dropdown' && el.getAttribute('data-value')) {
+                    selector += `[data-value="${el.getAttribute('data-value')}"]`;
+                } else if (el.getAttribute('data-testid')) {
+                    selector += `[data-testid="${el.getAttribute('data-testid')}"]`;
+                }
+
+                // Add other attributes
+                if (el.name) selector += `[name="${el.name}"]`;
+                if (el.type && el.type !== 'submit' && el.type !== 'button' && el.type !== '') {
+                    selector += `[type="${el.type}"]`;
+                }
+            }
+
+            hierarchicalSelector = safeGetDOMPath(el);
+        } catch (error) {
+            debugMessage('Error generating selector', { element: el.tagName, error: error.message });
+            selector = el.tagName.toLowerCase();
+            hierarchicalSelector = selector;
+        }
+
+        // Enhanced text extraction
+        let elementText = '';
+        try {
+            elementText = el.textContent?.trim() || '';
+            if (!elementText && el.getAttribute('aria-label')) {
+                elementText = el.getAttribute('aria-label');
+            } else if (!elementText && el.getAttribute('title')) {
+                elementText = el.getAttribute('title');
+            } else if (!elementText && el.getAttribute('placeholder')) {
+                elementText = el.getAttribute('placeholder');
+            }
+        } catch (error) {
+            debugMessage('Error extracting text', error.message);
+        }
+
+        const elementData = {
+            tag: el.tagName,
+            type: el.type || '',
+            role: el.getAttribute('role') || '',
+            id: el.id || '',
+            name: el.name || '',
+            class: el.className || '',
+            text_content: elementText,
+            placeholder: el.placeholder || '',
+            title: el.title || '',
+            aria_label: el.getAttribute('aria-label') || '',
+            value: el.value || '',
+            label_text: safeGetLabelText(el),
+            parent_text: safeGetParentText(el),
+            css_selector: selector,
+            hierarchical_selector: hierarchicalSelector,
+            fallback_selector: el.tagName.toLowerCase(),
+            text_xpath: elementText ? `//${el.tagName.toLowerCase()}[contains(text(), "${elementText}")]` : '',
+            dom_path: hierarchicalSelector,
+            container_context: containerContext,
+            sibling_context: safeGetSiblingContext(el),
+            interaction_hints: interactionHints,
+            widget_data: {
+                date_value: el.getAttribute('data-date'),
+                option_value: el.getAttribute('data-value'),
+                test_id: el.getAttribute('data-testid'),
+                flight_data: el.getAttribute('data-flight'),
+                price_data: el.getAttribute('data-price')
+            },
+            position: {
+                x: Math.round(rect.x),
+                y: Math.round(rect.y),
+                width: Math.round(rect.width),
+                height: Math.round(rect.height)
+            }
+        };
+
+        return elementData;
+    }
+
+    const state = {
+        docId: Math.random().toString(36).slice(2) + Date.now().toString(36),
+        version: 0,
+        nextId: 1,
+        ids: new WeakMap(),
+        tracked: new Map(),
+        // node -> whether its whole subtree needs rescanning
+        dirty: new Map(),
+        fullScan: true
+    };
+
+    function elementId(el) {
+        let id = state.ids.get(el);
+        if (!id) {
+            id = state.nextId++;
+            state.ids.set(el, id);
+        }
+        return id;
+    }
+
+    function markDirty(node, deep) {
+        if (state.fullScan || !node) {
+            return;
+        }
+        state.dirty.set(node, state.dirty.get(node) || deep);
+        if (state.dirty.size > maxDirtyNodes) {
+            state.fullScan = true;
+            state.dirty.clear();
+        }
+    }
+
+    function collect(node, deep, pending) {
+        const root = node.nodeType === Node.ELEMENT_NODE ? node : node.parentElement;
+        if (!root || !root.isConnected) {
+            return;
+        }
+        // Interactive ancestors take their text from this node, so describe them again
+        let ancestor = root.closest(interactiveSelectors);
+        while (ancestor) {
+            pending.add(ancestor);
+            ancestor = ancestor.parentElement ? ancestor.parentElement.closest(interactiveSelectors) : null;
+        }
+        if (deep) {
+            root.querySelectorAll(interactiveSelectors).forEach(el => pending.add(el));
+        }
+    }
+
+    function snapshot(elements) {
+        const upserts = [];
+        const removed = [];
+        elements.forEach(el => {
+            const id = elementId(el);
+            let elementData = null;
+            if (el.isConnected) {
+                try {
+                    elementData = describe(el);
+                } catch (error) {
+                    debugMessage('Error processing element', { element: el.tagName, error: error.message });
+                }
+            }
+            if (elementData) {
+                elementData.vs_id = id;
+                state.tracked.set(id, el);
+                upserts.push(elementData);
+            } else if (state.tracked.delete(id)) {
+                removed.push(id);
+            }
+        });
+        return { upserts: upserts, removed: removed };
+    }
+
+    function changes(docId, version) {
+        if (docId !== state.docId) {
+            state.fullScan = true;
+        } else if (!state.fullScan && state.dirty.size === 0 && version === state.version) {
+            return { doc_id: state.docId, version: state.version, unchanged: true };
+        }
+
+        if (state.fullScan) {
+            state.fullScan = false;
+            state.dirty.clear();
+            state.tracked.clear();
+            const result = snapshot(Array.from(document.querySelectorAll(interactiveSelectors)));
+            state.version++;
+            debugMessage(`Full scan found ${result.upserts.length} interactive elements`);
+            return { doc_id: state.docId, version: state.version, reset: true, upserts: result.upserts, removed: [] };
+        }
+
+        const pending = new Set();
+        state.tracked.forEach(el => {
+            if (!el.isConnected) {
+                pending.add(el);
+            }
+        });
+        state.dirty.forEach((deep, node) => collect(node, deep, pending));
+        state.dirty.clear();
+
+        const ordered = Array.from(pending).sort((a, b) =>
+            a.compareDocumentPosition(b) & Node.DOCUMENT_POSITION_FOLLOWING ? -1 : 1
+        );
+        const result = snapshot(ordered);
+        debugMessage(`Rescanned ${ordered.length} changed elements`);
+        const response = { doc_id: state.docId, version: state.version, reset: false, upserts: result.upserts, removed: result.removed };
+        if (result.upserts.length) {
+            // Rescanned elements may be new, so send the document order of all tracked elements
+            response.order = [];
+            document.querySelectorAll(interactiveSelectors).forEach(el => {
+                const id = state.ids.get(el);
+                if (id && state.tracked.get(id) === el) {
+                    response.order.push(id);
+                }
+            });
+        }
+        return response;
+    }
+
+    const observer = new MutationObserver(mutations => {
+        for (const mutation of mutations) {
+            if (mutation.type === 'childList') {
+                mutation.addedNodes.forEach(node => markDirty(node, true));
+                markDirty(mutation.target, false);
+            } else if (mutation.type === 'attributes') {
+                markDirty(mutation.target, true);
+            } else {
+                markDirty(mutation.target, false);
+            }
+        }
+        state.version++;
+    });
+    observer.observe(document, {
+        childList: true,
+        subtree: true,
+        attributes: true,
+        attributeFilter: observedAttributes,
+        characterData: true
+    });
+
+    // Layout changes without DOM mutations can reveal or hide elements
+    window.addEventListener('load', () => { state.fullScan = true; });
+    window.addEventListener('resize', () => { state.fullScan = true; });
+
+    window.__vibesurfSemanticMap = { changes: changes };
+})();
+"""
+
+# Number of pages whose element maps are kept on the Python side
+MAX_CACHED_PAGES = 32
+
+# Sessions of closed tabs are never reported back, so remember only as many as pages are cached
+_semantic_map_script = PersistentPageScript(SEMANTIC_MAP_SCRIPT, max_sessions=MAX_CACHED_PAGES)
+
+
+class PageElementMap:
+    """Python-side copy of the element map of one page"""
+
+    def __init__(self):
+        self.doc_id: Optional[str] = None
+        self.version: Optional[int] = None
+        self.elements: Dict[int, Dict] = {}
+        self.mapping: Optional['SemanticMapping'] = None
+
+    def apply_changes(self, changes: Dict):
+        """Merge a change set returned by the page script"""
+        self.doc_id = changes.get('doc_id')
+        self.version = changes.get('version')
+        if changes.get('unchanged'):
+            return
+
+        if changes.get('reset'):
+            self.elements = {}
+        for vs_id in changes.get('removed', []):
+            self.elements.pop(vs_id, None)
+        for element in changes.get('upserts', []):
+            self.elements[element['vs_id']] = element
+        order = changes.get('order')
+        if order is not None:
+            # Keep document order, so ids and duplicate suffixes match a full scan
+            ordered = {vs_id: self.elements[vs_id] for vs_id in order if vs_id in self.elements}
+            ordered.update(self.elements)
+            self.elements = ordered
+        self.mapping = None
+
+
+_page_element_maps: "OrderedDict[str, PageElementMap]" = OrderedDict()
+
+
+def _get_page_element_map(target_id: str) -> PageElementMap:
+    page_map = _page_element_maps.get(target_id)
+    if page_map is None:
+        page_map = PageElementMap()
+        _page_element_maps[target_id] = page_map
+        if len(_page_element_maps) > MAX_CACHED_PAGES:
+            _page_element_maps.popitem(last=False)
+    else:
+        _page_element_maps.move_to_end(target_id)
+    return page_map
+
+
+def _tokenize(text: str) -> set:
+    text = text.lower()
+    return set(text.split()) | set(re.findall(r'\w+', text))
+
+
+def _selector_attributes(selector: str) -> List[str]:
+    """IDs and name attributes a css selector matches on"""
+    attributes = re.findall(r'\[(?:name|id)="([^"]*)"\]', selector)
+    if selector.startswith('#'):
+        attributes.insert(0, re.split(r'[\s\[.:>]', selector[1:], maxsplit=1)[0])
+    return attributes
+
+
+class SemanticMapping(dict):
+    """Semantic mapping with a prebuilt text, label and attribute index for fast lookups"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.exact: Dict[str, Dict] = {}
+        self.attributes: Dict[str, Dict] = {}
+        self.tokens: Dict[str, List[str]] = defaultdict(list)
+        self.positions: Dict[str, int] = {}
+        # (text, lowercased text, lowercased original text) in mapping order, for substring checks
+        self.lowered: List[Tuple[str, str, str]] = []
+
+        for position, (text, element_info) in enumerate(self.items()):
+            self.positions[text] = position
+            self.exact.setdefault(text.lower(), element_info)
+            self.lowered.append((text, text.lower(), element_info.get('original_text', '').lower()))
+            for attribute in _selector_attributes(element_info.get('selectors', '')):
+                if attribute:
+                    self.attributes.setdefault(attribute, element_info)
+
+            words = _tokenize(text)
+            words |= _tokenize(element_info.get('original_text', ''))
+            words |= _tokenize(element_info.get('label_text', ''))
+            for word in words:
+                self.tokens[word].append(text)
+
+    def candidates(self, target_text: str) -> List[Tuple[str, Dict]]:
+        """
+        Entries the fuzzy matching strategies can score for the target, in mapping order
+
+        These are the entries sharing a word with the target plus those related to it
+        as a substring, so matching only them ranks exactly like scanning every entry.
+        """
+        keys = set()
+        for word in _tokenize(target_text):
+            keys.update(self.tokens.get(word, ()))
+
+        target_lower = target_text.lower().strip()
+        needles = [target_lower]
+        if '(' in target_text and target_text.endswith(')'):
+            needles.append(target_text.split('(')[0].strip().lower())
+        target_words = target_lower.split()
+        if len(target_words) == 1:
+            needles.extend(re.findall(r'[a-z]+', target_words[0]))
+
+        for text, text_lower, original_lower in self.lowered:
+            if text in keys:
+                continue
+            if (
+                    text_lower in target_lower
+                    or (original_lower and original_lower in target_lower)
+                    or any(needle in text_lower or (original_lower and needle in original_lower) for needle in needles)
+            ):
+                keys.add(text)
+        return [(text, self[text]) for text in sorted(keys, key=self.positions.__getitem__)]
+
 
 class SemanticExtractor:
     """Extracts semantic mappings from HTML pages by mapping visible text to deterministic selectors."""
@@ -208,626 +1013,70 @@ class SemanticExtractor:
 
         return f'{text} ({counter})'
 
-    async def extract_interactive_elements(self, browser_session: 'AgentBrowserSession') -> List[Dict]:
-        """Extract interactive elements with enhanced context for complex UI widgets."""
-
-        # Add debugging flag
-        debug_mode = False  # Set to True for debugging
-
-        js_code = r"""
-        ((debugMode = false) => {
-            const debugLog = [];
-
-            function debugMessage(msg, data = null) {
-                if (debugMode) {
-                    console.log('[SEMANTIC_DEBUG]', msg, data);
-                    debugLog.push({ message: msg, data: data, timestamp: Date.now() });
-                }
-            }
-
-            debugMessage('Starting semantic extraction');
-
-            // Enhanced selector for complex UI widgets
-            const interactiveSelectors = [
-                'button', 'input', 'select', 'textarea', 'a[href]',
-                '[role="button"]', '[role="link"]', '[role="tab"]', '[role="menuitem"]',
-                '[role="option"]', '[role="checkbox"]', '[role="radio"]',
-                '[role="combobox"]', '[role="listbox"]', '[role="slider"]',
-                '[role="spinbutton"]', '[role="searchbox"]', '[role="switch"]',
-                '[onclick]', '[onchange]', '[onsubmit]',
-                // Calendar and date picker elements
-                '[role="gridcell"]', '[role="calendar"]', '[role="datepicker"]',
-                '.calendar-day', '.date-picker', '.day', '.month', '.year',
-                '[data-date]', '[data-day]', '[data-month]', '[data-year]',
-                // Dropdown and menu elements
-                '[role="menu"]', '[role="menubar"]', '[role="menuitem"]',
-                '.dropdown', '.menu-item', '.option', '.select-option',
-                '[data-value]', '[data-option]',
-                // Dynamic content elements
-                '[data-testid]', '[data-cy]', '[data-qa]',
-                // Flight/travel specific elements
-                '.flight-option', '.price', '.select-flight', '.book-now',
-                '[data-flight]', '[data-price]', '.fare-option'
-            ].join(', ');
-
-            const elements = [];
-            let allElements;
-
-            try {
-                allElements = document.querySelectorAll(interactiveSelectors);
-                debugMessage(`Found ${allElements.length} potential interactive elements`);
-            } catch (error) {
-                debugMessage('Error selecting elements', error.message);
-                return { elements: [], debugLog: debugLog, error: error.message };
-            }
-
-            // Enhanced context extraction functions with error handling
-            function safeGetWidgetType(el) {
-                try {
-                    // Detect widget types based on various indicators
-                    const role = el.getAttribute('role') || '';
-                    const className = (el.className || '').toString().toLowerCase();
-                    const tagName = el.tagName.toLowerCase();
-                    const dataAttrs = Array.from(el.attributes || [])
-                        .filter(attr => attr.name && attr.name.startsWith('data-'))
-                        .map(attr => attr.name);
-
-                    // Calendar detection
-                    if (role === 'gridcell' || role === 'calendar' || 
-                        className.includes('calendar') || className.includes('date') ||
-                        dataAttrs.some(attr => attr.includes('date') || attr.includes('day'))) {
-                        return 'calendar';
-                    }
-
-                    // Dropdown detection
-                    if (role === 'option' || role === 'menuitem' || role === 'combobox' ||
-                        className.includes('dropdown') || className.includes('option') ||
-                        className.includes('menu')) {
-                        return 'dropdown';
-                    }
-
-                    // Flight/booking specific
-                    if (className.includes('flight') || className.includes('select') ||
-                        className.includes('book') || className.includes('fare') ||
-                        dataAttrs.some(attr => attr.includes('flight') || attr.includes('price'))) {
-                        return 'booking';
-                    }
-
-                    // Form controls
-                    if (tagName === 'input' || tagName === 'select' || tagName === 'textarea') {
-                        return 'form';
-                    }
-
-                    // Navigation/action buttons
-                    if (tagName === 'button' || role === 'button' || tagName === 'a') {
-                        return 'action';
-                    }
-
-                    return 'generic';
-                } catch (error) {
-                    debugMessage('Error in safeGetWidgetType', { element: el.tagName, error: error.message });
-                    return 'error';
-                }
-            }
-
-            function safeGetCalendarContext(el) {
-                try {
-                    const context = {};
-
-                    // Try to find date information
-                    const dateAttr = el.getAttribute('data-date') || 
-                                   el.getAttribute('data-day') ||
-                                   el.getAttribute('aria-label');
-
-                    if (dateAttr) {
-                        context.date_value = dateAttr;
-                    }
-
-                    // Find calendar container
-                    const calendar = el.closest('[role="calendar"], .calendar, .date-picker, .datepicker');
-                    if (calendar) {
-                        context.calendar_type = calendar.className || 'calendar';
-
-                        // Try to determine if it's departure or return date
-                        const calendarContainer = calendar.closest('[data-testid], [class*="depart"], [class*="return"]');
-                        if (calendarContainer) {
-                            const containerClass = (calendarContainer.className || '').toLowerCase();
-                            if (containerClass.includes('depart')) {
-                                context.date_type = 'departure';
-                            } else if (containerClass.includes('return')) {
-                                context.date_type = 'return';
-                            }
-                        }
-                    }
-
-                    // Check for month/year context
-                    const monthYear = el.closest('.month, .year, [data-month], [data-year]');
-                    if (monthYear) {
-                        context.period_context = monthYear.textContent?.trim() || monthYear.getAttribute('data-month') || monthYear.getAttribute('data-year');
-                    }
-
-                    return context;
-                } catch (error) {
-                    debugMessage('Error in safeGetCalendarContext', error.message);
-                    return {};
-                }
-            }
-
-            function safeGetDropdownContext(el) {
-                try {
-                    const context = {};
-
-                    // Find dropdown container
-                    const dropdown = el.closest('[role="listbox"], [role="menu"], .dropdown, .select-menu');
-                    if (dropdown) {
-                        context.dropdown_type = dropdown.className || 'dropdown';
-
-                        // Try to determine dropdown purpose
-                        const label = dropdown.closest('label') || 
-                                     document.querySelector(`label[for="${dropdown.id}"]`) ||
-                                     dropdown.previousElementSibling;
-
-                        if (label) {
-                            context.dropdown_purpose = label.textContent?.trim();
-                        }
-                    }
-
-                    // Get option value and text
-                    const value = el.getAttribute('data-value') || el.getAttribute('value');
-                    if (value) {
-                        context.option_value = value;
-                    }
-
-                    return context;
-                } catch (error) {
-                    debugMessage('Error in safeGetDropdownContext', error.message);
-                    return {};
-                }
-            }
-
-            function safeGetBookingContext(el) {
-                try {
-                    const context = {};
-
-                    // Find flight/booking container
-                    const bookingContainer = el.closest('.flight-option, .booking-option, [data-flight]');
-                    if (bookingContainer) {
-                        // Extract flight details
-                        const priceEl = bookingContainer.querySelector('.price, [data-price], .fare');
-                        if (priceEl) {
-                            context.price = priceEl.textContent?.trim();
-                        }
-
-                        const airlineEl = bookingContainer.querySelector('.airline, .carrier');
-                        if (airlineEl) {
-                            context.airline = airlineEl.textContent?.trim();
-                        }
-
-                        const timeEl = bookingContainer.querySelector('.time, .departure, .arrival');
-                        if (timeEl) {
-                            context.time_info = timeEl.textContent?.trim();
-                        }
-
-                        // Try to determine if it's outbound or return flight
-                        const flightType = bookingContainer.closest('[data-direction], [class*="outbound"], [class*="return"]');
-                        if (flightType) {
-                            const typeClass = (flightType.className || '').toLowerCase();
-                            if (typeClass.includes('outbound')) {
-                                context.flight_direction = 'outbound';
-                            } else if (typeClass.includes('return')) {
-                                context.flight_direction = 'return';
-                            }
-                        }
-                    }
-
-                    return context;
-                } catch (error) {
-                    debugMessage('Error in safeGetBookingContext', error.message);
-                    return {};
-                }
-            }
-
-            // Helper functions that were missing (with error handling)
-            function safeGetContainerContext(el) {
-                try {
-                    const context = {};
-
-                    // Find the closest meaningful container
-                    const container = el.closest('section, form, fieldset, div[class], div[id], article, main, aside');
-                    if (container) {
-                        context.type = container.tagName.toLowerCase();
-                        context.id = container.id || '';
-                        context.className = container.className || '';
-
-                        // Get container text (first few words)
-                        const containerText = container.textContent?.trim();
-                        if (containerText) {
-                            const words = containerText.split(/\\s+/).slice(0, 5).join(' ');
-                            context.text = words.length < containerText.length ? words + '...' : words;
-                        }
-                    }
-
-                    return context;
-                } catch (error) {
-                    debugMessage('Error in safeGetContainerContext', error.message);
-                    return {};
-                }
-            }
-
-            function safeGetSiblingContext(el) {
-                try {
-                    const context = {};
-                    const parent = el.parentElement;
-
-                    if (parent) {
-                        const siblings = Array.from(parent.children).filter(child => 
-                            child.tagName === el.tagName || 
-                            child.getAttribute('role') === el.getAttribute('role')
-                        );
-
-                        if (siblings.length > 1) {
-                            context.position = siblings.indexOf(el);
-                            context.total = siblings.length;
-                        }
-                    }
-
-                    return context;
-                } catch (error) {
-                    debugMessage('Error in safeGetSiblingContext', error.message);
-                    return {};
-                }
-            }
-
-            function safeGetDOMPath(el) {
-                try {
-                    const path = [];
-                    let current = el;
-
-                    while (current && current !== document.body && path.length < 5) {
-                        let selector = current.tagName.toLowerCase();
-
-                        if (current.id) {
-                            selector += `#${current.id}`;
-                            path.unshift(selector);
-                            break;
-                        } else if (current.className) {
-                            const firstClass = (current.className || '').toString().split(' ')[0];
-                            if (firstClass && firstClass.match(/^[a-zA-Z_-][a-zA-Z0-9_-]*$/)) {
-                                selector += `.${firstClass}`;
-                            }
-                        }
-
-                        // Add nth-of-type if needed
-                        const siblings = Array.from(current.parentElement?.children || [])
-                            .filter(el => el.tagName === current.tagName);
-                        if (siblings.length > 1) {
-                            const index = siblings.indexOf(current) + 1;
-                            selector += `:nth-of-type(${index})`;
-                        }
-
-                        path.unshift(selector);
-                        current = current.parentElement;
-                    }
-
-                    return path.join(' > ');
-                } catch (error) {
-                    debugMessage('Error in safeGetDOMPath', error.message);
-                    return '';
-                }
-            }
-
-            function safeGetLabelText(el) {
-                try {
-                    // Try to find associated label
-                    let labelText = '';
-
-                    if (el.id) {
-                        const label = document.querySelector(`label[for="${el.id}"]`);
-                        if (label) {
-                            labelText = label.textContent?.trim() || '';
-                        }
-                    }
-
-                    if (!labelText) {
-                        const label = el.closest('label');
-                        if (label) {
-                            labelText = label.textContent?.trim() || '';
-                        }
-                    }
-
-                    if (!labelText) {
-                        const prevElement = el.previousElementSibling;
-                        if (prevElement && (prevElement.tagName === 'LABEL' || prevElement.textContent)) {
-                            labelText = prevElement.textContent?.trim() || '';
-                        }
-                    }
-
-                    // IMPORTANT: Handle table structures where label is in previous <td>
-                    if (!labelText) {
-                        const parentCell = el.closest('td, th');
-                        if (parentCell) {
-                            const prevCell = parentCell.previousElementSibling;
-                            if (prevCell && (prevCell.tagName === 'TD' || prevCell.tagName === 'TH')) {
-                                const cellText = prevCell.textContent?.trim() || '';
-                                // Only use if it looks like a label (short text, ends with colon, etc.)
-                                if (cellText && cellText.length < 50) {
-                                    labelText = cellText.replace(/[:：]\s*$/, '').trim();
-                                }
-                            }
-                        }
-                    }
-
-                    return labelText;
-                } catch (error) {
-                    debugMessage('Error in safeGetLabelText', error.message);
-                    return '';
-                }
-            }
-
-            function safeGetParentText(el) {
-                try {
-                    const parent = el.parentElement;
-                    if (!parent) return '';
-
-                    // Get direct text content of parent (not including children)
-                    const parentText = Array.from(parent.childNodes)
-                        .filter(node => node.nodeType === Node.TEXT_NODE)
-                        .map(node => node.textContent?.trim())
-                        .filter(text => text)
-                        .join(' ');
-
-                    return parentText;
-                } catch (error) {
-                    debugMessage('Error in safeGetParentText', error.message);
-                    return '';
-                }
-            }
-
-            function safeGetEnhancedContainerContext(el) {
-                try {
-                    const context = safeGetContainerContext(el);
-
-                    // Add widget-specific context
-                    const widgetType = safeGetWidgetType(el);
-                    context.widget_type = widgetType;
-
-                    switch (widgetType) {
-                        case 'calendar':
-                            Object.assign(context, safeGetCalendarContext(el));
-                            break;
-                        case 'dropdown':
-                            Object.assign(context, safeGetDropdownContext(el));
-                            break;
-                        case 'booking':
-                            Object.assign(context, safeGetBookingContext(el));
-                            break;
-                    }
-
-                    return context;
-                } catch (error) {
-                    debugMessage('Error in safeGetEnhancedContainerContext', { element: el.tagName, error: error.message });
-                    return { widget_type: 'error' };
-                }
-            }
-
-            function safeGetInteractionHints(el) {
-                try {
-                    const hints = [];
-                    const widgetType = safeGetWidgetType(el);
-
-                    switch (widgetType) {
-                        case 'calendar':
-                            hints.push('click_date');
-                            if (el.getAttribute('aria-selected') === 'true') {
-                                hints.push('selected_date');
-                            }
-                            break;
-                        case 'dropdown':
-                            hints.push('select_option');
-                            if (el.getAttribute('aria-expanded') === 'true') {
-                                hints.push('expanded');
-                            }
-                            break;
-                        case 'booking':
-                            hints.push('select_flight');
-                            if (el.textContent?.toLowerCase().includes('select')) {
-                                hints.push('selection_button');
-                            }
-                            break;
-                    }
-
-                    return hints;
-                } catch (error) {
-                    debugMessage('Error in safeGetInteractionHints', error.message);
-                    return [];
-                }
-            }
-
-            // Process each element with enhanced context and error handling
-            let processedCount = 0;
-            let errorCount = 0;
-
-            Array.from(allElements).forEach((el, index) => {
-                try {
-                    const rect = el.getBoundingClientRect();
-
-                    // Skip hidden elements
-                    if (rect.width === 0 || rect.height === 0 || 
-                        getComputedStyle(el).visibility === 'hidden' ||
-                        getComputedStyle(el).display === 'none') {
-                        return;
-                    }
-
-                    // Get enhanced context with error handling
-                    const containerContext = safeGetEnhancedContainerContext(el);
-                    const interactionHints = safeGetInteractionHints(el);
-
-                    // Generate selector with error handling
-                    let selector = '';
-                    let hierarchicalSelector = '';
-
-                    try {
-                        if (el.id) {
-                            selector = `#${el.id}`;
-                        } else {
-                            selector = el.tagName.toLowerCase();
-
-                            // Add specific attributes based on widget type
-                            const widgetType = containerContext.widget_type;
-                            if (widgetType === 'calendar' && el.getAttribute('data-date')) {
-                                selector += `[data-date="${el.getAttribute('data-date')}"]`;
-                            } else if (widgetType === 'dropdown' && el.getAttribute('data-value')) {
-                                selector += `[data-value="${el.getAttribute('data-value')}"]`;
-                            } else if (el.getAttribute('data-testid')) {
-                                selector += `[data-testid="${el.getAttribute('data-testid')}"]`;
-                            }
-
-                            // Add other attributes
-                            if (el.name) selector += `[name="${el.name}"]`;
-                            if (el.type && el.type !== 'submit' && el.type !== 'button' && el.type !== '') {
-                                selector += `[type="${el.type}"]`;
-                            }
-                        }
-
-                        hierarchicalSelector = safeGetDOMPath(el);
-                    } catch (error) {
-                        debugMessage('Error generating selector', { element: el.tagName, error: error.message });
-                        selector = el.tagName.toLowerCase();
-                        hierarchicalSelector = selector;
-                    }
-
-                    // Enhanced text extraction
-                    let elementText = '';
-                    try {
-                        elementText = el.textContent?.trim() || '';
-                        if (!elementText && el.getAttribute('aria-label')) {
-                            elementText = el.getAttribute('aria-label');
-                        } else if (!elementText && el.getAttribute('title')) {
-                            elementText = el.getAttribute('title');
-                        } else if (!elementText && el.getAttribute('placeholder')) {
-                            elementText = el.getAttribute('placeholder');
-                        }
-                    } catch (error) {
-                        debugMessage('Error extracting text', error.message);
-                    }
-
-                    const elementData = {
-                        tag: el.tagName,
-                        type: el.type || '',
-                        role: el.getAttribute('role') || '',
-                        id: el.id || '',
-                        name: el.name || '',
-                        class: el.className || '',
-                        text_content: elementText,
-                        placeholder: el.placeholder || '',
-                        title: el.title || '',
-                        aria_label: el.getAttribute('aria-label') || '',
-                        value: el.value || '',
-                        label_text: safeGetLabelText(el),
-                        parent_text: safeGetParentText(el),
-                        css_selector: selector,
-                        hierarchical_selector: hierarchicalSelector,
-                        fallback_selector: el.tagName.toLowerCase(),
-                        text_xpath: elementText ? `//${el.tagName.toLowerCase()}[contains(text(), "${elementText}")]` : '',
-                        dom_path: hierarchicalSelector,
-                        container_context: containerContext,
-                        sibling_context: safeGetSiblingContext(el),
-                        interaction_hints: interactionHints,
-                        widget_data: {
-                            date_value: el.getAttribute('data-date'),
-                            option_value: el.getAttribute('data-value'),
-                            test_id: el.getAttribute('data-testid'),
-                            flight_data: el.getAttribute('data-flight'),
-                            price_data: el.getAttribute('data-price')
-                        },
-                        position: {
-                            x: Math.round(rect.x),
-                            y: Math.round(rect.y),
-                            width: Math.round(rect.width),
-                            height: Math.round(rect.height)
-                        }
-                    };
-
-                    elements.push(elementData);
-                    processedCount++;
-
-                } catch (error) {
-                    errorCount++;
-                    debugMessage('Error processing element', { 
-                        index: index, 
-                        element: el.tagName, 
-                        error: error.message 
-                    });
-                }
-            });
-
-            debugMessage('Extraction complete', { 
-                processed: processedCount, 
-                errors: errorCount,
-                total: allElements.length 
-            });
-
-            return {
-                elements: elements,
-                debugLog: debugLog,
-                stats: {
-                    processed: processedCount,
-                    errors: errorCount,
-                    total: allElements.length
-                }
-            };
-        })(false)
-        """
-
-        try:
-            cdp_session = await browser_session.get_or_create_cdp_session()
-            result_str = await cdp_session.cdp_client.send.Runtime.evaluate(
-                params={'expression': js_code, 'returnByValue': True, 'awaitPromise': True},
+    async def _sync_page_element_map(self, browser_session: 'AgentBrowserSession') -> PageElementMap:
+        """Install the element map script if needed and fetch what changed since the last call."""
+        cdp_session = await browser_session.get_or_create_cdp_session()
+        page_map = _get_page_element_map(cdp_session.target_id)
+
+        await _semantic_map_script.install(cdp_session)
+
+        changes_expression = (
+            f'window.__vibesurfSemanticMap ? '
+            f'window.__vibesurfSemanticMap.changes({json.dumps(page_map.doc_id)}, {json.dumps(page_map.version)}) : null'
+        )
+        result = await cdp_session.cdp_client.send.Runtime.evaluate(
+            params={'expression': changes_expression, 'returnByValue': True},
+            session_id=cdp_session.session_id,
+        )
+        changes = result['result'].get('value')
+
+        if changes is None:
+            # Script is missing from this document, e.g. the page replaced the global
+            result = await cdp_session.cdp_client.send.Runtime.evaluate(
+                params={'expression': f'{SEMANTIC_MAP_SCRIPT}\n{changes_expression}', 'returnByValue': True},
                 session_id=cdp_session.session_id,
             )
-            # Parse the JSON result
-            import json
-
-            result = json.loads(result_str) if isinstance(result_str, str) else result_str
-            result = result["result"]['value']
-
-            if debug_mode and 'debugLog' in result:
-                # Save debug information to file
-                debug_file = f'semantic_extraction_debug_{int(asyncio.get_event_loop().time())}.json'
-                import json
-
-                async with aiofiles.open(debug_file, 'w') as f:
-                    await f.write(json.dumps(result, indent=2))
-                logger.info(f'Debug information saved to: {debug_file}')
-
-                # Print debug stats
-                stats = result.get('stats', {})
-                logger.info(f'Extraction stats: {stats}')
-
-                if 'error' in result:
-                    logger.error(f'JavaScript extraction error: {result["error"]}')
-
-            return result.get('elements', [])
+            changes = result['result']['value']
+
+        page_map.apply_changes(changes)
+        if not changes.get('unchanged'):
+            logger.debug(
+                f"Element map {'rebuilt' if changes.get('reset') else 'updated'}: "
+                f"{len(changes.get('upserts', []))} changed, {len(changes.get('removed', []))} removed, "
+                f"{len(page_map.elements)} total"
+            )
+        return page_map
 
+    async def extract_interactive_elements(self, browser_session: 'AgentBrowserSession') -> List[Dict]:
+        """Extract interactive elements with enhanced context for complex UI widgets."""
+        try:
+            page_map = await self._sync_page_element_map(browser_session)
+            return list(page_map.elements.values())
         except Exception as e:
             logger.error(f'Failed to extract interactive elements: {e}')
-            # Save error information for debugging
             return []
 
     async def extract_semantic_mapping(self, browser_session: 'AgentBrowserSession') -> Dict[str, Dict]:
         """Extract semantic mapping from the current page.
 
         Returns mapping: visible_text -> {"class": "", "id": "", "selectors": ""}
+        The mapping is reused until the page's interactive elements change.
         """
-        self._reset_counters()
+        try:
+            page_map = await self._sync_page_element_map(browser_session)
+        except Exception as e:
+            logger.error(f'Failed to extract interactive elements: {e}')
+            return SemanticMapping()
 
-        # Get all interactive elements with enhanced context
-        elements = await self.extract_interactive_elements(browser_session)
+        if page_map.mapping is not None:
+            return page_map.mapping
+
+        self._reset_counters()
 
         mapping = {}
         existing_keys = set()
 
-        for element_info in elements:
+        for element_info in page_map.elements.values():
             # Determine element type and generate ID
             element_type, element_id = self._get_element_type_and_id(element_info)
 
@@ -864,33 +1113,60 @@ class SemanticExtractor:
 
             logger.debug(f"Mapped '{final_text}' -> {element_info['css_selector']}")
 
-        return mapping
+        page_map.mapping = SemanticMapping(mapping)
+        return page_map.mapping
 
     def find_element_by_text(self, mapping: Dict[str, Dict], target_text: str) -> Optional[Dict]:
-        """Find element by text with intelligent fuzzy matching and hierarchical context understanding."""
+        """Find element by text with intelligent fuzzy matching and hierarchical context understanding.
+
+        With a SemanticMapping, exact and ID/name lookups use its index and fuzzy matching
+        scores only the entries that can match the target, with the same ranking.
+        """
         if not target_text or not mapping:
             return None
 
         target_lower = target_text.lower().strip()
+        index = mapping if isinstance(mapping, SemanticMapping) else None
 
         # Strategy 1: Exact match (case-insensitive)
-        for text, element_info in mapping.items():
-            if text.lower() == target_lower:
-                logger.debug(f"Exact match found: '{target_text}' -> '{text}'")
+        if index is not None:
+            element_info = index.exact.get(target_lower)
+            if element_info:
+                logger.debug(f"Exact match found: '{target_text}'")
                 return element_info
+        else:
+            for text, element_info in mapping.items():
+                if text.lower() == target_lower:
+                    logger.debug(f"Exact match found: '{target_text}' -> '{text}'")
+                    return element_info
 
         # Strategy 2: Check if target looks like an element ID or name attribute
         if target_text.replace('_', '').replace('-', '').isalnum():
-            for text, element_info in mapping.items():
-                selectors = element_info.get('selectors', '')
-                # Check if the selector contains the target as an ID or name
-                if (
-                        f'#{target_text}' in selectors
-                        or f'[name="{target_text}"]' in selectors
-                        or f'[id="{target_text}"]' in selectors
-                ):
-                    logger.debug(f"ID/name match found: '{target_text}' -> '{text}' (selector: {selectors})")
+            if index is not None:
+                element_info = index.attributes.get(target_text)
+                if element_info:
+                    logger.debug(f"ID/name match found: '{target_text}' (selector: {element_info.get('selectors', '')})")
                     return element_info
+            else:
+                for text, element_info in mapping.items():
+                    selectors = element_info.get('selectors', '')
+                    # Check if the selector contains the target as an ID or name
+                    if (
+                            f'#{target_text}' in selectors
+                            or f'[name="{target_text}"]' in selectors
+                            or f'[id="{target_text}"]' in selectors
+                    ):
+                        logger.debug(f"ID/name match found: '{target_text}' -> '{text}' (selector: {selectors})")
+                        return element_info
+
+        if index is not None:
+            return self._find_fuzzy_match(index.candidates(target_text), target_text)
+
+        return self._find_fuzzy_match(list(mapping.items()), target_text)
+
+    def _find_fuzzy_match(self, items: List[Tuple[str, Dict]], target_text: str) -> Optional[Dict]:
+        """Apply the context, fuzzy and pattern matching strategies to mapping entries."""
+        target_lower = target_text.lower().strip()
 
         # Strategy 3: Hierarchical context matching
         # If target contains context information like "Submit (in Contact Form)", parse it
@@ -900,7 +1176,7 @@ class SemanticExtractor:
 
             # Look for elements that match both the base text and context
             candidates = []
-            for text, element_info in mapping.items():
+            for text, element_info in items:
                 if base_text.lower() in text.lower():
                     # Check if the context matches
                     if context_part.lower() in text.lower():
@@ -932,7 +1208,7 @@ class SemanticExtractor:
         best_score = 0.0
         best_text = ''
 
-        for text, element_info in mapping.items():
+        for text, element_info in items:
             text_lower = text.lower()
             original_text = element_info.get('original_text', '').lower()
 
@@ -989,7 +1265,7 @@ class SemanticExtractor:
         if len(target_words) == 1:  # Single word target
             word = target_words[0]
 
-            for text, element_info in mapping.items():
+            for text, element_info in items:
                 text_lower = text.lower()
                 original_text = element_info.get('original_text', '').lower()
 
@@ -1038,9 +1314,15 @@ class SemanticExtractor:
         target_lower = target_text.lower().strip()
         context_lower = [hint.lower() for hint in context_hints]
 
+        if isinstance(mapping, SemanticMapping):
+            # Score entries sharing a word with the target; substring-only matches fall back to text matching
+            items = mapping.candidates(target_text) or list(mapping.items())
+        else:
+            items = list(mapping.items())
+
         candidates = []
 
-        for text, element_info in mapping.items():
+        for text, element_info in items:
             text_lower = text.lower()
             original_text = element_info.get('original_text', '').lower()
 
@@ -0,0 +1,82 @@
+"""
+Persistent page scripts - helpers installed once per page target.
+
+A script is registered with Page.addScriptToEvaluateOnNewDocument, so the
+browser re-runs it in every document the target loads, and is evaluated once
+in the document that is already open. Callers then only send tiny toggle
+expressions instead of re-injecting the whole script after each navigation
+or action.
+"""
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from browser_use.browser.session import CDPSession
+
+
+class PersistentPageScript:
+    """A page helper script kept installed across navigations of the targets it is installed on."""
+
+    def __init__(self, source: str, teardown: Optional[str] = None, max_sessions: Optional[int] = None):
+        """
+        Args:
+            source: JavaScript run in every document, must be safe to run more than once
+            teardown: Optional expression that undoes the script's effect on the current document
+            max_sessions: Optional number of sessions to remember, least recently used first out.
+                          A forgotten session that is still alive gets the script installed again.
+        """
+        self.source = source
+        self.teardown = teardown
+        self.max_sessions = max_sessions
+        # CDP session ID -> script identifier returned by addScriptToEvaluateOnNewDocument
+        self._identifiers: "OrderedDict[str, str]" = OrderedDict()
+
+    def is_installed(self, cdp_session: 'CDPSession') -> bool:
+        if cdp_session.session_id not in self._identifiers:
+            return False
+        self._identifiers.move_to_end(cdp_session.session_id)
+        return True
+
+    async def install(self, cdp_session: 'CDPSession') -> bool:
+        """
+        Install the script on the session's target if it is not installed yet.
+
+        Returns:
+            True if the script was installed by this call
+        """
+        if self.is_installed(cdp_session):
+            return False
+
+        result = await cdp_session.cdp_client.send.Page.addScriptToEvaluateOnNewDocument(
+            params={'source': self.source},
+            session_id=cdp_session.session_id,
+        )
+        self._identifiers[cdp_session.session_id] = result['identifier']
+        if self.max_sessions is not None:
+            while len(self._identifiers) > self.max_sessions:
+                self._identifiers.popitem(last=False)
+        # Registration only affects future documents, so run it in the current one
+        await cdp_session.cdp_client.send.Runtime.evaluate(
+            params={'expression': self.source, 'returnByValue': True},
+            session_id=cdp_session.session_id,
+        )
+        return True
+
+    async def uninstall(self, cdp_session: 'CDPSession') -> None:
+        """Stop running the script in new documents and tear it down in the current one."""
+        identifier = self._identifiers.pop(cdp_session.session_id, None)
+        if identifier is not None:
+            await cdp_session.cdp_client.send.Page.removeScriptToEvaluateOnNewDocument(
+                params={'identifier': identifier},
+                session_id=cdp_session.session_id,
+            )
+        if self.teardown:
+            await cdp_session.cdp_client.send.Runtime.evaluate(
+                params={'expression': self.teardown, 'returnByValue': True},
+                session_id=cdp_session.session_id,
+            )
+
+    def forget(self, session_id: str) -> None:
+        """Drop the record of a session that no longer exists."""
+        self._identifiers.pop(session_id, None)
@@ -19,6 +19,8 @@ from browser_use.dom.views import (
     SerializedDOMState,
 )
 
+from vibe_surf.telemetry.metrics import timed, timed_phase
+
 if TYPE_CHECKING:
     from browser_use.browser.views import BrowserStateSummary, PageInfo
 
@@ -85,12 +87,16 @@ class CustomDOMWatchdog(DOMWatchdog):
                     else None
                 )
 
-                dom_task = asyncio.create_task(self._build_dom_tree_without_highlights(previous_state))
+                dom_task = asyncio.create_task(
+                    timed('browser_state.dom', self._build_dom_tree_without_highlights(previous_state))
+                )
 
             # Start clean screenshot task if requested (without JS highlights)
             if include_screenshot:
                 self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: 📸 Starting clean screenshot task...')
-                screenshot_task = asyncio.create_task(self.browser_session.take_screenshot_base64())
+                screenshot_task = asyncio.create_task(
+                    timed('browser_state.screenshot', self.browser_session.take_screenshot_base64())
+                )
 
             # Wait for both tasks to complete
             content = None
@@ -126,11 +132,12 @@ class CustomDOMWatchdog(DOMWatchdog):
                     # Get CDP session for viewport info
                     cdp_session = await self.browser_session.get_or_create_cdp_session()
 
-                    screenshot_b64 = await create_highlighted_screenshot_async(
-                        screenshot_b64,
-                        content.selector_map,
-                        cdp_session,
-                    )
+                    with timed_phase('browser_state.highlight'):
+                        screenshot_b64 = await create_highlighted_screenshot_async(
+                            screenshot_b64,
+                            content.selector_map,
+                            cdp_session,
+                        )
                     #
                     # import base64
                     # import os
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import copy
+import json
 import time
+from collections import OrderedDict
 from collections.abc import AsyncGenerator
 from http import HTTPStatus
 from typing import TYPE_CHECKING, Annotated
@@ -109,6 +112,36 @@ def validate_input_and_tweaks(input_request: SimplifiedAPIRequest) -> None:
             raise InvalidChatInputError(msg)
 
 
+# Tweaked graph payloads keyed by (flow id, flow updated_at, tweaks, stream)
+_GRAPH_PAYLOAD_CACHE_SIZE = 64
+_graph_payload_cache: OrderedDict[tuple, dict] = OrderedDict()
+
+
+def _get_graph_payload(flow: Flow, tweaks: Tweaks | dict | None, *, stream: bool) -> dict:
+    """Return a private copy of the flow's graph data with tweaks applied.
+
+    The tweaked payload is computed once per flow version and tweak set; each run
+    gets its own deep copy so that building the graph never mutates the cache
+    or the flow record.
+    """
+    tweaks_dict = tweaks.model_dump() if isinstance(tweaks, Tweaks) else (tweaks or {})
+    cache_key = (
+        str(flow.id),
+        str(flow.updated_at),
+        json.dumps(tweaks_dict, sort_keys=True, default=str),
+        stream,
+    )
+    payload = _graph_payload_cache.get(cache_key)
+    if payload is None:
+        payload = process_tweaks(copy.deepcopy(flow.data), copy.deepcopy(tweaks_dict), stream=stream)
+        _graph_payload_cache[cache_key] = payload
+        if len(_graph_payload_cache) > _GRAPH_PAYLOAD_CACHE_SIZE:
+            _graph_payload_cache.popitem(last=False)
+    else:
+        _graph_payload_cache.move_to_end(cache_key)
+    return copy.deepcopy(payload)
+
+
 async def simple_run_flow(
     flow: Flow,
     input_request: SimplifiedAPIRequest,
@@ -126,8 +159,7 @@ async def simple_run_flow(
         if flow.data is None:
             msg = f"Flow {flow_id_str} has no data"
             raise ValueError(msg)
-        graph_data = flow.data.copy()
-        graph_data = process_tweaks(graph_data, input_request.tweaks or {}, stream=stream)
+        graph_data = _get_graph_payload(flow, input_request.tweaks, stream=stream)
         graph = Graph.from_payload(
             graph_data, flow_id=flow_id_str, user_id=str(user_id), flow_name=flow.name, context=context
         )
@@ -1,3 +1,5 @@
+from collections import OrderedDict
+from threading import Lock
 from typing import TYPE_CHECKING
 
 from vibe_surf.langflow.utils import validate
@@ -5,8 +7,27 @@ from vibe_surf.langflow.utils import validate
 if TYPE_CHECKING:
     from vibe_surf.langflow.custom.custom_component.custom_component import CustomComponent
 
+# Compiled component classes keyed by their source code. Every run of a flow
+# instantiates its components from code, so re-running a flow would otherwise
+# re-parse and re-exec the same sources each time.
+_COMPONENT_CLASS_CACHE_SIZE = 256
+_component_class_cache: "OrderedDict[str, type[CustomComponent]]" = OrderedDict()
+_component_class_cache_lock = Lock()
+
 
 def eval_custom_component_code(code: str) -> type["CustomComponent"]:
     """Evaluate custom component code."""
+    with _component_class_cache_lock:
+        cached_class = _component_class_cache.get(code)
+        if cached_class is not None:
+            _component_class_cache.move_to_end(code)
+            return cached_class
+
     class_name = validate.extract_class_name(code)
-    return validate.create_class(code, class_name)
+    component_class = validate.create_class(code, class_name)
+
+    with _component_class_cache_lock:
+        _component_class_cache[code] = component_class
+        if len(_component_class_cache) > _COMPONENT_CLASS_CACHE_SIZE:
+            _component_class_cache.popitem(last=False)
+    return component_class
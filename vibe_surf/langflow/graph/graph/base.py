@@ -1622,6 +1622,23 @@ class Graph:
             except Exception:
                 await logger.aexception(f"Error executing tasks in layer {layer_index}")
                 raise
+            if event_manager is not None and "on_end_component" in event_manager.events:
+                # Let callers that asked for it stream intermediate results as each layer finishes
+                for vertex_id in current_batch:
+                    vertex = self.get_vertex(vertex_id)
+                    try:
+                        event_manager.on_end_component(
+                            data={
+                                "build_data": {
+                                    "id": vertex.id,
+                                    "display_name": vertex.display_name,
+                                    "data": vertex.result,
+                                }
+                            }
+                        )
+                    except Exception as e:  # noqa: BLE001
+                        # Results that cannot be encoded as JSON are left out of the stream
+                        await logger.adebug(f"Could not stream result of {vertex.id}: {e}")
             if not next_runnable_vertices:
                 break
             to_process.extend(next_runnable_vertices)
@@ -3,6 +3,8 @@ Vibe Surf LLM implementations.
 
 This module provides LLM implementations for vibe_surf, including:
 - ChatOpenAICompatible: OpenAI-compatible implementation with Gemini schema fix support
+- enable_llm_cache: In-flight deduplication and response caching around a chat model
+- RunningTokenCost: Token and cost tracking with running per-model totals
 
 Example usage:
     from vibe_surf.llm import ChatOpenAICompatible
@@ -17,5 +19,7 @@ Example usage:
 """
 
 from vibe_surf.llm.openai_compatible import ChatOpenAICompatible
+from vibe_surf.llm.cache import enable_llm_cache, cacheable_llm_calls
+from vibe_surf.llm.token_cost import RunningTokenCost
 
-__all__ = ['ChatOpenAICompatible']
\ No newline at end of file
+__all__ = ['ChatOpenAICompatible', 'enable_llm_cache', 'cacheable_llm_calls', 'RunningTokenCost']
\ No newline at end of file
@@ -0,0 +1,256 @@
+"""
+Request deduplication and response caching for chat models.
+
+`enable_llm_cache` wraps a chat model's `ainvoke` so that:
+- identical requests that are in flight at the same time share one provider call
+- deterministic requests (temperature 0, or made inside `cacheable_llm_calls()`)
+  are answered from an on-disk cache keyed by model, messages and output schema
+
+Example:
+    llm = enable_llm_cache(ChatOpenAI(model="gpt-4o-mini", temperature=0))
+
+    with cacheable_llm_calls():
+        response = await llm.ainvoke(messages)
+
+Configured with VIBESURF_LLM_CACHE (true/false), VIBESURF_LLM_CACHE_TTL (seconds)
+and VIBESURF_LLM_CACHE_MAX_ENTRIES.
+"""
+import asyncio
+import contextvars
+import hashlib
+import json
+import os
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+import aiofiles
+from pydantic import BaseModel
+
+from browser_use.llm.views import ChatInvokeCompletion
+
+from vibe_surf.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CACHE_TTL = 7 * 24 * 3600
+DEFAULT_CACHE_MAX_ENTRIES = 5000
+
+_cacheable_calls: contextvars.ContextVar[bool] = contextvars.ContextVar('vibesurf_llm_cacheable', default=False)
+
+# Output model class -> hash of its JSON schema
+_schema_hashes: "weakref.WeakKeyDictionary[type, str]" = weakref.WeakKeyDictionary()
+
+
+@contextmanager
+def cacheable_llm_calls(enabled: bool = True):
+    """Mark LLM calls made in this context as deterministic, so their responses may be cached."""
+    token = _cacheable_calls.set(enabled)
+    try:
+        yield
+    finally:
+        _cacheable_calls.reset(token)
+
+
+def _schema_hash(output_format: Optional[type]) -> Optional[str]:
+    if output_format is None:
+        return None
+    schema_hash = _schema_hashes.get(output_format)
+    if schema_hash is None:
+        schema = output_format.model_json_schema()
+        schema_hash = hashlib.sha256(json.dumps(schema, sort_keys=True).encode()).hexdigest()
+        _schema_hashes[output_format] = schema_hash
+    return schema_hash
+
+
+def _request_key(llm, messages: list, output_format: Optional[type]) -> str:
+    payload = {
+        'llm': type(llm).__name__,
+        'model': str(getattr(llm, 'model', '')),
+        'base_url': str(getattr(llm, 'base_url', '') or ''),
+        'temperature': getattr(llm, 'temperature', None),
+        'messages': [
+            message.model_dump(mode='json') if isinstance(message, BaseModel) else message
+            for message in messages
+        ],
+        'output_schema': _schema_hash(output_format),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class LLMResponseCache:
+    """On-disk response store, one JSON file per request key."""
+
+    def __init__(self, cache_dir: str, ttl: float = DEFAULT_CACHE_TTL, max_entries: int = DEFAULT_CACHE_MAX_ENTRIES):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._writes_since_prune = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f'{key}.json')
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            async with aiofiles.open(path, 'r', encoding='utf-8') as f:
+                entry = json.loads(await f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable LLM cache entry {path}: {e}")
+            return None
+
+        if time.time() - entry.get('created_at', 0) > self.ttl:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        return entry
+
+    async def set(self, key: str, entry: Dict[str, Any]):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f'{path}.tmp'
+        async with aiofiles.open(tmp_path, 'w', encoding='utf-8') as f:
+            await f.write(json.dumps(entry, ensure_ascii=False))
+        os.replace(tmp_path, path)
+
+        self._writes_since_prune += 1
+        if self._writes_since_prune >= max(1, self.max_entries // 10):
+            self._writes_since_prune = 0
+            await asyncio.to_thread(self.prune)
+
+    def prune(self):
+        """Remove expired entries and the oldest ones beyond max_entries."""
+        entries = []
+        now = time.time()
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    mtime = os.path.getmtime(path)
+                except OSError:
+                    continue
+                if now - mtime > self.ttl:
+                    os.remove(path)
+                else:
+                    entries.append((mtime, path))
+
+        if len(entries) > self.max_entries:
+            entries.sort()
+            for _, path in entries[:len(entries) - self.max_entries]:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+_response_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_response_cache() -> Optional[LLMResponseCache]:
+    """Return the process-wide response cache, or None when caching is disabled."""
+    global _response_cache
+    if os.getenv('VIBESURF_LLM_CACHE', 'true').lower() in ('false', '0', 'no'):
+        return None
+    if _response_cache is None:
+        from vibe_surf.common import get_workspace_dir
+
+        _response_cache = LLMResponseCache(
+            cache_dir=os.path.join(get_workspace_dir(), 'llm_cache'),
+            ttl=float(os.getenv('VIBESURF_LLM_CACHE_TTL') or DEFAULT_CACHE_TTL),
+            max_entries=int(os.getenv('VIBESURF_LLM_CACHE_MAX_ENTRIES') or DEFAULT_CACHE_MAX_ENTRIES),
+        )
+    return _response_cache
+
+
+def _dump_completion(completion: ChatInvokeCompletion) -> Dict[str, Any]:
+    result = completion.completion
+    return {
+        'created_at': time.time(),
+        'completion': result.model_dump(mode='json') if isinstance(result, BaseModel) else result,
+    }
+
+
+def _load_completion(entry: Dict[str, Any], output_format: Optional[type]) -> ChatInvokeCompletion:
+    completion = entry['completion']
+    if output_format is not None:
+        completion = output_format.model_validate(completion)
+    # Cached answers cost nothing, so they report no usage
+    return ChatInvokeCompletion(completion=completion, usage=None)
+
+
+class _LeaderCancelled(Exception):
+    """The provider call that identical requests were joined to was cancelled"""
+
+
+def enable_llm_cache(llm):
+    """Wrap the model's ainvoke with in-flight deduplication and response caching. Returns the same model."""
+    if getattr(llm, '_vibesurf_llm_cache', False):
+        return llm
+
+    original_ainvoke = llm.ainvoke
+    in_flight: Dict[str, asyncio.Future] = {}
+
+    async def cached_ainvoke(messages, output_format=None, **kwargs):
+        try:
+            key = _request_key(llm, messages, output_format)
+        except Exception as e:
+            logger.debug(f"LLM request is not cacheable: {e}")
+            return await original_ainvoke(messages, output_format, **kwargs)
+
+        pending = in_flight.get(key)
+        while pending is not None:
+            logger.debug(f"Joining in-flight LLM request {key[:8]}")
+            try:
+                result = await asyncio.shield(pending)
+            except _LeaderCancelled:
+                # The caller that made the request went away; make (or join) the call again
+                pending = in_flight.get(key)
+                continue
+            # Usage is reported once, by the caller that made the provider call
+            return result.model_copy(update={'usage': None})
+
+        cache = None
+        if _cacheable_calls.get() or getattr(llm, 'temperature', None) == 0:
+            cache = get_llm_response_cache()
+        if cache is not None:
+            entry = await cache.get(key)
+            if entry is not None:
+                try:
+                    logger.debug(f"LLM cache hit {key[:8]}")
+                    return _load_completion(entry, output_format)
+                except Exception as e:
+                    logger.debug(f"Discarding stale LLM cache entry {key[:8]}: {e}")
+
+        future = asyncio.get_running_loop().create_future()
+        in_flight[key] = future
+        try:
+            result = await original_ainvoke(messages, output_format, **kwargs)
+            future.set_result(result)
+        except asyncio.CancelledError:
+            # Joined requests are not cancelled with the caller, they retry instead
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Retrieve the exception so that an unobserved future does not log a warning
+            future.exception()
+            raise
+        finally:
+            in_flight.pop(key, None)
+
+        if cache is not None:
+            try:
+                await cache.set(key, _dump_completion(result))
+            except Exception as e:
+                logger.debug(f"Failed to store LLM cache entry {key[:8]}: {e}")
+        return result
+
+    llm.ainvoke = cached_ainvoke
+    llm._vibesurf_llm_cache = True
+    return llm
@@ -25,6 +25,7 @@ Example usage:
     )
 """
 import pdb
+import weakref
 from dataclasses import dataclass
 from typing import Any, TypeVar, overload
 from pydantic import BaseModel
@@ -59,6 +60,11 @@ from vibe_surf.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Rewritten schema per output model and provider family:
+# output model class -> {provider: (response_format, schema prompt text)}.
+# Output models are often created dynamically per agent, so entries go away with them.
+_response_format_cache: "weakref.WeakKeyDictionary[type, dict[str, tuple[JSONSchema, str]]]" = weakref.WeakKeyDictionary()
+
 
 @dataclass
 class ChatOpenAICompatible(ChatOpenAI):
@@ -214,6 +220,48 @@ class ChatOpenAICompatible(ChatOpenAI):
 
         return clean_schema(schema)
 
+    def _schema_provider(self) -> str:
+        """Provider family that decides which schema rewrite applies."""
+        if self._is_gemini_model():
+            return 'gemini'
+        if self._is_kimi_model():
+            return 'kimi'
+        return 'default'
+
+    def _get_response_format(self, output_format: type[BaseModel]) -> tuple[JSONSchema, str]:
+        """
+        Build the response_format payload and the schema prompt text for an output model.
+
+        Both are cached per (output model, provider family), so repeated calls skip the
+        schema generation and rewrite and send byte-identical schemas.
+        """
+        provider = self._schema_provider()
+        provider_cache = _response_format_cache.setdefault(output_format, {})
+        cached = provider_cache.get(provider)
+        if cached is not None:
+            return cached
+
+        # Apply appropriate schema fix based on model type
+        original_schema = SchemaOptimizer.create_optimized_json_schema(output_format)
+        if provider == 'gemini':
+            logger.debug(f"🔧 Applying Gemini schema fixes for model: {self.model}")
+            fixed_schema = self._fix_gemini_schema(original_schema)
+        elif provider == 'kimi':
+            logger.debug(f"🔧 Applying Kimi/Moonshot schema fixes for model: {self.model}")
+            fixed_schema = self._fix_kimi_schema(original_schema)
+        else:
+            fixed_schema = original_schema
+        response_format: JSONSchema = {
+            'name': 'agent_output',
+            'strict': True,
+            'schema': fixed_schema,
+        }
+        schema_text = "Your response must return JSON with followed format:\n"
+        schema_text += f'\n<json_schema>\n{response_format}\n</json_schema>'
+
+        provider_cache[provider] = (response_format, schema_text)
+        return response_format, schema_text
+
     async def ainvoke(
             self, messages: list[BaseMessage], output_format: type[T] | None = None
     ) -> ChatInvokeCompletion[T] | ChatInvokeCompletion[str]:
@@ -278,26 +326,10 @@ class ChatOpenAICompatible(ChatOpenAI):
                 )
 
             else:
-                # Apply appropriate schema fix based on model type
-                original_schema = SchemaOptimizer.create_optimized_json_schema(output_format)
-                if self._is_gemini_model():
-                    logger.debug(f"🔧 Applying Gemini schema fixes for model: {self.model}")
-                    fixed_schema = self._fix_gemini_schema(original_schema)
-                elif self._is_kimi_model():
-                    logger.debug(f"🔧 Applying Kimi/Moonshot schema fixes for model: {self.model}")
-                    fixed_schema = self._fix_kimi_schema(original_schema)
-                else:
-                    fixed_schema = original_schema
-                response_format: JSONSchema = {
-                    'name': 'agent_output',
-                    'strict': True,
-                    'schema': fixed_schema,
-                }
+                response_format, schema_text = self._get_response_format(output_format)
 
                 # Add JSON schema to system prompt if requested
                 if self.add_schema_to_system_prompt and openai_messages and openai_messages[0]['role'] == 'system':
-                    schema_text = "Your response must return JSON with followed format:\n"
-                    schema_text += f'\n<json_schema>\n{response_format}\n</json_schema>'
                     if isinstance(openai_messages[0]['content'], str):
                         openai_messages[0]['content'] += schema_text
                     elif isinstance(openai_messages[0]['content'], Iterable):
@@ -0,0 +1,136 @@
+"""
+Token usage accounting with running totals.
+
+browser_use's TokenCost keeps every usage entry and re-aggregates the whole
+history, pricing each entry again, whenever a summary is requested. Agents
+read the totals after every step, so that cost grows with the session.
+`RunningTokenCost` keeps per-model counters that are updated as each response
+is registered; `total_tokens` and `total_cost` are plain reads, and
+`get_usage_summary()` builds its result from the counters.
+
+Example:
+    token_cost_service = RunningTokenCost(include_cost=True)
+    llm = token_cost_service.register_llm(llm)
+    ...
+    print(token_cost_service.total_tokens, token_cost_service.total_cost)
+"""
+import asyncio
+from datetime import datetime
+from typing import Dict, Optional, Set
+
+from browser_use.llm.views import ChatInvokeUsage
+from browser_use.tokens.service import TokenCost
+from browser_use.tokens.views import ModelUsageStats, ModelUsageTokens, TokenUsageEntry, UsageSummary
+
+from vibe_surf.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RunningTokenCost(TokenCost):
+    """TokenCost that keeps per-model token and cost counters up to date as usage is added"""
+
+    def __init__(self, include_cost: bool = False):
+        super().__init__(include_cost=include_cost)
+        # Bumped by clear_history so that costs still pending for old entries are dropped
+        self._generation = 0
+        self._reset_counters()
+        # Cost lookups may need the pricing data loaded, so they finish in the background
+        self._pending_costs: Set[asyncio.Task] = set()
+
+    def _reset_counters(self):
+        self._by_model: Dict[str, ModelUsageStats] = {}
+        self._cached_tokens_by_model: Dict[str, int] = {}
+        self._prompt_tokens = 0
+        self._prompt_cached_tokens = 0
+        self._completion_tokens = 0
+        self._prompt_cost = 0.0
+        self._prompt_cached_cost = 0.0
+        self._completion_cost = 0.0
+
+    @property
+    def total_tokens(self) -> int:
+        return self._prompt_tokens + self._completion_tokens
+
+    @property
+    def total_cost(self) -> float:
+        """Cost of all usage so far; responses from the last moments may not be priced yet"""
+        return self._prompt_cost + self._completion_cost + self._prompt_cached_cost
+
+    def add_usage(self, model: str, usage: ChatInvokeUsage) -> TokenUsageEntry:
+        entry = super().add_usage(model, usage)
+
+        stats = self._by_model.get(model)
+        if stats is None:
+            stats = self._by_model[model] = ModelUsageStats(model=model)
+        stats.prompt_tokens += usage.prompt_tokens
+        stats.completion_tokens += usage.completion_tokens
+        stats.total_tokens += usage.prompt_tokens + usage.completion_tokens
+        stats.invocations += 1
+        stats.average_tokens_per_invocation = stats.total_tokens / stats.invocations
+        self._cached_tokens_by_model[model] = self._cached_tokens_by_model.get(model, 0) + (
+                usage.prompt_cached_tokens or 0)
+
+        self._prompt_tokens += usage.prompt_tokens
+        self._prompt_cached_tokens += usage.prompt_cached_tokens or 0
+        self._completion_tokens += usage.completion_tokens
+
+        if self.include_cost:
+            try:
+                task = asyncio.get_running_loop().create_task(self._add_cost(model, usage, self._generation))
+            except RuntimeError:
+                logger.debug(f"No event loop to price usage of {model}, cost not counted")
+            else:
+                self._pending_costs.add(task)
+                task.add_done_callback(self._pending_costs.discard)
+
+        return entry
+
+    async def _add_cost(self, model: str, usage: ChatInvokeUsage, generation: int):
+        try:
+            cost = await self.calculate_cost(model, usage)
+        except Exception as e:
+            logger.debug(f"Failed to price usage of {model}: {e}")
+            return
+        if cost is None or generation != self._generation:
+            return
+        self._by_model[model].cost += cost.total_cost
+        self._prompt_cost += cost.prompt_cost
+        self._completion_cost += cost.completion_cost
+        self._prompt_cached_cost += cost.prompt_read_cached_cost or 0
+
+    def get_usage_tokens_for_model(self, model: str) -> ModelUsageTokens:
+        stats = self._by_model.get(model) or ModelUsageStats(model=model)
+        return ModelUsageTokens(
+            model=model,
+            prompt_tokens=stats.prompt_tokens,
+            prompt_cached_tokens=self._cached_tokens_by_model.get(model, 0),
+            completion_tokens=stats.completion_tokens,
+            total_tokens=stats.total_tokens,
+        )
+
+    async def get_usage_summary(self, model: Optional[str] = None, since: Optional[datetime] = None) -> UsageSummary:
+        # Filtered summaries still need the history
+        if model or since:
+            return await super().get_usage_summary(model=model, since=since)
+
+        if self._pending_costs:
+            await asyncio.gather(*self._pending_costs, return_exceptions=True)
+
+        return UsageSummary(
+            total_prompt_tokens=self._prompt_tokens,
+            total_prompt_cost=self._prompt_cost,
+            total_prompt_cached_tokens=self._prompt_cached_tokens,
+            total_prompt_cached_cost=self._prompt_cached_cost,
+            total_completion_tokens=self._completion_tokens,
+            total_completion_cost=self._completion_cost,
+            total_tokens=self.total_tokens,
+            total_cost=self.total_cost,
+            entry_count=len(self.usage_history),
+            by_model={name: stats.model_copy() for name, stats in self._by_model.items()},
+        )
+
+    def clear_history(self) -> None:
+        super().clear_history()
+        self._generation += 1
+        self._reset_counters()
@@ -1,94 +1,223 @@
 """
 Logger configuration for VibeSurf.
+
+All VibeSurf loggers share a single process-wide pipeline: records are put on
+an in-memory queue by one `QueueHandler` and written by a `QueueListener`
+thread to one console sink and one rotating file sink, so logging never does
+disk I/O on the event loop thread.
+
+Environment variables:
+    VIBESURF_DEBUG: Enable DEBUG level and verbose format
+    VIBESURF_LOG_FORMAT: "text" (default) or "json" for structured output
+    VIBESURF_LOG_LEVELS: Per-module level overrides, e.g.
+        "vibe_surf.browser=DEBUG,vibe_surf.tools.website_api=WARNING"
 """
+import atexit
+import json
 import logging
 import os
+import queue
+import threading
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Optional
 
 from .common import get_workspace_dir
 
+# Maximum number of records waiting to be written
+LOG_QUEUE_SIZE = 10000
+# Queue fill ratio above which only every Nth DEBUG record is kept
+DEBUG_SAMPLE_WATERMARK = 0.5
+DEBUG_SAMPLE_RATE = 10
+# Queue fill ratio above which DEBUG records are dropped
+DEBUG_DROP_WATERMARK = 0.8
+
+_pipeline_lock = threading.Lock()
+_queue_handler: Optional["PressureAwareQueueHandler"] = None
+_queue_listener: Optional[QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "file": record.filename,
+            "line": record.lineno,
+            "func": record.funcName,
+        }
+        return json.dumps(payload, ensure_ascii=False)
+
+
+class PressureAwareQueueHandler(QueueHandler):
+    """
+    QueueHandler that sheds DEBUG records when the log queue backs up.
+
+    Records at INFO and above are always enqueued. DEBUG records are sampled
+    once the queue passes DEBUG_SAMPLE_WATERMARK and dropped past
+    DEBUG_DROP_WATERMARK; the number of shed records is reported once the
+    pressure is gone.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self._debug_seen = 0
+        self._debug_shed = 0
+
+    def enqueue(self, record: logging.LogRecord):
+        if record.levelno <= logging.DEBUG and self.queue.maxsize:
+            fill_ratio = self.queue.qsize() / self.queue.maxsize
+            self._debug_seen += 1
+            if fill_ratio >= DEBUG_DROP_WATERMARK or (
+                    fill_ratio >= DEBUG_SAMPLE_WATERMARK and self._debug_seen % DEBUG_SAMPLE_RATE):
+                self._debug_shed += 1
+                return
+        if self._debug_shed and self.queue.qsize() < self.queue.maxsize * DEBUG_SAMPLE_WATERMARK:
+            shed, self._debug_shed = self._debug_shed, 0
+            self.queue.put(logging.makeLogRecord({
+                "name": __name__,
+                "levelno": logging.WARNING,
+                "levelname": "WARNING",
+                "msg": f"Dropped {shed} DEBUG log records under logging pressure",
+            }))
+        # Block rather than lose INFO and above
+        self.queue.put(record)
+
+
+def _is_debug_mode() -> bool:
+    return os.getenv("VIBESURF_DEBUG", "false").lower() in ("true", "1", "yes", "on")
+
+
+def _parse_level_overrides() -> Dict[str, int]:
+    """Parse VIBESURF_LOG_LEVELS into a {logger prefix: level} mapping."""
+    overrides = {}
+    for item in os.getenv("VIBESURF_LOG_LEVELS", "").split(","):
+        if "=" not in item:
+            continue
+        module, level_name = (part.strip() for part in item.split("=", 1))
+        level = logging.getLevelName(level_name.upper())
+        if module and isinstance(level, int):
+            overrides[module] = level
+    return overrides
+
+
+def _resolve_level(name: str, default_level: int) -> int:
+    """Return the level override with the longest matching prefix, if any."""
+    best_match, best_level = "", default_level
+    for module, level in _parse_level_overrides().items():
+        if (name == module or name.startswith(module + ".")) and len(module) > len(best_match):
+            best_match, best_level = module, level
+    return best_level
+
+
+def _build_formatter(debug_mode: bool) -> logging.Formatter:
+    if os.getenv("VIBESURF_LOG_FORMAT", "text").lower() == "json":
+        return JsonFormatter(datefmt='%Y-%m-%d %H:%M:%S')
+    # Create formatter with file and line info
+    if debug_mode:
+        return logging.Formatter(
+            fmt='%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(funcName)s() - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+    return logging.Formatter(
+        fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
+
+def _get_queue_handler() -> "PressureAwareQueueHandler":
+    """Create the process-wide queue handler and start its listener on first use."""
+    global _queue_handler, _queue_listener
+    if _queue_handler is not None:
+        return _queue_handler
+
+    with _pipeline_lock:
+        if _queue_handler is not None:
+            return _queue_handler
+
+        formatter = _build_formatter(_is_debug_mode())
+        sinks = []
+
+        # Console sink - log to terminal
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(formatter)
+        sinks.append(console_handler)
+
+        # File sink - log to file
+        file_error = None
+        try:
+            workspace_dir = get_workspace_dir()
+            logs_dir = os.path.join(workspace_dir, "logs")
+            os.makedirs(logs_dir, exist_ok=True)
+
+            # Create log filename with current date
+            current_date = datetime.now().strftime("%Y-%m-%d")
+            log_filename = f"log_{current_date}.log"
+            log_filepath = os.path.join(logs_dir, log_filename)
+
+            # Use RotatingFileHandler to manage log file size
+            file_handler = RotatingFileHandler(
+                log_filepath,
+                maxBytes=10 * 1024 * 1024,  # 10MB
+                backupCount=5,
+                encoding='utf-8'
+            )
+            file_handler.setFormatter(formatter)
+            sinks.append(file_handler)
+        except Exception as e:
+            file_error = e
+
+        log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        _queue_listener = QueueListener(log_queue, *sinks, respect_handler_level=True)
+        _queue_listener.start()
+        atexit.register(_queue_listener.stop)
+        _queue_handler = PressureAwareQueueHandler(log_queue)
+
+        if file_error is not None:
+            fallback_logger = logging.getLogger(__name__)
+            fallback_logger.addHandler(_queue_handler)
+            fallback_logger.error(f"Failed to setup file logging: {file_error}")
+            fallback_logger.warning("Continuing with console logging only")
+
+    return _queue_handler
+
 
 def setup_logger(name: str = "vibesurf") -> logging.Logger:
     """
     Set up and configure the logger for VibeSurf.
-    
+
     Args:
         name (str): Logger name, defaults to "vibesurf"
-        
+
     Returns:
         logging.Logger: Configured logger instance
     """
     # Get debug flag from environment variable
-    debug_mode = os.getenv("VIBESURF_DEBUG", "false").lower() in ("true", "1", "yes", "on")
-    log_level = logging.DEBUG if debug_mode else logging.INFO
-    
+    log_level = logging.DEBUG if _is_debug_mode() else logging.INFO
+
     # Create logger
     logger = logging.getLogger(name)
-    logger.setLevel(log_level)
-    
+    logger.setLevel(_resolve_level(name, log_level))
+
     # Avoid adding handlers multiple times
-    if logger.handlers:
-        return logger
-    
-    # Create formatter with file and line info
-    if log_level == logging.DEBUG:
-        formatter = logging.Formatter(
-            fmt='%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(funcName)s() - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-    else:
-        formatter = logging.Formatter(
-            fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-    
-    # Console handler - log to terminal
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(log_level)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
-    # File handler - log to file
-    try:
-        workspace_dir = get_workspace_dir()
-        logs_dir = os.path.join(workspace_dir, "logs")
-        os.makedirs(logs_dir, exist_ok=True)
-        
-        # Create log filename with current date
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        log_filename = f"log_{current_date}.log"
-        log_filepath = os.path.join(logs_dir, log_filename)
-        
-        # Use RotatingFileHandler to manage log file size
-        file_handler = RotatingFileHandler(
-            log_filepath,
-            maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=5,
-            encoding='utf-8'
-        )
-        file_handler.setLevel(log_level)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-        
-        # logger.info(f"Logger initialized. Log level: {logging.getLevelName(log_level)}")
-        # logger.info(f"WorkSpace directory: {workspace_dir}")
-        # logger.info(f"Log file: {log_filepath}")
-        
-    except Exception as e:
-        logger.error(f"Failed to setup file logging: {e}")
-        logger.warning("Continuing with console logging only")
-    
+    queue_handler = _get_queue_handler()
+    if queue_handler not in logger.handlers:
+        logger.addHandler(queue_handler)
+
     return logger
 
 
 def get_logger(name: str = "vibesurf") -> logging.Logger:
     """
     Get or create a logger instance.
-    
+
     Args:
         name (str): Logger name, defaults to "vibesurf"
-        
+
     Returns:
         logging.Logger: Logger instance
     """
@@ -96,4 +225,4 @@ def get_logger(name: str = "vibesurf") -> logging.Logger:
 
 
 # Create default logger instance
-default_logger = get_logger()
\ No newline at end of file
+default_logger = get_logger()
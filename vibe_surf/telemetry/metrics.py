@@ -0,0 +1,173 @@
+"""
+Local timing metrics for agent runs.
+
+Agent code wraps the phases of a step in `timed_phase(...)`. Every span is
+observed in a Prometheus histogram (served by the backend at /metrics) and,
+while a task is tracked with `track_task_timings(task_id)`, added to that
+task's timing summary. Nothing here leaves the machine.
+
+Phases:
+    step                      - one whole agent step
+    context_build             - building the prompt context for a step
+    llm_call                  - waiting for the model
+    browser_state             - capturing the page state, with the
+    browser_state.dom           DOM tree, screenshot and highlight
+    browser_state.screenshot    sub-phases measured separately
+    browser_state.highlight
+    action                    - executing the chosen actions
+    persistence               - saving history, activity logs and files
+"""
+import contextvars
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Awaitable, Dict, Optional, TypeVar
+
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Histogram, generate_latest
+
+from vibe_surf.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar('T')
+
+# Dedicated registry so /metrics only carries VibeSurf agent metrics
+METRICS_REGISTRY = CollectorRegistry(auto_describe=True)
+
+PHASE_SECONDS = Histogram(
+    'vibesurf_agent_phase_seconds',
+    'Time spent in each phase of an agent step',
+    ['agent', 'phase'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+    registry=METRICS_REGISTRY,
+)
+
+TASK_SECONDS = Histogram(
+    'vibesurf_task_duration_seconds',
+    'Wall time of a VibeSurf task',
+    ['status'],
+    buckets=(1, 5, 10, 30, 60, 120, 300, 600, 1200, 1800, 3600),
+    registry=METRICS_REGISTRY,
+)
+
+# Summaries of the most recent tasks, kept for the timing endpoint
+MAX_RECENT_TASK_TIMINGS = 100
+
+_current_agent: contextvars.ContextVar[str] = contextvars.ContextVar('vibesurf_metrics_agent', default='unknown')
+_current_task_timings: contextvars.ContextVar[Optional['TaskTimings']] = contextvars.ContextVar(
+    'vibesurf_task_timings', default=None
+)
+_running_task_timings: Dict[str, 'TaskTimings'] = {}
+_recent_task_timings: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+
+
+class TaskTimings:
+    """Per-phase totals for one task, shared by every agent working on it."""
+
+    def __init__(self, task_id: str):
+        self.task_id = task_id
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        self.wall_seconds: Optional[float] = None
+        # Final task status for the duration histogram, set by the caller when known
+        self.status: Optional[str] = None
+        # (agent, phase) -> [count, total seconds, max seconds]
+        self._phases: Dict[tuple, list] = {}
+
+    def add(self, agent: str, phase: str, seconds: float):
+        entry = self._phases.get((agent, phase))
+        if entry is None:
+            self._phases[(agent, phase)] = [1, seconds, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] = max(entry[2], seconds)
+
+    def finish(self) -> float:
+        self.wall_seconds = time.perf_counter() - self._start
+        return self.wall_seconds
+
+    def summary(self) -> Dict[str, Any]:
+        agents: Dict[str, Dict[str, Any]] = {}
+        for (agent, phase), (count, total, longest) in sorted(self._phases.items()):
+            agents.setdefault(agent, {})[phase] = {
+                'count': count,
+                'total_seconds': round(total, 4),
+                'mean_seconds': round(total / count, 4),
+                'max_seconds': round(longest, 4),
+            }
+        wall_seconds = self.wall_seconds if self.wall_seconds is not None else time.perf_counter() - self._start
+        return {
+            'task_id': self.task_id,
+            'started_at': self.started_at,
+            'wall_seconds': round(wall_seconds, 4),
+            'agents': agents,
+        }
+
+
+def record_phase(phase: str, seconds: float, agent: Optional[str] = None):
+    agent = agent or _current_agent.get()
+    PHASE_SECONDS.labels(agent=agent, phase=phase).observe(seconds)
+    task_timings = _current_task_timings.get()
+    if task_timings is not None:
+        task_timings.add(agent, phase, seconds)
+
+
+@contextmanager
+def timed_phase(phase: str, agent: Optional[str] = None):
+    """Time the enclosed block as one span of `phase`, also when it raises."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_phase(phase, time.perf_counter() - start, agent)
+
+
+async def timed(phase: str, awaitable: Awaitable[T], agent: Optional[str] = None) -> T:
+    """Await `awaitable` as one span of `phase`; use for work started as a separate task."""
+    with timed_phase(phase, agent):
+        return await awaitable
+
+
+@contextmanager
+def metrics_agent(agent: str):
+    """Attribute spans recorded in this context to `agent`."""
+    token = _current_agent.set(agent)
+    try:
+        yield
+    finally:
+        _current_agent.reset(token)
+
+
+@contextmanager
+def track_task_timings(task_id: str):
+    """Collect the spans of everything run in this context, including tasks it starts, into one summary."""
+    task_timings = TaskTimings(task_id)
+    token = _current_task_timings.set(task_timings)
+    _running_task_timings[task_id] = task_timings
+    status = 'failed'
+    try:
+        yield task_timings
+        status = task_timings.status or 'completed'
+    finally:
+        _current_task_timings.reset(token)
+        _running_task_timings.pop(task_id, None)
+        TASK_SECONDS.labels(status=status).observe(task_timings.finish())
+        _recent_task_timings[task_id] = task_timings.summary()
+        _recent_task_timings.move_to_end(task_id)
+        while len(_recent_task_timings) > MAX_RECENT_TASK_TIMINGS:
+            _recent_task_timings.popitem(last=False)
+        logger.debug(f"⏱️ Task {task_id} timings: {_recent_task_timings[task_id]}")
+
+
+def get_task_timings(task_id: str) -> Optional[Dict[str, Any]]:
+    """Timing summary of a running or recently finished task."""
+    task_timings = _running_task_timings.get(task_id)
+    if task_timings is not None:
+        return task_timings.summary()
+    return _recent_task_timings.get(task_id)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Return the metrics in Prometheus text format and its content type."""
+    return generate_latest(METRICS_REGISTRY), CONTENT_TYPE_LATEST
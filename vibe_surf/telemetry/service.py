@@ -1,6 +1,10 @@
+import atexit
 import logging
 import os
 import pdb
+import threading
+from collections import deque
+from typing import Any, Dict, List, Optional
 
 from dotenv import load_dotenv
 from posthog import Posthog
@@ -19,6 +23,50 @@ POSTHOG_EVENT_SETTINGS = {
     'process_person_profile': True,
 }
 
+# Events kept in memory before the oldest ones are dropped
+TELEMETRY_BUFFER_SIZE = 1000
+# The worker drains the buffer once this many events are waiting...
+TELEMETRY_BATCH_SIZE = 50
+# ...or after this many seconds, whichever comes first
+TELEMETRY_FLUSH_INTERVAL = 10.0
+# Longest time shutdown waits for the last batch to be delivered
+TELEMETRY_SHUTDOWN_TIMEOUT = 5.0
+
+
+class TelemetrySink:
+    """Destination for batches of captured telemetry events."""
+
+    def send(self, events: List[Dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class PostHogSink(TelemetrySink):
+    """Deliver events to PostHog."""
+
+    def __init__(self, client: Posthog):
+        self._client = client
+
+    def send(self, events: List[Dict[str, Any]]) -> None:
+        for event in events:
+            self._client.capture(**event)
+        self._client.flush()
+
+    def close(self) -> None:
+        self._client.shutdown()
+
+
+class LocalTelemetrySink(TelemetrySink):
+    """Keep events in memory instead of sending them, for tests and offline runs."""
+
+    def __init__(self):
+        self.events: List[Dict[str, Any]] = []
+
+    def send(self, events: List[Dict[str, Any]]) -> None:
+        self.events.extend(events)
+
 
 @singleton
 class ProductTelemetry:
@@ -42,6 +90,13 @@ class ProductTelemetry:
         telemetry_disabled = not telemetry_enabled
         self._ensure_no_proxy()
 
+        self._sink: Optional[TelemetrySink] = None
+        self._buffer: deque = deque(maxlen=TELEMETRY_BUFFER_SIZE)
+        self._buffer_cond = threading.Condition()
+        self._dropped_events = 0
+        self._worker: Optional[threading.Thread] = None
+        self._stopping = False
+
         if telemetry_disabled:
             self._posthog_client = None
         else:
@@ -59,6 +114,9 @@ class ProductTelemetry:
 
         if self._posthog_client is None:
             logger.debug('Telemetry disabled')
+        else:
+            self._sink = PostHogSink(self._posthog_client)
+            atexit.register(self.shutdown)
 
     def _ensure_no_proxy(self):
         current_no_proxy = os.environ.get('no_proxy', '')
@@ -89,37 +147,86 @@ class ProductTelemetry:
             os.environ['no_proxy'] = new_no_proxy
             os.environ['NO_PROXY'] = new_no_proxy
 
-    def capture(self, event: BaseTelemetryEvent) -> None:
-        if self._posthog_client is None:
-            return
-
-        self._direct_capture(event)
+    def set_sink(self, sink: TelemetrySink) -> None:
+        """Route events to another sink, e.g. a LocalTelemetrySink in tests"""
+        with self._buffer_cond:
+            self._sink = sink
+            self._stopping = False
 
-    def _direct_capture(self, event: BaseTelemetryEvent) -> None:
-        """
-        Should not be thread blocking because posthog magically handles it
-        """
-        if self._posthog_client is None:
+    def capture(self, event: BaseTelemetryEvent) -> None:
+        """Buffer an event; it is delivered in the background and never blocks the caller"""
+        if self._sink is None:
             return
 
         try:
-            self._posthog_client.capture(
-                distinct_id=self.user_id,
-                event=event.name,
-                properties={**event.properties, **POSTHOG_EVENT_SETTINGS},
-            )
+            payload = {
+                'distinct_id': self.user_id,
+                'event': event.name,
+                'properties': {**event.properties, **POSTHOG_EVENT_SETTINGS},
+            }
         except Exception as e:
-            logger.error(f'Failed to send telemetry event {event.name}: {e}')
+            logger.error(f'Failed to capture telemetry event {event.name}: {e}')
+            return
+
+        with self._buffer_cond:
+            if self._stopping:
+                return
+            if len(self._buffer) == self._buffer.maxlen:
+                # deque drops the oldest event on append
+                self._dropped_events += 1
+            self._buffer.append(payload)
+            self._ensure_worker()
+            if len(self._buffer) >= TELEMETRY_BATCH_SIZE:
+                self._buffer_cond.notify()
 
     def flush(self) -> None:
-        if self._posthog_client:
+        """Ask the worker to send buffered events now, without waiting for delivery"""
+        with self._buffer_cond:
+            if self._buffer:
+                self._buffer_cond.notify()
+
+    def shutdown(self, timeout: float = TELEMETRY_SHUTDOWN_TIMEOUT) -> None:
+        """Deliver remaining events and stop the worker; call once at process exit"""
+        with self._buffer_cond:
+            if self._stopping:
+                return
+            self._stopping = True
+            self._buffer_cond.notify()
+            worker = self._worker
+
+        if worker is not None:
+            worker.join(timeout)
+        if self._sink is not None:
             try:
-                self._posthog_client.flush()
-                logger.debug('PostHog client telemetry queue flushed.')
+                self._sink.close()
             except Exception as e:
-                logger.error(f'Failed to flush PostHog client: {e}')
-        else:
-            logger.debug('PostHog client not available, skipping flush.')
+                logger.debug(f'Failed to close telemetry sink: {e}')
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run_worker, name='vibesurf-telemetry', daemon=True)
+            self._worker.start()
+
+    def _run_worker(self) -> None:
+        while True:
+            with self._buffer_cond:
+                if not self._stopping and len(self._buffer) < TELEMETRY_BATCH_SIZE:
+                    self._buffer_cond.wait(TELEMETRY_FLUSH_INTERVAL)
+                batch = list(self._buffer)
+                self._buffer.clear()
+                dropped, self._dropped_events = self._dropped_events, 0
+                sink = self._sink
+                stopping = self._stopping
+
+            if dropped:
+                logger.debug(f'Telemetry buffer full, dropped {dropped} oldest events')
+            if batch and sink is not None:
+                try:
+                    sink.send(batch)
+                except Exception as e:
+                    logger.debug(f'Failed to send {len(batch)} telemetry events: {e}')
+            if stopping:
+                return
 
     @property
     def user_id(self) -> str:
@@ -12,18 +12,19 @@ import os
 import io
 import re
 import time
+import httpx
+import base64
 import random
-import requests
+import asyncio
 import dashscope
-import subprocess
+import threading
 import numpy as np
-import concurrent.futures
 
 from tqdm import tqdm
 from datetime import timedelta
 from collections import Counter
 from urllib.parse import urlparse
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, AsyncIterator
 
 # Optional dependencies - only required when using ASR functionality
 try:
@@ -39,6 +40,9 @@ except ImportError:
 WAV_SAMPLE_RATE = 16000
 MAX_API_RETRY = 10
 API_RETRY_SLEEP = (1, 2)
+MAX_INLINE_AUDIO_BYTES = 10 * 1024 * 1024
+MIN_VAD_SEGMENT_S = 0.5
+VAD_TAIL_MARGIN_S = 1.0
 
 language_code_mapping = {
     "ar": "Arabic",
@@ -54,6 +58,22 @@ language_code_mapping = {
     "es": "Spanish"
 }
 
+# Silero VAD is loaded once per process and shared by all processors.
+# The model keeps recurrent state between windows, so inference is serialized.
+_vad_model = None
+_vad_model_lock = threading.Lock()
+_vad_infer_lock = threading.Lock()
+
+
+def get_vad_model():
+    """Return the process-wide Silero VAD model, loading it on first use"""
+    global _vad_model
+    if _vad_model is None:
+        with _vad_model_lock:
+            if _vad_model is None:
+                _vad_model = load_silero_vad(onnx=True)
+    return _vad_model
+
 
 class Qwen3ASRProcessor:
     """
@@ -61,6 +81,10 @@ class Qwen3ASRProcessor:
     
     This class provides an interface to process audio/video files and generate
     transcriptions with optional SRT subtitle files using Qwen3-ASR-Flash API.
+
+    Media is processed as a pipeline: ffmpeg decodes the input in chunks, VAD
+    segments are emitted as soon as they are final, and each segment is encoded
+    in memory and recognized while decoding continues.
     
     Example:
         >>> processor = Qwen3ASRProcessor(dashscope_api_key="your_api_key")
@@ -80,6 +104,7 @@ class Qwen3ASRProcessor:
         min_srt_duration: float = 2.0,
         tmp_dir: Optional[str] = None,
         silence: bool = True,
+        decode_chunk_s: float = 30.0,
     ):
         """
         Initialize Qwen3ASRProcessor
@@ -87,8 +112,9 @@ class Qwen3ASRProcessor:
         Args:
             dashscope_api_key: DashScope API key (if not provided, uses DASHSCOPE_API_KEY env var)
             model: Model name (default: "qwen3-asr-flash")
-            num_threads: Number of threads for parallel API calls (default: 4)
+            num_threads: Number of concurrent API calls (default: 4)
             vad_segment_threshold: VAD segment threshold in SECONDS (default: 120s = 2min)
+                - Continuous speech longer than this is force-split into separate segments
             min_speech_duration_ms: Minimum speech duration in MILLISECONDS (default: 150ms)
             min_silence_duration_ms: Minimum silence duration in MILLISECONDS (default: 500ms)
             max_srt_duration: Maximum SRT subtitle duration in SECONDS (default: 3.0s)
@@ -97,7 +123,7 @@ class Qwen3ASRProcessor:
                 - Chunks shorter than this (after natural breakpoint split) will be merged
             tmp_dir: Temporary directory for processing (default: ~/qwen3-asr-cache)
             silence: Reduce terminal output (default: False)
-            vad_threshold: VAD detection threshold 0.0-1.0 (default: 0.5)
+            decode_chunk_s: Size of each decoded audio chunk fed to VAD in SECONDS (default: 30s)
         """
         if dashscope_api_key:
             dashscope.api_key = dashscope_api_key
@@ -114,6 +140,7 @@ class Qwen3ASRProcessor:
         self.min_srt_duration = min_srt_duration
         self.tmp_dir = tmp_dir or os.path.join(os.path.expanduser("~"), "qwen3-asr-cache")
         self.silence = silence
+        self.decode_chunk_s = decode_chunk_s
         
     def _check_asr_deps(self):
         """Check if ASR dependencies are available."""
@@ -133,6 +160,33 @@ class Qwen3ASRProcessor:
         """
         Process audio/video file and generate transcription with optional SRT subtitles
 
+        Blocking wrapper around `arun`; use `arun` directly from async code.
+
+        Args:
+            input_file: Path to input media file (local path or HTTP URL)
+            context: Context text for Qwen3-ASR-Flash
+            save_srt: Whether to save SRT subtitle file (default: True)
+            output_dir: Output directory for results (default: same as input file)
+
+        Returns:
+            str: Path to the generated SRT file (or text file if save_srt=False)
+        """
+        return asyncio.run(self.arun(input_file, context, save_srt, output_dir))
+
+    async def arun(
+        self,
+        input_file: str,
+        context: str = "",
+        save_srt: bool = True,
+        output_dir: Optional[str] = None
+    ) -> str:
+        """
+        Process audio/video file and generate transcription with optional SRT subtitles
+
+        Recognition of the first segments starts while the rest of the media is
+        still being decoded, and only a bounded number of encoded segments is
+        kept in memory at any time.
+
         Args:
             input_file: Path to input media file (local path or HTTP URL)
             context: Context text for Qwen3-ASR-Flash
@@ -146,80 +200,57 @@ class Qwen3ASRProcessor:
         self._check_asr_deps()
 
         # Check if input file exists
-        if input_file.startswith(("http://", "https://")):
+        await self._check_input_file(input_file)
+
+        # Segment bounds only; audio data is released once a segment is recognized
+        wav_list: List[Tuple[int, int, None]] = []
+        # Limits concurrent API calls
+        api_semaphore = asyncio.Semaphore(self.num_threads)
+        # Limits encoded segments waiting for or in recognition (decode backpressure)
+        pending_semaphore = asyncio.Semaphore(self.num_threads * 2)
+        pbar = tqdm(total=0, desc="Calling Qwen3-ASR-Flash API", disable=self.silence)
+
+        async def recognize(idx: int, wav_data: np.ndarray) -> Tuple[int, str, str]:
             try:
-                response = requests.head(input_file, allow_redirects=True, timeout=5)
-                if response.status_code >= 400:
-                    raise FileNotFoundError(f"returned status code {response.status_code}")
-            except Exception as e:
-                raise FileNotFoundError(
-                    f"HTTP link {input_file} does not exist or is inaccessible: {str(e)}"
-                )
-        elif not os.path.exists(input_file):
-            raise FileNotFoundError(f"Input file \"{input_file}\" does not exist!")
-        
-        # Load audio
-        wav = self._load_audio(input_file)
-        if not self.silence:
-            print(f"Loaded wav duration: {len(wav) / WAV_SAMPLE_RATE:.2f}s")
-        
-        # Segment audio using VAD
-        if not self.silence:
-            print(f"Initializing Silero VAD model for segmenting...")
-        from silero_vad import load_silero_vad
-        worker_vad_model = load_silero_vad(onnx=True)
-        wav_list = self._process_vad(wav, worker_vad_model)
+                audio_uri = await asyncio.to_thread(self._encode_segment, wav_data)
+                async with api_semaphore:
+                    language, recog_text = await asyncio.to_thread(self._asr, audio_uri, context)
+                pbar.update(1)
+                return idx, language, recog_text
+            finally:
+                pending_semaphore.release()
+
+        tasks = []
+        try:
+            async for start_sample, end_sample, wav_data in self._stream_segments(input_file):
+                await pending_semaphore.acquire()
+                idx = len(wav_list)
+                wav_list.append((start_sample, end_sample, None))
+                tasks.append(asyncio.create_task(recognize(idx, wav_data)))
+                pbar.total = len(wav_list)
+                pbar.refresh()
+            outputs = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            pbar.close()
 
         if not self.silence:
             print(f"Segmenting done, total segments: {len(wav_list)}")
-        
-        # Save processed audio to tmp dir
-        wav_name = os.path.basename(input_file)
-        wav_dir_name = os.path.splitext(wav_name)[0]
-        save_dir = os.path.join(self.tmp_dir, wav_dir_name)
-        
-        wav_path_list = []
-        for idx, (_, _, wav_data) in enumerate(wav_list):
-            wav_path = os.path.join(save_dir, f"{wav_name}_{idx}.wav")
-            self._save_audio_file(wav_data, wav_path)
-            wav_path_list.append(wav_path)
-        
-        # Multithread call qwen3-asr-flash api
-        results = []
-        languages = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.num_threads) as executor:
-            future_dict = {
-                executor.submit(self._asr, wav_path, context): idx
-                for idx, wav_path in enumerate(wav_path_list)
-            }
-            pbar = tqdm(total=len(future_dict), desc="Calling Qwen3-ASR-Flash API")
-            for future in concurrent.futures.as_completed(future_dict):
-                idx = future_dict[future]
-                language, recog_text = future.result()
-                results.append((idx, recog_text))
-                languages.append(language)
-                if not self.silence:
-                    pbar.update(1)
-            if not self.silence:
-                pbar.close()
-        
+
         # Sort and splice in the original order
-        results.sort(key=lambda x: x[0])
+        results = sorted(((idx, recog_text) for idx, _, recog_text in outputs), key=lambda x: x[0])
+        languages = [language for _, language, _ in outputs]
         full_text = " ".join(text for _, text in results)
-        language = Counter(languages).most_common(1)[0][0]
+        language = Counter(languages).most_common(1)[0][0] if languages else "Not Supported"
         
         if not self.silence:
             print(f"Detected Language: {language}")
             print(f"Full Transcription: {full_text}")
         
-        # Delete tmp save dir
-        try:
-            import shutil
-            shutil.rmtree(save_dir)
-        except Exception as e:
-            if not self.silence:
-                print(f"Warning: Failed to delete temp directory: {e}")
-        
         # Determine output file path
         if output_dir:
             os.makedirs(output_dir, exist_ok=True)
@@ -253,81 +284,170 @@ class Qwen3ASRProcessor:
             return srt_file
         
         return save_file
-    
-    def _load_audio(self, file_path: str) -> np.ndarray:
-        """Load audio file and convert to 16kHz mono WAV"""
-        import soundfile as sf
+
+    async def _check_input_file(self, input_file: str):
+        """Raise FileNotFoundError if the local file or HTTP link is not accessible"""
+        if input_file.startswith(("http://", "https://")):
+            try:
+                async with httpx.AsyncClient(follow_redirects=True, timeout=5) as client:
+                    response = await client.head(input_file)
+                if response.status_code >= 400:
+                    raise FileNotFoundError(f"returned status code {response.status_code}")
+            except Exception as e:
+                raise FileNotFoundError(
+                    f"HTTP link {input_file} does not exist or is inaccessible: {str(e)}"
+                )
+        elif not os.path.exists(input_file):
+            raise FileNotFoundError(f"Input file \"{input_file}\" does not exist!")
+
+    async def _decode_audio_chunks(self, file_path: str) -> AsyncIterator[np.ndarray]:
+        """Stream the input through ffmpeg as 16kHz mono float32 chunks"""
+        command = [
+            'ffmpeg',
+            '-nostdin',
+            '-loglevel', 'error',
+            '-i', file_path,
+            '-ar', str(WAV_SAMPLE_RATE),
+            '-ac', '1',
+            '-f', 's16le',
+            '-'
+        ]
+        chunk_bytes = int(self.decode_chunk_s * WAV_SAMPLE_RATE) * 2
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stderr_task = asyncio.create_task(process.stderr.read())
         try:
-            command = [
-                'ffmpeg',
-                '-i', file_path,
-                '-ar', str(WAV_SAMPLE_RATE),
-                '-ac', '1',
-                '-c:a', 'pcm_s16le',
-                '-f', 'wav',
-                '-'
-            ]
-            process = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
-            stdout_data, stderr_data = process.communicate()
+            while True:
+                try:
+                    data = await process.stdout.readexactly(chunk_bytes)
+                except asyncio.IncompleteReadError as e:
+                    data = e.partial
+                usable = len(data) - len(data) % 2
+                if usable:
+                    yield np.frombuffer(data[:usable], dtype='<i2').astype(np.float32) / 32768.0
+                if len(data) < chunk_bytes:
+                    break
 
-            if process.returncode != 0:
+            returncode = await process.wait()
+            stderr_data = await stderr_task
+            if returncode != 0:
                 raise RuntimeError(
+                    f"Failed to load audio from '{file_path}'. "
                     f"FFmpeg error: {stderr_data.decode('utf-8', errors='ignore')}"
                 )
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            if not stderr_task.done():
+                stderr_task.cancel()
+
+    async def _stream_segments(
+        self,
+        input_file: str
+    ) -> AsyncIterator[Tuple[int, int, np.ndarray]]:
+        """
+        Yield (start_sample, end_sample, wav_data) VAD segments while decoding
 
-            with io.BytesIO(stdout_data) as data_io:
-                wav_data, sr = sf.read(data_io, dtype='float32')
+        Audio after the last finished segment is carried over to the next chunk,
+        so only the current chunk plus a short tail is held in memory.
+        """
+        if not self.silence:
+            print(f"Initializing Silero VAD model for segmenting...")
+        vad_model = await asyncio.to_thread(get_vad_model)
+
+        buffer = np.zeros(0, dtype=np.float32)
+        offset = 0
+        decoded_samples = 0
+        async for chunk in self._decode_audio_chunks(input_file):
+            decoded_samples += len(chunk)
+            buffer = np.concatenate([buffer, chunk])
+            segments, consumed = await asyncio.to_thread(self._process_vad, buffer, vad_model, False)
+            for start_sample, end_sample, wav_data in segments:
+                yield offset + start_sample, offset + end_sample, wav_data
+            buffer = buffer[consumed:]
+            offset += consumed
+
+        if len(buffer):
+            segments, _ = await asyncio.to_thread(self._process_vad, buffer, vad_model, True)
+            for start_sample, end_sample, wav_data in segments:
+                yield offset + start_sample, offset + end_sample, wav_data
+
+        if not self.silence:
+            print(f"Loaded wav duration: {decoded_samples / WAV_SAMPLE_RATE:.2f}s")
 
-            return wav_data
-        except Exception as ffmpeg_e:
-            raise RuntimeError(
-                f"Failed to load audio from '{file_path}'. Error: {ffmpeg_e}"
-            )
-    
     def _process_vad(
         self,
         wav: np.ndarray,
         worker_vad_model,
-        max_segment_threshold_s: int = 180
-    ) -> List[Tuple[int, int, np.ndarray]]:
-        """Process VAD and segment audio"""
-        from silero_vad import get_speech_timestamps
-        try:
-            speech_timestamps = get_speech_timestamps(wav, worker_vad_model)
+        final: bool = True
+    ) -> Tuple[List[Tuple[int, int, np.ndarray]], int]:
+        """
+        Process VAD on a decoded buffer and segment audio
 
-            if not speech_timestamps:
-                return []
-            
-            # Convert to segmented_wavs format
-            segmented_wavs = []
-            for sample in speech_timestamps:
-                start_sample, end_sample = sample["start"], sample["end"]
-                segmented_wavs.append((start_sample, end_sample, wav[start_sample:end_sample]))
-            
-            # Merge chunks shorter than 1 second
-            segmented_wavs = self._merge_short_vad_segments(segmented_wavs, wav, min_duration_s=0.5)
-            
-            return segmented_wavs
-            
+        Args:
+            wav: Audio buffer starting after the last emitted segment
+            worker_vad_model: Silero VAD model
+            final: Whether the buffer ends at the end of the input
+
+        Returns:
+            Tuple of (finished segments, number of leading samples that can be dropped)
+        """
+        total_samples = len(wav)
+        max_segment_samples = int(self.vad_segment_threshold * WAV_SAMPLE_RATE)
+        try:
+            with _vad_infer_lock:
+                speech_timestamps = get_speech_timestamps(wav, worker_vad_model)
         except Exception as e:
             # Fallback: simple chunking
             if not self.silence:
                 print(f"VAD processing failed, using simple chunking: {e}")
             segmented_wavs = []
-            total_samples = len(wav)
-            max_chunk_size_samples = max_segment_threshold_s * WAV_SAMPLE_RATE
-            
-            for start_sample in range(0, total_samples, max_chunk_size_samples):
-                end_sample = min(start_sample + max_chunk_size_samples, total_samples)
-                segment = wav[start_sample:end_sample]
-                if len(segment) > 0:
-                    segmented_wavs.append((start_sample, end_sample, segment))
-            
-            return segmented_wavs
+            for start_sample in range(0, total_samples, max_segment_samples):
+                end_sample = min(start_sample + max_segment_samples, total_samples)
+                if end_sample - start_sample < max_segment_samples and not final:
+                    return segmented_wavs, start_sample
+                segmented_wavs.append((start_sample, end_sample, wav[start_sample:end_sample]))
+            return segmented_wavs, total_samples
+
+        if final:
+            segmented_wavs = [
+                (sample["start"], sample["end"], wav[sample["start"]:sample["end"]])
+                for sample in speech_timestamps
+            ]
+            return self._merge_short_vad_segments(segmented_wavs, wav, min_duration_s=MIN_VAD_SEGMENT_S), total_samples
+
+        # Segments ending close to the buffer end may continue in the next chunk
+        tail_start = total_samples - int(VAD_TAIL_MARGIN_S * WAV_SAMPLE_RATE)
+        finished = [sample for sample in speech_timestamps if sample["end"] < tail_start]
+        open_samples = speech_timestamps[len(finished):]
+
+        segmented_wavs = [
+            (sample["start"], sample["end"], wav[sample["start"]:sample["end"]])
+            for sample in finished
+        ]
+        segmented_wavs = self._merge_short_vad_segments(segmented_wavs, wav, min_duration_s=MIN_VAD_SEGMENT_S)
+
+        # Hold back a lone short segment so it can still merge with following speech
+        min_samples = int(MIN_VAD_SEGMENT_S * WAV_SAMPLE_RATE)
+        carry_start = open_samples[0]["start"] if open_samples else None
+        if segmented_wavs and segmented_wavs[-1][1] - segmented_wavs[-1][0] < min_samples:
+            carry_start = segmented_wavs.pop()[0]
+
+        if carry_start is None:
+            consumed = max(tail_start, segmented_wavs[-1][1] if segmented_wavs else 0)
+        elif total_samples - carry_start >= max_segment_samples:
+            # Continuous speech without a pause: force-split to bound memory
+            end_sample = carry_start + max_segment_samples
+            segmented_wavs.append((carry_start, end_sample, wav[carry_start:end_sample]))
+            consumed = end_sample
+        else:
+            consumed = carry_start
+
+        return segmented_wavs, max(consumed, 0)
     
     def _merge_short_vad_segments(
         self,
@@ -837,11 +957,19 @@ class Qwen3ASRProcessor:
         else:
             return chunk1 + chunk2
     
-    def _save_audio_file(self, wav: np.ndarray, file_path: str):
-        """Save audio to file"""
-        import soundfile as sf
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        sf.write(file_path, wav, WAV_SAMPLE_RATE)
+    def _encode_segment(self, wav: np.ndarray) -> str:
+        """Encode an audio segment in memory as a base64 data URI for the API"""
+        with io.BytesIO() as wav_io:
+            sf.write(wav_io, wav, WAV_SAMPLE_RATE, format='WAV', subtype='PCM_16')
+            audio_bytes, mime_type = wav_io.getvalue(), "audio/wav"
+
+        # Convert to mp3 if encoded size > 10M
+        if len(audio_bytes) * 4 / 3 > MAX_INLINE_AUDIO_BYTES:
+            with io.BytesIO() as mp3_io:
+                AudioSegment.from_file(io.BytesIO(audio_bytes), format="wav").export(mp3_io, format="mp3")
+                audio_bytes, mime_type = mp3_io.getvalue(), "audio/mpeg"
+
+        return f"data:{mime_type};base64,{base64.b64encode(audio_bytes).decode('ascii')}"
     
     def _post_text_process(self, text: str, threshold: int = 20) -> str:
         """Post-process transcription text to fix repetitions"""
@@ -912,9 +1040,8 @@ class Qwen3ASRProcessor:
         return fix_pattern_repeats(text, threshold)
     
     def _asr(self, wav_url: str, context: str = "") -> Tuple[str, str]:
-        """Call Qwen3-ASR-Flash API for transcription"""
-        from pydub import AudioSegment
-        if not wav_url.startswith("http"):
+        """Call Qwen3-ASR-Flash API for transcription (HTTP URL, data URI or local path)"""
+        if not wav_url.startswith(("http", "data:")):
             assert os.path.exists(wav_url), f"{wav_url} not exists!"
             file_path = wav_url
             file_size = os.path.getsize(file_path)
@@ -974,13 +1101,13 @@ class Qwen3ASRProcessor:
             except Exception as e:
                 try:
                     if not self.silence:
-                        print(f"Retry {attempt + 1}...  {wav_url}\n{response}")
+                        print(f"Retry {attempt + 1}...  {wav_url[:64]}\n{response}")
                     if hasattr(response, 'code') and response.code == "DataInspectionFailed":
-                        print(f"DataInspectionFailed! Invalid input audio \"{wav_url}\"")
+                        print(f"DataInspectionFailed! Invalid input audio \"{wav_url[:64]}\"")
                         break
                 except Exception:
                     if not self.silence:
-                        print(f"Retry {attempt + 1}...  {wav_url}\n{e}")
+                        print(f"Retry {attempt + 1}...  {wav_url[:64]}\n{e}")
                 time.sleep(random.uniform(*API_RETRY_SLEEP))
         
-        raise Exception(f"{wav_url} task failed!\n{response}")
\ No newline at end of file
+        raise Exception(f"{wav_url[:64]} task failed!\n{response}")
\ No newline at end of file
@@ -8,8 +8,12 @@ via DashScope API with OpenAI-compatible interface.
 import os
 import re
 import srt
-from typing import Optional, Literal, List, Tuple
-from openai import OpenAI
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from typing import Optional, Literal, List, Dict
+from openai import AsyncOpenAI
 
 
 # Supported models
@@ -22,6 +26,65 @@ CHARS_PER_TOKEN = 2
 MAX_CHARS_PER_REQUEST = MAX_TOKENS * CHARS_PER_TOKEN
 
 
+class TranslationMemory:
+    """
+    Persistent translation cache backed by a local SQLite file
+
+    Entries are keyed by a hash of the source text, language pair, model and
+    prompt, so repeated lines and re-runs skip the API call.
+    """
+
+    def __init__(self, db_path: str):
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                "key TEXT PRIMARY KEY, translation TEXT NOT NULL)"
+            )
+
+    @staticmethod
+    def make_key(
+        text: str,
+        source_lang: str,
+        target_language: str,
+        model: str,
+        prompt: Optional[str] = None
+    ) -> str:
+        """Build the cache key for a source text and translation settings"""
+        raw = "\x00".join([model, source_lang, target_language, prompt or "", text])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: List[str]) -> Dict[str, str]:
+        """Return cached translations for the given keys"""
+        found = {}
+        with self._lock:
+            # Stay well below SQLite's bound parameter limit
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                rows = self._conn.execute(
+                    f"SELECT key, translation FROM translations WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+                found.update(rows)
+        return found
+
+    def set_many(self, items: Dict[str, str]):
+        """Store translations by cache key"""
+        if not items:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO translations (key, translation) VALUES (?, ?)",
+                list(items.items())
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
 class QwenMTProcessor:
     """
     Qwen Machine Translation Processor
@@ -37,6 +100,7 @@ class QwenMTProcessor:
         ... )
         >>> print(result)
         你好，世界！
+        >>> processor.close()
         
         >>> # Translate SRT file
         >>> srt_path = processor.translate_srt(
@@ -50,7 +114,10 @@ class QwenMTProcessor:
         dashscope_api_key: Optional[str] = None,
         model: QwenMTModel = "qwen-mt-plus",
         base_url: str = "https://dashscope.aliyuncs.com/compatible-mode/v1",
-        source_lang: str = "auto"
+        source_lang: str = "auto",
+        max_concurrency: int = 4,
+        cache_dir: Optional[str] = None,
+        use_cache: bool = True
     ):
         """
         Initialize QwenMTProcessor
@@ -68,6 +135,9 @@ class QwenMTProcessor:
             source_lang: Source language code or "auto" for auto-detection
                 - Use "auto" for uncertain source languages (e.g., social media)
                 - Use specific code for fixed languages (e.g., "zh", "en")
+            max_concurrency: Maximum number of concurrent translation requests (default: 4)
+            cache_dir: Directory of the translation memory (default: ~/qwen-mt-cache)
+            use_cache: Whether to reuse and store translations in the translation memory
         """
         api_key = dashscope_api_key or os.getenv("DASHSCOPE_API_KEY")
         if not api_key:
@@ -76,9 +146,22 @@ class QwenMTProcessor:
                 "or pass it to the constructor"
             )
         
-        self.client = OpenAI(api_key=api_key, base_url=base_url)
+        self.api_key = api_key
+        self.base_url = base_url
         self.model = model
         self.source_lang = source_lang
+        self.max_concurrency = max_concurrency
+        self.cache_dir = cache_dir or os.path.join(os.path.expanduser("~"), "qwen-mt-cache")
+        self.memory = (
+            TranslationMemory(os.path.join(self.cache_dir, "translation_memory.db"))
+            if use_cache else None
+        )
+
+    def close(self):
+        """Close the translation memory"""
+        if self.memory:
+            self.memory.close()
+            self.memory = None
     
     def run(
         self,
@@ -88,9 +171,34 @@ class QwenMTProcessor:
     ) -> str:
         """
         Translate text to target language
+
+        Blocking wrapper around `arun`; use `arun` directly from async code.
+        
+        Args:
+            text: Text to translate
+            target_language: Target language (can be language name or code)
+                - Examples: "Chinese", "English", "zh", "en", "日本語"
+            custom_prompt: Optional custom prompt for domain-specific translation
+                - Use {target_language} placeholder for target language
+                - Use {text_to_translate} placeholder for the text
+                
+        Returns:
+            str: Translated text
+        """
+        return asyncio.run(self.arun(text, target_language, custom_prompt))
+
+    async def arun(
+        self,
+        text: str,
+        target_language: str,
+        custom_prompt: Optional[str] = None
+    ) -> str:
+        """
+        Translate text to target language
         
         Automatically splits long text into semantic paragraphs to stay within
-        the 8192 token limit while preserving context.
+        the 8192 token limit while preserving context. Batches are translated
+        concurrently and reassembled in the original order.
         
         Args:
             text: Text to translate
@@ -106,18 +214,78 @@ class QwenMTProcessor:
         # Split text into paragraphs for semantic preservation
         paragraphs = self._split_into_paragraphs(text)
         
-        # Group paragraphs into batches within token limit
-        batches = self._group_paragraphs_into_batches(paragraphs)
-        
-        # Translate each batch
-        translated_batches = []
-        for batch_paragraphs in batches:
-            batch_text = '\n\n'.join(batch_paragraphs)
-            translated = self._translate_batch(batch_text, target_language, custom_prompt)
-            translated_batches.append(translated)
+        # Translate paragraphs in batches, reusing the translation memory
+        translated_paragraphs = await self._translate_units(paragraphs, target_language, custom_prompt)
         
-        # Join translated batches
-        return '\n\n'.join(translated_batches)
+        # Join translated paragraphs
+        return '\n\n'.join(translated_paragraphs)
+
+    async def _translate_units(
+        self,
+        units: List[str],
+        target_language: str,
+        custom_prompt: Optional[str] = None
+    ) -> List[str]:
+        """
+        Translate a list of paragraphs or subtitle lines, preserving order
+
+        Identical units are translated once, cached units skip the API, and the
+        remaining units are grouped into batches translated concurrently.
+
+        Args:
+            units: Source texts
+            target_language: Target language
+            custom_prompt: Optional custom prompt
+
+        Returns:
+            List of translations aligned with `units`
+        """
+        unique_units = list(dict.fromkeys(units))
+        keys = {
+            unit: TranslationMemory.make_key(unit, self.source_lang, target_language, self.model, custom_prompt)
+            for unit in unique_units
+        }
+        cached = await asyncio.to_thread(self.memory.get_many, list(keys.values())) if self.memory else {}
+        translations = {unit: cached[keys[unit]] for unit in unique_units if keys[unit] in cached}
+
+        pending_units = [unit for unit in unique_units if unit not in translations]
+        if not pending_units:
+            return [translations[unit] for unit in units]
+
+        batches = self._group_paragraphs_into_batches(pending_units)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def translate(text: str) -> str:
+            async with semaphore:
+                return await self._translate_batch(client, text, target_language, custom_prompt)
+
+        async def translate_batch_units(batch_units: List[str]) -> List[str]:
+            translated_text = await translate('\n\n'.join(batch_units))
+            if len(batch_units) == 1:
+                return [translated_text]
+
+            # Split translated text back into individual units
+            translated_parts = re.split(r'\n\s*\n', translated_text)
+            translated_parts = [p.strip() for p in translated_parts if p.strip()]
+            if len(translated_parts) == len(batch_units):
+                return translated_parts
+
+            # The model merged or split units, retranslate them one by one to keep alignment
+            return list(await asyncio.gather(*(translate(unit) for unit in batch_units)))
+
+        # The client is bound to the running event loop, and the blocking wrappers start a new loop per call
+        async with AsyncOpenAI(api_key=self.api_key, base_url=self.base_url) as client:
+            batch_results = await asyncio.gather(*(translate_batch_units(batch) for batch in batches))
+
+        new_entries = {}
+        for batch_units, batch_translations in zip(batches, batch_results):
+            for unit, translation in zip(batch_units, batch_translations):
+                translations[unit] = translation
+                new_entries[keys[unit]] = translation
+        if self.memory:
+            await asyncio.to_thread(self.memory.set_many, new_entries)
+
+        return [translations[unit] for unit in units]
     
     def _split_into_paragraphs(self, text: str) -> List[str]:
         """
@@ -187,8 +355,9 @@ class QwenMTProcessor:
         
         return batches
     
-    def _translate_batch(
+    async def _translate_batch(
         self,
+        client: AsyncOpenAI,
         text: str,
         target_language: str,
         custom_prompt: Optional[str] = None
@@ -197,6 +366,7 @@ class QwenMTProcessor:
         Translate a single batch of text
         
         Args:
+            client: OpenAI-compatible client of the current run
             text: Text to translate (single batch)
             target_language: Target language
             custom_prompt: Optional custom prompt
@@ -220,7 +390,7 @@ class QwenMTProcessor:
         ]
         
         # Call API
-        completion = self.client.chat.completions.create(
+        completion = await client.chat.completions.create(
             model=self.model,
             messages=messages
         )
@@ -238,9 +408,33 @@ class QwenMTProcessor:
     ) -> str:
         """
         Translate SRT subtitle file with timestamp preservation
+
+        Blocking wrapper around `atranslate_srt`; use `atranslate_srt` directly from async code.
+        
+        Args:
+            srt_file: Path to input SRT file
+            target_language: Target language
+            output_file: Path to output SRT file (default: input_file.{target_language}.srt)
+            custom_prompt: Optional custom prompt for translation
+            
+        Returns:
+            str: Path to translated SRT file
+        """
+        return asyncio.run(self.atranslate_srt(srt_file, target_language, output_file, custom_prompt))
+
+    async def atranslate_srt(
+        self,
+        srt_file: str,
+        target_language: str,
+        output_file: Optional[str] = None,
+        custom_prompt: Optional[str] = None
+    ) -> str:
+        """
+        Translate SRT subtitle file with timestamp preservation
         
-        Translates subtitles in batches to preserve semantic context while
-        maintaining original timestamps.
+        Translates subtitles in concurrent batches to preserve semantic context
+        while maintaining original timestamps. Subtitle lines already in the
+        translation memory are not sent again.
         
         Args:
             srt_file: Path to input SRT file
@@ -258,35 +452,15 @@ class QwenMTProcessor:
         # Parse SRT
         subtitles = list(srt.parse(srt_content))
         
-        # Group subtitles into batches for translation
-        subtitle_batches = self._group_subtitles_into_batches(subtitles)
-        
-        # Translate each batch
-        for batch_indices, batch_subtitles in subtitle_batches:
-            # Combine batch content for translation
-            batch_texts = [sub.content for sub in batch_subtitles]
-            combined_text = '\n\n'.join(batch_texts)
-            
-            # Translate the batch
-            translated_text = self._translate_batch(
-                combined_text,
-                target_language,
-                custom_prompt
-            )
-            
-            # Split translated text back into individual subtitles
-            translated_parts = re.split(r'\n\s*\n', translated_text)
-            translated_parts = [p.strip() for p in translated_parts if p.strip()]
-            
-            # Update subtitle content while preserving timestamps
-            for i, sub_idx in enumerate(batch_indices):
-                if i < len(translated_parts):
-                    subtitles[sub_idx].content = translated_parts[i]
-                else:
-                    # Fallback if split didn't match expected count
-                    # Keep original or use last translation
-                    if translated_parts:
-                        subtitles[sub_idx].content = translated_parts[-1]
+        # Translate non-empty subtitles while preserving timestamps
+        sub_indices = [idx for idx, sub in enumerate(subtitles) if sub.content.strip()]
+        translated_parts = await self._translate_units(
+            [subtitles[idx].content for idx in sub_indices],
+            target_language,
+            custom_prompt
+        )
+        for sub_idx, translated in zip(sub_indices, translated_parts):
+            subtitles[sub_idx].content = translated
         
         # Compose back to SRT format
         translated_srt = srt.compose(subtitles)
@@ -303,47 +477,3 @@ class QwenMTProcessor:
                 f.write('\n')
         
         return output_file
-    
-    def _group_subtitles_into_batches(
-        self,
-        subtitles: List[srt.Subtitle]
-    ) -> List[Tuple[List[int], List[srt.Subtitle]]]:
-        """
-        Group subtitles into batches for translation
-        
-        Args:
-            subtitles: List of srt.Subtitle objects
-            
-        Returns:
-            List of (indices, subtitle_batch) tuples
-        """
-        batches = []
-        current_indices = []
-        current_subs = []
-        current_chars = 0
-        
-        for idx, sub in enumerate(subtitles):
-            if not sub.content.strip():
-                continue
-            
-            content_chars = len(sub.content)
-            
-            # Check if adding this subtitle would exceed limit
-            if current_chars + content_chars + 2 > MAX_CHARS_PER_REQUEST:
-                # Save current batch and start new one
-                if current_subs:
-                    batches.append((current_indices, current_subs))
-                current_indices = [idx]
-                current_subs = [sub]
-                current_chars = content_chars
-            else:
-                # Add to current batch
-                current_indices.append(idx)
-                current_subs.append(sub)
-                current_chars += content_chars + 2
-        
-        # Don't forget the last batch
-        if current_subs:
-            batches.append((current_indices, current_subs))
-        
-        return batches
\ No newline at end of file
@@ -0,0 +1,309 @@
+"""
+Content-addressed blob store for uploaded and shared task files.
+
+Every distinct file content is stored once under `<workspace>/blobs/<sha[:2]>/<sha256>`
+and made read-only. Session folders and sub-agent directories get hardlinks (or
+reflinks where hardlinks are not possible) to the blob instead of copies, so
+fanning a task out to several agents costs no extra disk space or copy time.
+Hardlinks share the blob's read-only mode, so a writer that skips `detach_link()`
+fails instead of changing the content every other link sees.
+
+The file system's link count is the reference count: a blob whose only link is
+the store's own entry is no longer used anywhere and is removed by
+`collect_garbage()` once it is older than `GC_GRACE_SECONDS`. Code that writes to a possibly linked file calls
+`detach_link()` first, which gives the file its own writable copy (copy-on-write).
+"""
+import asyncio
+import errno
+import hashlib
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import aiofiles
+
+from vibe_surf.logger import get_logger
+
+logger = get_logger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+# ioctl request to clone a file's extents (btrfs, xfs), see ioctl_ficlone(2)
+FICLONE = 0x40049409
+# Blobs stored or reused this recently are kept by garbage collection, as they may be about to be linked
+GC_GRACE_SECONDS = 3600
+BLOB_MODE = 0o444
+WRITE_BITS = stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH
+
+
+def _reflink(src: str, dst: str) -> bool:
+    if not sys.platform.startswith('linux'):
+        return False
+    import fcntl
+
+    try:
+        with open(src, 'rb') as src_file, open(dst, 'xb') as dst_file:
+            fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+        return True
+    except OSError:
+        try:
+            os.remove(dst)
+        except OSError:
+            pass
+        return False
+
+
+def _link_or_copy(src: str, dst: str) -> str:
+    """Hardlink src to dst, else reflink, else copy. Returns how the file was placed."""
+    try:
+        os.link(src, dst)
+        return 'link'
+    except FileExistsError:
+        raise
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP, errno.EACCES):
+            raise
+    if _reflink(src, dst):
+        return 'reflink'
+    shutil.copyfile(src, dst)
+    return 'copy'
+
+
+def _unique_name(directory: str, filename: str, attempt: int) -> str:
+    if attempt == 0:
+        return os.path.join(directory, filename)
+    base_name, ext = os.path.splitext(filename)
+    return os.path.join(directory, f"{base_name}_{attempt}{ext}")
+
+
+def remove_link(path: str | Path) -> None:
+    """
+    Remove a file that may be a read-only link to a blob.
+
+    Windows refuses to delete read-only files, and clearing the attribute there also makes the
+    other links writable; `BlobStore` makes such blobs read-only again the next time they are linked.
+    """
+    path = str(path)
+    try:
+        os.remove(path)
+    except PermissionError:
+        os.chmod(path, stat.S_IREAD | stat.S_IWRITE)
+        os.remove(path)
+
+
+def detach_link(path: str | Path, keep_content: bool = True) -> None:
+    """
+    Give `path` its own writable inode if it shares one with other links.
+
+    Args:
+        path: File about to be written
+        keep_content: Copy the current content into the private file (for appends);
+                      otherwise the file is simply unlinked (for overwrites)
+    """
+    path = str(path)
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return
+    if st.st_nlink <= 1 and st.st_mode & stat.S_IWUSR:
+        return
+
+    if not keep_content:
+        remove_link(path)
+        return
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.detach-')
+    os.close(fd)
+    try:
+        shutil.copyfile(path, tmp_path)
+        os.chmod(tmp_path, 0o644)
+        try:
+            os.replace(tmp_path, path)
+        except PermissionError:
+            # Windows will not replace a read-only file, remove the link first
+            remove_link(path)
+            os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class BlobStore:
+    """Stores file contents by SHA-256 and places them into directories as links."""
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self.tmp_dir = self.root / 'tmp'
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+        # (path, device, inode, size, mtime) -> digest, so re-sharing a file does not re-hash it
+        self._digest_cache: Dict[Tuple[str, int, int, int, int], str] = {}
+
+    def blob_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def has(self, digest: str) -> bool:
+        return self.blob_path(digest).exists()
+
+    def _touch(self, digest: str) -> bool:
+        """Mark an existing blob as just used so garbage collection keeps it. Returns whether it exists."""
+        try:
+            os.utime(self.blob_path(digest))
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError:
+            return self.has(digest)
+
+    def _commit(self, tmp_path: str, digest: str) -> Path:
+        """Move a fully written temp file into place as the blob for digest."""
+        blob_path = self.blob_path(digest)
+        if self._touch(digest):
+            os.remove(tmp_path)
+            return blob_path
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        os.chmod(tmp_path, BLOB_MODE)
+        os.replace(tmp_path, blob_path)
+        return blob_path
+
+    async def put_stream(self, stream, chunk_size: int = CHUNK_SIZE) -> Tuple[str, int]:
+        """
+        Store the content of an async readable (e.g. an UploadFile), hashing it while it is written.
+
+        Returns:
+            (digest, size in bytes)
+        """
+        hasher = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=str(self.tmp_dir), prefix='upload-')
+        os.close(fd)
+        try:
+            async with aiofiles.open(tmp_path, 'wb') as f:
+                while True:
+                    chunk = await stream.read(chunk_size)
+                    if not chunk:
+                        break
+                    hasher.update(chunk)
+                    size += len(chunk)
+                    await f.write(chunk)
+            digest = hasher.hexdigest()
+            await asyncio.to_thread(self._commit, tmp_path, digest)
+            return digest, size
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _put_file(self, src: str) -> str:
+        st = os.stat(src)
+        cache_key = (os.path.abspath(src), st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+        digest = self._digest_cache.get(cache_key)
+        if digest is not None and self._touch(digest):
+            return digest
+
+        hasher = hashlib.sha256()
+        with open(src, 'rb') as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()
+
+        if not self._touch(digest):
+            # Copy rather than link: the source may still be written to by its owner
+            fd, tmp_path = tempfile.mkstemp(dir=str(self.tmp_dir), prefix='ingest-')
+            os.close(fd)
+            try:
+                shutil.copyfile(src, tmp_path)
+                self._commit(tmp_path, digest)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+        self._digest_cache[cache_key] = digest
+        return digest
+
+    async def put_file(self, src: str | Path) -> str:
+        """Store the content of an existing file and return its digest."""
+        return await asyncio.to_thread(self._put_file, str(src))
+
+    def _link_into(self, digest: str, directory: str, filename: str, reuse_existing: bool) -> str:
+        blob_path = str(self.blob_path(digest))
+        blob_stat = os.stat(blob_path)
+        if blob_stat.st_mode & WRITE_BITS:
+            # Stored writable by an earlier version, or made writable to delete a link on Windows
+            os.chmod(blob_path, BLOB_MODE)
+        os.makedirs(directory, exist_ok=True)
+        attempt = 0
+        while True:
+            target = _unique_name(directory, filename, attempt)
+            try:
+                _link_or_copy(blob_path, target)
+                return target
+            except FileExistsError:
+                if reuse_existing:
+                    # The same content under the same name is already there
+                    existing = os.stat(target)
+                    if (existing.st_dev, existing.st_ino) == (blob_stat.st_dev, blob_stat.st_ino):
+                        return target
+                attempt += 1
+
+    async def link_into(self, digest: str, directory: str | Path, filename: str, reuse_existing: bool = True) -> str:
+        """
+        Place the blob in directory as filename, adding a `_N` suffix if another file has that name.
+
+        Args:
+            reuse_existing: Return an existing link to the same blob under that name instead of adding a new one
+
+        Returns:
+            Path of the placed file
+        """
+        return await asyncio.to_thread(self._link_into, digest, str(directory), filename, reuse_existing)
+
+    async def share_file(self, src: str | Path, directory: str | Path, filename: Optional[str] = None) -> str:
+        """Place the content of src into directory without copying it where the file system allows."""
+        digest = await self.put_file(src)
+        return await self.link_into(digest, directory, filename or os.path.basename(str(src)))
+
+    def collect_garbage(self, grace_seconds: float = GC_GRACE_SECONDS) -> int:
+        """
+        Remove blobs that are not linked from anywhere else. Returns the number removed.
+
+        Blobs stored or reused within `grace_seconds` are kept, since an upload may have
+        committed its blob and not yet linked it into the session folder.
+        """
+        removed = 0
+        cutoff = time.time() - grace_seconds
+        for shard in self.root.iterdir():
+            if not shard.is_dir() or shard == self.tmp_dir:
+                continue
+            for blob in shard.iterdir():
+                try:
+                    blob_stat = blob.stat()
+                    if blob_stat.st_nlink <= 1 and blob_stat.st_mtime < cutoff:
+                        remove_link(blob)
+                        removed += 1
+                except OSError as e:
+                    logger.debug(f"Could not check blob {blob.name}: {e}")
+        if removed:
+            logger.info(f"🧹 Removed {removed} unreferenced blobs")
+        return removed
+
+
+_blob_stores: Dict[str, BlobStore] = {}
+
+
+def get_blob_store(workspace_dir: Optional[str] = None) -> BlobStore:
+    """Blob store of the workspace, defaulting to the configured workspace directory."""
+    if workspace_dir is None:
+        from vibe_surf.common import get_workspace_dir
+
+        workspace_dir = get_workspace_dir()
+    root = os.path.join(os.path.abspath(workspace_dir), 'blobs')
+    store = _blob_stores.get(root)
+    if store is None:
+        store = _blob_stores[root] = BlobStore(root)
+    return store
@@ -23,7 +23,7 @@ import logging
 import pdb
 import time
 import json
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 
 from pydantic import BaseModel, ConfigDict, Field, create_model
 
@@ -50,6 +50,8 @@ class ComposioClient:
         """
         self.composio_instance = composio_instance
         self._registered_actions: set[str] = set()
+        # action name -> tool info it was registered from, to detect changed tools
+        self._registered_tool_info: Dict[str, Dict] = {}
         self._toolkit_tools: Dict[str, List[Dict]] = {}
         self._telemetry = ProductTelemetry()
 
@@ -77,6 +79,98 @@ class ComposioClient:
         self._toolkit_tools = toolkit_tools_dict
         registry = tools.registry
 
+        for action_name, (toolkit_slug, tool_info) in self._collect_enabled_tools(toolkit_tools_dict, prefix).items():
+            # Skip if already registered
+            if action_name in self._registered_actions:
+                continue
+
+            # Register the tool as an action
+            self._register_tool_as_action(registry, action_name, toolkit_slug, tool_info)
+            self._registered_actions.add(action_name)
+            self._registered_tool_info[action_name] = tool_info
+
+        logger.info(f"✅ Registered {len(self._registered_actions)} Composio tools as VibeSurf actions")
+        
+        # Capture telemetry for registration
+        self._telemetry.capture(
+            ComposioTelemetryEvent(
+                toolkit_slugs=list(toolkit_tools_dict.keys()),
+                tools_registered=len(self._registered_actions),
+                version=get_vibesurf_version(),
+                action='register'
+            )
+        )
+
+    def sync_tools(
+        self,
+        tools,  # VibeSurfTools instance
+        toolkit_tools_dict: Dict[str, List[Dict]],
+        prefix: str = "cpo.",
+    ) -> bool:
+        """Bring the registered actions in line with toolkit_tools_dict, touching only tools that changed.
+
+        Args:
+            tools: VibeSurf tools instance the actions are registered to
+            toolkit_tools_dict: Dict of toolkit_slug -> tools list
+            prefix: Prefix to add to action names (e.g., "cpo.")
+
+        Returns:
+            False if the tools could not be registered because the Composio instance is missing
+        """
+        wanted = self._collect_enabled_tools(toolkit_tools_dict, prefix)
+        registry = tools.registry
+        if wanted and not self.composio_instance:
+            # The registered actions would call the missing instance, so drop them all
+            removed = list(self._registered_actions)
+            self._remove_actions(registry, removed)
+            self._toolkit_tools = {}
+            logger.warning(f"Composio instance not available, skipping registration "
+                           f"and removing {len(removed)} Composio actions")
+            return False
+
+        removed = [
+            action_name for action_name in self._registered_actions
+            if action_name not in wanted or self._registered_tool_info.get(action_name) != wanted[action_name][1]
+        ]
+        self._remove_actions(registry, removed)
+
+        added = 0
+        for action_name, (toolkit_slug, tool_info) in wanted.items():
+            if action_name in self._registered_actions:
+                continue
+            self._register_tool_as_action(registry, action_name, toolkit_slug, tool_info)
+            self._registered_actions.add(action_name)
+            self._registered_tool_info[action_name] = tool_info
+            added += 1
+
+        self._toolkit_tools = toolkit_tools_dict
+        if added or removed:
+            logger.info(f"✅ Synced Composio tools: {added} registered, {len(removed)} removed, "
+                        f"{len(self._registered_actions)} active")
+            self._telemetry.capture(
+                ComposioTelemetryEvent(
+                    toolkit_slugs=list(toolkit_tools_dict.keys()),
+                    tools_registered=len(self._registered_actions),
+                    version=get_vibesurf_version(),
+                    action='register'
+                )
+            )
+        return True
+
+    def _remove_actions(self, registry, action_names: List[str]) -> None:
+        """Remove registered Composio actions from the registry and stop tracking them."""
+        for action_name in action_names:
+            registry.registry.actions.pop(action_name, None)
+            self._registered_actions.discard(action_name)
+            self._registered_tool_info.pop(action_name, None)
+
+    @staticmethod
+    def _collect_enabled_tools(
+        toolkit_tools_dict: Dict[str, List[Dict]],
+        prefix: str,
+    ) -> Dict[str, Tuple[str, Dict]]:
+        """Map action names to (toolkit_slug, tool_info) for every enabled tool."""
+        enabled_tools = {}
         for toolkit_slug, tools_list in toolkit_tools_dict.items():
             # Parse tools if it's a JSON string
             if isinstance(tools_list, str):
@@ -103,27 +197,8 @@ class ComposioClient:
                     continue
 
                 # Apply prefix
-                action_name = f'{prefix}{toolkit_slug}.{tool_name}'
-
-                # Skip if already registered
-                if action_name in self._registered_actions:
-                    continue
-
-                # Register the tool as an action
-                self._register_tool_as_action(registry, action_name, toolkit_slug, tool_info)
-                self._registered_actions.add(action_name)
-
-        logger.info(f"✅ Registered {len(self._registered_actions)} Composio tools as VibeSurf actions")
-        
-        # Capture telemetry for registration
-        self._telemetry.capture(
-            ComposioTelemetryEvent(
-                toolkit_slugs=list(toolkit_tools_dict.keys()),
-                tools_registered=len(self._registered_actions),
-                version=get_vibesurf_version(),
-                action='register'
-            )
-        )
+                enabled_tools[f'{prefix}{toolkit_slug}.{tool_name}'] = (toolkit_slug, tool_info)
+        return enabled_tools
 
     def _register_tool_as_action(self, registry, action_name: str, toolkit_slug: str, tool_info: Dict) -> None:
         """Register a single Composio tool as a VibeSurf action.
@@ -426,6 +501,7 @@ class ComposioClient:
 
             # Clear the registered actions set
             self._registered_actions.clear()
+            self._registered_tool_info.clear()
             self._toolkit_tools.clear()
             
             logger.info(f"Unregistered {len(actions_to_remove)} Composio actions")
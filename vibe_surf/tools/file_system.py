@@ -6,6 +6,7 @@ from pathlib import Path
 from browser_use.filesystem.file_system import FileSystem, FileSystemError, INVALID_FILENAME_ERROR_MESSAGE, \
     FileSystemState
 from browser_use.filesystem.file_system import BaseFile, MarkdownFile, TxtFile, JsonFile, CsvFile, PdfFile
+from vibe_surf.tools.blob_store import detach_link
 from vibe_surf.logger import get_logger
 
 logger = get_logger(__name__)
@@ -272,6 +273,8 @@ class CustomFileSystem(FileSystem):
             return f"File '{full_filename}' not found."
 
         try:
+            # Shared upload files are links to one stored copy, so give this one its own content first
+            detach_link(full_path, keep_content=True)
             with open(str(full_path), encoding='utf-8', mode='a') as f:
                 f.write(content)
 
@@ -287,6 +290,7 @@ class CustomFileSystem(FileSystem):
             full_path = self.data_dir / full_filename
             full_path.parent.mkdir(parents=True, exist_ok=True)
 
+            detach_link(full_path, keep_content=False)
             with open(str(full_path), encoding='utf-8', mode='w') as f:
                 f.write(content)
 
@@ -310,6 +314,7 @@ class CustomFileSystem(FileSystem):
             full_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Use file-specific write method
+            detach_link(full_path, keep_content=False)
             with open(str(full_path), encoding='utf-8', mode='w') as f:
                 f.write('')
             return f'Create file {full_filename} successfully.'
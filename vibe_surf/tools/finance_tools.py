@@ -2,18 +2,96 @@
 Comprehensive finance tools using Yahoo Finance API.
 Provides access to stock market data, company financials, and trading information.
 """
+import asyncio
+import copy
 import pdb
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime, timedelta
 import yfinance as yf
 import pandas as pd
 from datetime import datetime
 
 from vibe_surf.logger import get_logger
+from vibe_surf.tools.ttl_cache import TTLCache
 
 logger = get_logger(__name__)
 
+# Worker threads for blocking yfinance calls
+FINANCE_MAX_WORKERS = 8
+FINANCE_CACHE_MAX_ENTRIES = 1024
+
+# Seconds a result stays fresh; None keeps it until evicted
+QUOTE_TTL = 60
+NEWS_TTL = 5 * 60
+MARKET_DATA_TTL = 15 * 60
+ANALYSIS_TTL = 6 * 3600
+STATEMENT_TTL = 12 * 3600
+
+_METHOD_TTLS = {
+    "get_fast_info": QUOTE_TTL,
+    "get_options": QUOTE_TTL,
+    "get_news": NEWS_TTL,
+    "get_info": MARKET_DATA_TTL,
+    "get_history": MARKET_DATA_TTL,
+    "get_earnings_dates": ANALYSIS_TTL,
+    "get_calendar": ANALYSIS_TTL,
+    "get_recommendations": ANALYSIS_TTL,
+    "get_recommendations_summary": ANALYSIS_TTL,
+    "get_upgrades_downgrades": ANALYSIS_TTL,
+    "get_analysis": ANALYSIS_TTL,
+    "get_insider_purchases": ANALYSIS_TTL,
+    "get_insider_transactions": ANALYSIS_TTL,
+}
+
+# Request parameters each method depends on, and so are part of its cache key
+_METHOD_ARGS = {
+    "get_history": ("period", "start_date", "end_date", "interval"),
+    "get_news": ("num_news",),
+}
+
+_finance_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_finance_executor() -> ThreadPoolExecutor:
+    global _finance_executor
+    if _finance_executor is None:
+        _finance_executor = ThreadPoolExecutor(max_workers=FINANCE_MAX_WORKERS, thread_name_prefix="finance")
+    return _finance_executor
+
+
+def _result_ttl(method: str, args: Dict[str, Any]) -> Optional[float]:
+    """How long a result may be reused: short for quotes, long for statements, forever for closed history."""
+    if method == "get_history":
+        interval = str(args.get("interval") or "1d")
+        if interval.endswith(("m", "h")):
+            return QUOTE_TTL
+        end_date = args.get("end_date")
+        if args.get("start_date") and end_date:
+            try:
+                if pd.Timestamp(end_date).date() < datetime.now().date():
+                    return None
+            except (ValueError, TypeError):
+                pass
+    return _METHOD_TTLS.get(method, STATEMENT_TTL)
+
+
+def _cache_key(symbol: str, method: str, kwargs: Dict[str, Any]) -> Tuple:
+    """Key a result by symbol, method and the parameters the method uses."""
+    args = tuple((name, kwargs.get(name)) for name in _METHOD_ARGS.get(method, ()))
+    return symbol, method, args
+
+
+_finance_cache = TTLCache("finance", max_entries=FINANCE_CACHE_MAX_ENTRIES)
+
+
+def _copy_result(result: Any) -> Any:
+    """Hand out copies so callers cannot change what is cached."""
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        return result.copy()
+    return copy.deepcopy(result)
+
 
 class FinanceMethod(Enum):
     """Available Yahoo Finance data methods"""
@@ -90,8 +168,7 @@ class FinanceDataRetriever:
         for method in methods:
             try:
                 if hasattr(self, f"_{method}"):
-                    method_func = getattr(self, f"_{method}")
-                    results[method] = method_func(**kwargs)
+                    results[method] = self._fetch_cached(method, kwargs)
                 else:
                     results[method] = f"Error: Method {method} not implemented"
                     logger.warning(f"Method {method} not implemented for {self.symbol}")
@@ -101,6 +178,44 @@ class FinanceDataRetriever:
                 logger.error(f"Error retrieving {method} for {self.symbol}: {e}")
         
         return results
+
+    async def aget_finance_data(self, methods: List[str], **kwargs) -> Dict[str, Any]:
+        """
+        Retrieve finance data like get_finance_data, without blocking the event loop.
+
+        The methods run concurrently in a worker pool, results are served from the
+        cache while fresh, and identical requests in flight share one fetch.
+        """
+        async def fetch(method: str) -> Any:
+            try:
+                if not hasattr(self, f"_{method}"):
+                    logger.warning(f"Method {method} not implemented for {self.symbol}")
+                    return f"Error: Method {method} not implemented"
+                return await self._afetch_cached(method, kwargs)
+            except Exception as e:
+                logger.error(f"Error retrieving {method} for {self.symbol}: {e}")
+                return f"Error retrieving {method}: {str(e)}"
+
+        values = await asyncio.gather(*(fetch(method) for method in methods))
+        return dict(zip(methods, values))
+
+    def _fetch_cached(self, method: str, kwargs: Dict[str, Any]) -> Any:
+        key = _cache_key(self.symbol, method, kwargs)
+        hit, result = _finance_cache.get(key, _result_ttl(method, kwargs))
+        if not hit:
+            result = getattr(self, f"_{method}")(**kwargs)
+            _finance_cache.set(key, result)
+        return _copy_result(result)
+
+    async def _afetch_cached(self, method: str, kwargs: Dict[str, Any]) -> Any:
+        def fetch():
+            loop = asyncio.get_running_loop()
+            return loop.run_in_executor(_get_finance_executor(), lambda: getattr(self, f"_{method}")(**kwargs))
+
+        result = await _finance_cache.get_or_fetch(
+            _cache_key(self.symbol, method, kwargs), fetch, ttl=_result_ttl(method, kwargs)
+        )
+        return _copy_result(result)
     
     # Basic Information Methods
     def _get_info(self, **kwargs) -> Dict:
@@ -0,0 +1,125 @@
+"""
+TTL Cache - In-memory cache for slow upstream lookups
+
+Each entry is fresh for `ttl` seconds (or indefinitely when `ttl` is None) and
+may then be served stale for up to `stale_ttl` more seconds while one
+background task refreshes it (stale-while-revalidate). Concurrent misses for
+the same key share a single fetch, so a burst of identical requests makes one
+upstream call. Blocking callers can use `get` and `set` directly.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set, Tuple
+
+from vibe_surf.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class TTLCache:
+    """Bounded cache of fetched values with stale-while-revalidate and single-flight fetching"""
+
+    def __init__(self, name: str, max_entries: int = 256):
+        self.name = name
+        self.max_entries = max_entries
+        # key -> (fetched_at, value)
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        # Keep references to background refreshes so they are not garbage collected
+        self._refresh_tasks: Set[asyncio.Task] = set()
+
+    async def get_or_fetch(
+            self,
+            key: Hashable,
+            fetch: Callable[[], Awaitable[Any]],
+            ttl: Optional[float],
+            stale_ttl: float = 0,
+            should_cache: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """
+        Return the cached value for key, fetching it when missing or too old
+
+        Args:
+            key: Cache key
+            fetch: Function returning an awaitable of the value
+            ttl: Seconds a value is served without refreshing, None to keep it until evicted
+            stale_ttl: Further seconds an old value is served while it is refreshed in the background
+            should_cache: Optional check that a fetched value is worth keeping (e.g. not an empty fallback)
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            fetched_at, value = entry
+            age = time.monotonic() - fetched_at
+            if ttl is None or age < ttl:
+                self._entries.move_to_end(key)
+                return value
+            if age < ttl + stale_ttl:
+                self._entries.move_to_end(key)
+                if key not in self._in_flight:
+                    task = asyncio.create_task(self._refresh(key, fetch, should_cache))
+                    self._refresh_tasks.add(task)
+                    task.add_done_callback(self._refresh_tasks.discard)
+                return value
+
+        return await asyncio.shield(self._fetch(key, fetch, should_cache))
+
+    def _fetch(
+            self,
+            key: Hashable,
+            fetch: Callable[[], Awaitable[Any]],
+            should_cache: Optional[Callable[[Any], bool]],
+    ) -> asyncio.Future:
+        """Start a fetch for key, or join the one already running"""
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            return pending
+
+        async def run():
+            try:
+                value = await fetch()
+                if should_cache is None or should_cache(value):
+                    self.set(key, value)
+                return value
+            finally:
+                self._in_flight.pop(key, None)
+
+        pending = asyncio.ensure_future(run())
+        self._in_flight[key] = pending
+        return pending
+
+    async def _refresh(
+            self,
+            key: Hashable,
+            fetch: Callable[[], Awaitable[Any]],
+            should_cache: Optional[Callable[[Any], bool]],
+    ):
+        try:
+            await self._fetch(key, fetch, should_cache)
+        except Exception as e:
+            logger.warning(f"Background refresh of {self.name} cache failed, serving stale value: {e}")
+
+    def get(self, key: Hashable, ttl: Optional[float]) -> Tuple[bool, Any]:
+        """Return (True, value) if key holds a value fetched less than ttl seconds ago, else (False, None)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        fetched_at, value = entry
+        if ttl is not None and time.monotonic() - fetched_at >= ttl:
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def set(self, key: Hashable, value: Any):
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """Drop one key, or every entry when key is None"""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
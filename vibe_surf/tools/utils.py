@@ -12,6 +12,7 @@ from browser_use.dom.service import EnhancedDOMTreeNode
 from vibe_surf.logger import get_logger
 from browser_use.llm.messages import SystemMessage, UserMessage, AssistantMessage, ContentPartTextParam, ContentPartImageParam, ImageURL
 from browser_use.llm.base import BaseChatModel
+from vibe_surf.llm.cache import cacheable_llm_calls
 
 logger = get_logger(__name__)
 
@@ -1508,10 +1509,11 @@ You will be given a query and the markdown of a webpage that has been filtered t
 
     try:
         from browser_use.llm.messages import SystemMessage, UserMessage
-        response = await asyncio.wait_for(
-            llm.ainvoke([SystemMessage(content=system_prompt), UserMessage(content=prompt)]),
-            timeout=120.0,
-        )
+        with cacheable_llm_calls():
+            response = await asyncio.wait_for(
+                llm.ainvoke([SystemMessage(content=system_prompt), UserMessage(content=prompt)]),
+                timeout=120.0,
+            )
         return response.completion
     except Exception as e:
         logger.debug(f'Error extracting content: {e}')
@@ -1555,11 +1557,12 @@ Format: [index1, index2, index3, ...]
 """
 
         from browser_use.llm.messages import SystemMessage, UserMessage
-        ranking_response = await llm.ainvoke([
-            SystemMessage(
-                content="You are an expert at ranking search results for relevance and value. Return only the indices of the top results."),
-            UserMessage(content=ranking_prompt)
-        ])
+        with cacheable_llm_calls():
+            ranking_response = await llm.ainvoke([
+                SystemMessage(
+                    content="You are an expert at ranking search results for relevance and value. Return only the indices of the top results."),
+                UserMessage(content=ranking_prompt)
+            ])
 
         try:
             selected_indices = json.loads(ranking_response.completion.strip())
@@ -1646,10 +1649,11 @@ async def extract_file_content_with_llm(file_path: str, query: str, llm: BaseCha
 
             # Create user message and invoke LLM
             user_message = UserMessage(content=content_parts, cache=True)
-            response = await asyncio.wait_for(
-                llm.ainvoke([user_message]),
-                timeout=120.0,
-            )
+            with cacheable_llm_calls():
+                response = await asyncio.wait_for(
+                    llm.ainvoke([user_message]),
+                    timeout=120.0,
+                )
 
             extracted_content = f'File: {file_path}\nQuery: {query}\nExtracted Content:\n{response.completion}'
 
@@ -1672,10 +1676,11 @@ File Content:
 
 Provide the extracted information in a clear, structured format."""
 
-            response = await asyncio.wait_for(
-                llm.ainvoke([UserMessage(content=prompt)]),
-                timeout=120.0,
-            )
+            with cacheable_llm_calls():
+                response = await asyncio.wait_for(
+                    llm.ainvoke([UserMessage(content=prompt)]),
+                    timeout=120.0,
+                )
 
             extracted_content = f'File: {file_path}\nQuery: {query}\nExtracted Content:\n{response.completion}'
 
@@ -523,7 +523,7 @@ class VibeSurfTools:
                 method_strings = [method.value for method in methods]
 
                 # Retrieve financial data
-                financial_data = retriever.get_finance_data(
+                financial_data = await retriever.aget_finance_data(
                     methods=method_strings,
                     period=getattr(params, 'period', '1y'),
                     start_date=getattr(params, 'start_date', None),
@@ -1001,96 +1001,53 @@ class VibeSurfTools:
             - adjustable components with input parameters
             """
             try:
+                from vibe_surf.backend.shared_state import wait_for_components
+                await wait_for_components("workflow_skills")
                 from vibe_surf.backend.shared_state import workflow_skills
+                from vibe_surf.backend.utils.workflow_index import get_workflow_index
 
-                # Get all workflows
-                all_workflows = workflow_skills
-
-                if not all_workflows:
+                if not workflow_skills:
                     return ActionResult(
                         extracted_content="No workflows available. Please configure workflows in the skill management system.",
                         long_term_memory="No workflows configured"
                     )
 
-                # Filter workflows
-                filtered_workflows = {}
+                index = get_workflow_index(workflow_skills)
 
                 # If workflow_id is provided, prioritize it
+                entries = []
                 if params.workflow_id:
-                    for flow_id, workflow_data in all_workflows.items():
-                        if flow_id.endswith(params.workflow_id):
-                            filtered_workflows[flow_id] = workflow_data
-                            break
+                    entry = index.find_by_suffix(params.workflow_id)
+                    if entry:
+                        entries = [entry]
 
                 # If no workflow_id match or not provided, search by keywords
-                if not filtered_workflows:
+                if not entries:
                     # Check if we should return all workflows
                     if not params.key_words or params.key_words.strip() in ['', 'None', '*']:
-                        filtered_workflows = all_workflows
+                        entries = index.all()
                     else:
-                        # Filter by keywords
-                        keywords = [kw.strip().lower() for kw in params.key_words.split(',')]
-                        for flow_id, workflow_data in all_workflows.items():
-                            name = workflow_data.get('name', '').lower()
-                            description = workflow_data.get('description', '').lower()
-                            search_text = f"{name} {description}"
-
-                            if any(keyword in search_text for keyword in keywords):
-                                filtered_workflows[flow_id] = workflow_data
+                        entries = [entry for entry, _ in index.search(params.key_words, top_k=params.top_k)]
 
-                if not filtered_workflows:
+                if not entries:
                     return ActionResult(
                         extracted_content=f"No workflows found matching criteria. Keywords: {params.key_words}, Workflow ID: {params.workflow_id}",
                         long_term_memory="No matching workflows found"
                     )
 
-                # Format results
-                result_text = f"# Available Workflows ({len(filtered_workflows)} found)\n\n"
-
-                for flow_id, workflow_data in filtered_workflows.items():
-                    flow_id_short = flow_id[-4:]
-                    workflow_name = workflow_data.get('name', 'Unnamed Workflow')
-                    workflow_desc = workflow_data.get('description', 'No description')
-                    workflow_expose_config = workflow_data.get('workflow_expose_config', {})
-
-                    result_text += f"## @flow-{flow_id_short}: {workflow_name}\n\n"
-                    result_text += f"**Full ID:** {flow_id}\n\n"
-                    result_text += f"**Description:** {workflow_desc}\n\n"
-
+                # Format results, most relevant first
+                result_text = f"# Available Workflows ({len(entries)} found)\n\n"
+                for entry in entries:
+                    result_text += entry.summary
                     # List adjustable parameters
-                    if len(filtered_workflows) < 5:
-                        if workflow_expose_config:
-                            result_text += "**Adjustable Parameters:**\n\n"
-
-                            for component_id, component_data in workflow_expose_config.items():
-                                component_name = component_data.get('component_name', component_id)
-                                inputs = component_data.get('inputs', {})
-
-                                # Only show exposed inputs
-                                exposed_inputs = {k: v for k, v in inputs.items() if v.get('is_expose', False)}
-
-                                if exposed_inputs:
-                                    result_text += f"- **{component_name}** (`{component_id}`):\n"
-
-                                    for input_name, input_data in exposed_inputs.items():
-                                        display_name = input_data.get('display_name', input_name)
-                                        input_type = input_data.get('type', 'str')
-                                        info = input_data.get('info', '')
-                                        current_value = input_data.get('value', '')
-
-                                        result_text += f"  - `{input_name}` ({display_name})\n"
-                                        result_text += f"    - Type: {input_type}\n"
-                                        if info:
-                                            result_text += f"    - Description: {info}\n"
-                                        result_text += f"    - Current/Default Value: {current_value}\n"[:100]
-                        else:
-                            result_text += "**No adjustable parameters configured**\n\n"
+                    if len(entries) < 5:
+                        result_text += entry.parameters_text
 
-                logger.info(f'🔍 Found {len(filtered_workflows)} workflows')
+                logger.info(f'🔍 Found {len(entries)} workflows')
                 return ActionResult(
                     extracted_content=result_text,
                     include_extracted_content_only_once=True,
-                    long_term_memory=f'Found {len(filtered_workflows)} workflows'
+                    long_term_memory=f'Found {len(entries)} workflows'
                 )
 
             except Exception as e:
@@ -1109,6 +1066,8 @@ class VibeSurfTools:
             Uses tweak_params to customize workflow inputs
             """
             try:
+                from vibe_surf.backend.shared_state import wait_for_components
+                await wait_for_components("workflow_skills")
                 from vibe_surf.backend.shared_state import workflow_skills
                 from vibe_surf.langflow.api.v1.endpoints import simple_run_flow
                 from vibe_surf.langflow.api.v1.schemas import SimplifiedAPIRequest
@@ -1583,7 +1542,7 @@ class VibeSurfTools:
                 from browser_use.agent.views import DEFAULT_INCLUDE_ATTRIBUTES
                 
                 # Get browser tabs
-                browser_tabs = await browser_manager.main_browser_session.get_tabs()
+                browser_tabs = await browser_manager.get_all_tabs()
                 
                 active_browser_tab = await browser_manager.get_activate_tab()
 
@@ -2750,6 +2709,29 @@ class VibeSurfTools:
         except Exception as e:
             logger.error(f'Failed to update Composio tools: {str(e)}')
 
+    async def sync_composio_tools(self, composio_instance: Optional[Any] = None,
+                                  toolkit_tools_dict: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Register added or changed Composio tools and remove dropped ones, leaving unchanged tools in place.
+
+        Args:
+            composio_instance: Composio instance
+            toolkit_tools_dict: Dict of toolkit_slug -> tools list
+
+        Returns:
+            True if the registered tools now match toolkit_tools_dict
+        """
+        try:
+            if self.composio_client is None:
+                self.composio_client = ComposioClient(composio_instance=composio_instance)
+            else:
+                self.composio_client.update_composio_instance(composio_instance)
+            self.composio_toolkits = toolkit_tools_dict or {}
+            return self.composio_client.sync_tools(self, self.composio_toolkits, prefix="cpo.")
+        except Exception as e:
+            logger.error(f'Failed to sync Composio tools: {str(e)}')
+            return False
+
     @time_execution_sync('--act')
     async def act(
             self,
@@ -468,6 +468,15 @@ class CallApiAction(BaseModel):
     params: str = Field(
         description='JSON string of method parameters'
     )
+    max_items: Optional[int] = Field(
+        default=None,
+        description='Stop paginated methods once this many items have been saved. Leave None to fetch everything the method returns.',
+        ge=1,
+    )
+    resume_file: Optional[str] = Field(
+        default=None,
+        description='Relative path of a partial .jsonl data file from an earlier interrupted call to continue appending to.',
+    )
 
 
 class GetElementInfoAction(BaseModel):
@@ -481,12 +490,17 @@ class SearchWorkflowsAction(BaseModel):
     """Parameters for search_workflows action - Search available workflows"""
     key_words: str | None = Field(
         default=None,
-        description='Comma-separated keywords to search in workflow name and description. Use empty string, None, or "*" to return all workflows. Example: "search,data,analysis"'
+        description='Comma-separated keywords to search in workflow name, description and adjustable parameters. Use empty string, None, or "*" to return all workflows. Example: "search,data,analysis"'
     )
     workflow_id: str | None = Field(
         default=None,
         description='Optional last 4 digits of workflow ID for direct lookup. If empty or None, will search by keywords instead.'
     )
+    top_k: int = Field(
+        default=10,
+        ge=1,
+        description='Maximum number of keyword matches to return, ranked by relevance. Listing all workflows is not limited',
+    )
 
 
 class ExecuteWorkflowAction(BaseModel):
@@ -10,16 +10,11 @@ import httpx
 import random
 from tenacity import retry, stop_after_attempt, wait_fixed
 
-try:
-    import execjs
-
-    HAS_EXECJS = True
-except ImportError:
-    HAS_EXECJS = False
-
 from vibe_surf.browser.agent_browser_session import AgentBrowserSession
 from vibe_surf.logger import get_logger
 from vibe_surf.tools.website_api.base_client import BaseAPIClient
+from vibe_surf.tools.website_api.rate_limiter import get_rate_limiter
+from vibe_surf.tools.website_api.js_signer import get_js_signing_service
 
 from .helpers import (
     SearchChannelType, SearchSortType, PublishTimeType,
@@ -32,6 +27,8 @@ from .helpers import (
 
 logger = get_logger(__name__)
 
+DOUYIN_JS_PATH = os.path.join(os.path.dirname(__file__), 'douyin.js')
+
 
 class DouyinApiClient(BaseAPIClient):
     """
@@ -149,26 +146,6 @@ class DouyinApiClient(BaseAPIClient):
             logger.warning(f"Failed to get local storage token: {e}")
             return None
 
-    def _init_js_context(self):
-        """Initialize JavaScript context for signature generation"""
-        if not HAS_EXECJS:
-            logger.warning("execjs not available, signature generation disabled")
-            return None
-
-        try:
-            js_file_path = os.path.join(os.path.dirname(__file__), 'douyin.js')
-            if not os.path.exists(js_file_path):
-                logger.warning(f"douyin.js file not found at {js_file_path}")
-                return None
-
-            with open(js_file_path, 'r', encoding='utf-8-sig') as f:
-                js_content = f.read()
-
-            return execjs.compile(js_content)
-        except Exception as e:
-            logger.error(f"Failed to initialize JS context: {e}")
-            return None
-
     async def _get_a_bogus_signature(self, uri: str, params: str, post_data: Dict = None) -> str:
         """
         Get a-bogus signature using JavaScript execution
@@ -182,10 +159,8 @@ class DouyinApiClient(BaseAPIClient):
             a-bogus signature string
         """
         try:
-            if not hasattr(self, '_js_context'):
-                self._js_context = self._init_js_context()
-
-            if not self._js_context:
+            if not os.path.exists(DOUYIN_JS_PATH):
+                logger.warning(f"douyin.js file not found at {DOUYIN_JS_PATH}")
                 return ""
 
             user_agent = self.default_headers.get('User-Agent', '')
@@ -195,8 +170,8 @@ class DouyinApiClient(BaseAPIClient):
             if "/reply" in uri:
                 sign_function_name = "sign_reply"
 
-            # Call the JavaScript function
-            a_bogus = self._js_context.call(sign_function_name, params, user_agent)
+            # Call the JavaScript function in the shared signing worker
+            a_bogus = await get_js_signing_service().call(DOUYIN_JS_PATH, sign_function_name, params, user_agent)
             return a_bogus or ""
 
         except Exception as e:
@@ -255,13 +230,21 @@ class DouyinApiClient(BaseAPIClient):
         Returns:
             Response data
         """
+        rate_limiter = get_rate_limiter("douyin")
+        await rate_limiter.acquire()
+        start_time = time.monotonic()
         async with httpx.AsyncClient(proxy=self.proxy) as client:
             response = await client.request(method, url, timeout=self.timeout, **kwargs)
 
         # Handle common error responses
         if response.text == "" or response.text == "blocked":
+            rate_limiter.on_throttle("blocked")
             logger.error(f"Request blocked, response.text: {response.text}")
             raise VerificationError("Account may be blocked or requires verification")
+        if response.status_code == 429:
+            rate_limiter.on_throttle("status 429")
+        elif response.is_success:
+            rate_limiter.on_success(time.monotonic() - start_time)
 
         try:
             data = response.json()
@@ -544,15 +527,17 @@ class DouyinApiClient(BaseAPIClient):
             fetch_interval: float = 1.0,
             include_replies: bool = False,
             max_comments: int = 1000,
+            callback: Optional[Callable] = None,
     ) -> List[Dict]:
         """
         Fetch all comments for a video, including replies if requested
         
         Args:
             aweme_id: Video ID
-            fetch_interval: Delay between requests
+            fetch_interval: Deprecated, requests are paced by the adaptive platform rate limiter
             include_replies: Whether to fetch comment replies
             max_comments: Maximum comments to fetch
+            callback: Callback function after fetching each batch
             
         Returns:
             List of all simplified comments
@@ -618,25 +603,37 @@ class DouyinApiClient(BaseAPIClient):
             if len(batch_comments) > remaining_slots:
                 batch_comments = batch_comments[:remaining_slots]
 
-            all_comments.extend(batch_comments)
+            if callback:
+                await callback(batch_comments)
 
-            await asyncio.sleep(fetch_interval)
+            all_comments.extend(batch_comments)
 
-            # Fetch replies if requested
+            # Fetch replies if requested; they count toward max_comments like root comments
             if include_replies:
-                for comment in batch_comments:
-                    reply_count = int(comment.get("sub_comment_count", 0))
-
-                    if reply_count > 0:
-                        comment_id = comment.get("comment_id")
-                        replies = await self.fetch_comment_replies(aweme_id, comment_id, 0)
-                        all_comments.extend(replies)
-
-                        await asyncio.sleep(fetch_interval)
+                comment_ids = [comment.get("comment_id") for comment in batch_comments
+                               if int(comment.get("sub_comment_count", 0)) > 0]
+                remaining_slots = max_comments - len(all_comments)
+                if comment_ids and remaining_slots > 0:
+                    replies = await self._fetch_replies_for_comments(aweme_id, comment_ids)
+                    replies = replies[:remaining_slots]
+                    if callback and replies:
+                        await callback(replies)
+                    all_comments.extend(replies)
 
         logger.info(f"Fetched {len(all_comments)} comments for video {aweme_id}")
         return all_comments
 
+    async def _fetch_replies_for_comments(
+            self,
+            aweme_id: str,
+            comment_ids: List[str],
+    ) -> List[Dict]:
+        """Fetch the first reply page of several comments concurrently"""
+        reply_batches = await asyncio.gather(
+            *(self.fetch_comment_replies(aweme_id, comment_id, 0) for comment_id in comment_ids)
+        )
+        return [reply for batch in reply_batches for reply in batch]
+
     async def fetch_user_info(self, sec_user_id: str) -> Dict:
         """
         Fetch user profile information
@@ -731,7 +728,8 @@ class DouyinApiClient(BaseAPIClient):
     async def fetch_all_user_videos(
             self,
             sec_user_id: str,
-            max_videos: int = 1000
+            max_videos: int = 1000,
+            callback: Optional[Callable] = None,
     ) -> List[Dict]:
         """
         Fetch all videos from a user
@@ -739,6 +737,7 @@ class DouyinApiClient(BaseAPIClient):
         Args:
             sec_user_id: User's security ID
             max_videos: Maximum videos to fetch
+            callback: Callback function after fetching each batch
             
         Returns:
             List of all simplified user videos
@@ -800,6 +799,9 @@ class DouyinApiClient(BaseAPIClient):
             if len(batch_videos) > remaining_slots:
                 batch_videos = batch_videos[:remaining_slots]
 
+            if callback:
+                await callback(batch_videos)
+
             all_videos.extend(batch_videos)
             logger.info(f"Fetched {len(batch_videos)} videos for user {sec_user_id}, total: {len(all_videos)}")
 
@@ -0,0 +1,49 @@
+// Long-lived signing worker used by vibe_surf.tools.website_api.js_signer.
+// Reads one JSON request per line from stdin: {"id", "script", "function", "args"}
+// and writes one JSON response per line to stdout: {"id", "result"} or {"id", "error"}.
+// Each script is compiled once and kept for the lifetime of the process.
+const fs = require('fs');
+const readline = require('readline');
+
+const contexts = new Map();
+
+function loadContext(scriptPath) {
+    let call = contexts.get(scriptPath);
+    if (!call) {
+        const source = fs.readFileSync(scriptPath, 'utf-8').replace(/^\uFEFF/, '');
+        // Same wrapping as execjs: functions declared by the script are resolved by name
+        const factory = new Function(
+            'require', 'module', 'exports',
+            source + '\n;return function (__name, __args) { return eval(__name).apply(this, __args); };'
+        );
+        const module = { exports: {} };
+        call = factory(require, module, module.exports);
+        contexts.set(scriptPath, call);
+    }
+    return call;
+}
+
+const rl = readline.createInterface({ input: process.stdin, terminal: false });
+
+rl.on('line', (line) => {
+    if (!line.trim()) {
+        return;
+    }
+    let request;
+    try {
+        request = JSON.parse(line);
+    } catch (e) {
+        return;
+    }
+    let response;
+    try {
+        const call = loadContext(request.script);
+        const result = call(request.function, request.args || []);
+        response = { id: request.id, result: result === undefined ? null : result };
+    } catch (e) {
+        response = { id: request.id, error: String(e && e.stack ? e.stack : e) };
+    }
+    process.stdout.write(JSON.stringify(response) + '\n');
+});
+
+rl.on('close', () => process.exit(0));
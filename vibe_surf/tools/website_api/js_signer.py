@@ -0,0 +1,211 @@
+"""
+Persistent JavaScript signing service for website API clients.
+
+Website signature scripts (douyin.js, zhihu.js) are evaluated in one long-lived
+Node process that keeps every compiled script in memory and serves requests
+over its stdin/stdout pipes. When Node is not installed, compiled execjs
+contexts are cached and called in worker threads instead, so signing never
+blocks the event loop.
+"""
+import asyncio
+import itertools
+import json
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import execjs
+
+    HAS_EXECJS = True
+except ImportError:
+    HAS_EXECJS = False
+
+from vibe_surf.logger import get_logger
+
+logger = get_logger(__name__)
+
+WORKER_SCRIPT_PATH = os.path.join(os.path.dirname(__file__), 'js_sign_worker.js')
+
+
+class JsSigningError(Exception):
+    """Raised when a signature script cannot be evaluated"""
+    pass
+
+
+class JsSigningService:
+    """
+    Async front end for a persistent JS runtime used to compute request signatures.
+
+    Example:
+        >>> signer = get_js_signing_service()
+        >>> a_bogus = await signer.call(DOUYIN_JS_PATH, "sign_datail", params, user_agent)
+    """
+
+    def __init__(self, max_concurrency: int = 4, memo_size: int = 256, timeout: float = 10.0):
+        """
+        Args:
+            max_concurrency: Maximum number of signing requests in flight
+            memo_size: Number of recent (script, function, args) results to remember
+            timeout: Seconds to wait for a single signature
+        """
+        self.max_concurrency = max_concurrency
+        self.memo_size = memo_size
+        self.timeout = timeout
+        self.node_path = shutil.which("node") or shutil.which("nodejs")
+
+        self._memo: "OrderedDict[str, Any]" = OrderedDict()
+        self._request_ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._start_lock: Optional[asyncio.Lock] = None
+
+        # execjs fallback: compiled contexts and a lock per script
+        self._execjs_contexts: Dict[str, Tuple[Any, threading.Lock]] = {}
+        self._execjs_lock = threading.Lock()
+
+    async def call(self, script_path: str, function_name: str, *args) -> Any:
+        """
+        Call a function defined in a signature script
+
+        Args:
+            script_path: Absolute path of the JS file
+            function_name: Name of a function declared in the script
+            *args: JSON-serializable arguments
+
+        Returns:
+            The function result
+
+        Raises:
+            JsSigningError: If no JS runtime is available or the call fails
+        """
+        memo_key = json.dumps([script_path, function_name, args], ensure_ascii=False, default=str)
+        if memo_key in self._memo:
+            self._memo.move_to_end(memo_key)
+            return self._memo[memo_key]
+
+        self._bind_loop()
+        async with self._semaphore:
+            if self.node_path:
+                result = await self._call_node(script_path, function_name, args)
+            elif HAS_EXECJS:
+                result = await asyncio.to_thread(self._call_execjs, script_path, function_name, args)
+            else:
+                raise JsSigningError("No JavaScript runtime available, install Node.js or PyExecJS")
+
+        self._memo[memo_key] = result
+        if len(self._memo) > self.memo_size:
+            self._memo.popitem(last=False)
+        return result
+
+    def _bind_loop(self):
+        """Bind asyncio primitives to the running loop, resetting the worker if the loop changed"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        if self._process and self._process.returncode is None:
+            self._process.kill()
+        self._process = None
+        self._reader_task = None
+        self._pending = {}
+        self._loop = loop
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._start_lock = asyncio.Lock()
+
+    async def _ensure_worker(self) -> asyncio.subprocess.Process:
+        async with self._start_lock:
+            if self._process is None or self._process.returncode is not None:
+                self._process = await asyncio.create_subprocess_exec(
+                    self.node_path, WORKER_SCRIPT_PATH,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL,
+                    limit=16 * 1024 * 1024,
+                )
+                self._reader_task = asyncio.create_task(self._read_responses(self._process))
+                logger.debug(f"Started JS signing worker (pid {self._process.pid})")
+            return self._process
+
+    async def _read_responses(self, process: asyncio.subprocess.Process):
+        """Resolve pending requests from the worker's output until it exits"""
+        try:
+            while True:
+                line = await process.stdout.readline()
+                if not line:
+                    break
+                try:
+                    response = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                future = self._pending.pop(response.get("id"), None)
+                if future is None or future.done():
+                    continue
+                if "error" in response:
+                    future.set_exception(JsSigningError(response["error"]))
+                else:
+                    future.set_result(response.get("result"))
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(JsSigningError("JS signing worker exited"))
+            self._pending.clear()
+
+    async def _call_node(self, script_path: str, function_name: str, args: tuple) -> Any:
+        process = await self._ensure_worker()
+        request_id = next(self._request_ids)
+        future = self._loop.create_future()
+        self._pending[request_id] = future
+        request = {"id": request_id, "script": script_path, "function": function_name, "args": list(args)}
+        try:
+            process.stdin.write((json.dumps(request, ensure_ascii=False) + "\n").encode("utf-8"))
+            await process.stdin.drain()
+            return await asyncio.wait_for(future, timeout=self.timeout)
+        except (BrokenPipeError, ConnectionResetError) as e:
+            raise JsSigningError(f"JS signing worker is not available: {e}")
+        except asyncio.TimeoutError:
+            raise JsSigningError(f"Timed out calling {function_name} in {os.path.basename(script_path)}")
+        finally:
+            self._pending.pop(request_id, None)
+
+    def _call_execjs(self, script_path: str, function_name: str, args: tuple) -> Any:
+        with self._execjs_lock:
+            entry = self._execjs_contexts.get(script_path)
+            if entry is None:
+                with open(script_path, 'r', encoding='utf-8-sig') as f:
+                    entry = (execjs.compile(f.read()), threading.Lock())
+                self._execjs_contexts[script_path] = entry
+        js_context, context_lock = entry
+        try:
+            with context_lock:
+                return js_context.call(function_name, *args)
+        except Exception as e:
+            raise JsSigningError(str(e))
+
+    async def close(self):
+        """Stop the worker process"""
+        process, self._process = self._process, None
+        if process and process.returncode is None:
+            process.stdin.close()
+            try:
+                await asyncio.wait_for(process.wait(), timeout=2)
+            except asyncio.TimeoutError:
+                process.kill()
+        if self._reader_task:
+            self._reader_task.cancel()
+            self._reader_task = None
+
+
+_js_signing_service: Optional[JsSigningService] = None
+
+
+def get_js_signing_service() -> JsSigningService:
+    """Return the process-wide JS signing service"""
+    global _js_signing_service
+    if _js_signing_service is None:
+        _js_signing_service = JsSigningService()
+    return _js_signing_service
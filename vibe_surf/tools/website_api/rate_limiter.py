@@ -0,0 +1,133 @@
+"""
+Adaptive per-platform rate limiting for website API clients.
+
+Every request a client sends goes through one token bucket per platform. The
+bucket's refill rate adapts to what the platform tells us: it grows slowly
+while requests succeed quickly, shrinks when latency climbs, and is halved
+(with a short cooldown) on 429s or risk-control / verification responses.
+Bulk crawlers therefore no longer need fixed sleeps between pages, and
+independent work can be issued concurrently under the same budget.
+"""
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+from vibe_surf.logger import get_logger
+
+logger = get_logger(__name__)
+
+# (initial rate, min rate, max rate) in requests per second
+PLATFORM_RATE_LIMITS: Dict[str, tuple] = {
+    "xhs": (1.0, 0.1, 3.0),
+    "douyin": (1.0, 0.1, 3.0),
+    "weibo": (1.0, 0.1, 3.0),
+    "zhihu": (1.0, 0.1, 3.0),
+    "youtube": (5.0, 0.5, 10.0),
+}
+DEFAULT_RATE_LIMIT = (1.0, 0.1, 3.0)
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket whose refill rate follows an AIMD policy.
+
+    Example:
+        >>> limiter = get_rate_limiter("xhs")
+        >>> await limiter.acquire()
+        >>> ...  # send the request
+        >>> limiter.on_success(latency)  # or limiter.on_throttle()
+    """
+
+    def __init__(
+            self,
+            name: str,
+            rate: float = 1.0,
+            min_rate: float = 0.1,
+            max_rate: float = 3.0,
+            burst: int = 2,
+            increase_step: float = 0.1,
+            slow_latency_factor: float = 2.0,
+            cooldown: float = 5.0,
+    ):
+        """
+        Args:
+            name: Platform name, used in log messages
+            rate: Initial refill rate in requests per second
+            min_rate: Lower bound of the adaptive rate
+            max_rate: Upper bound of the adaptive rate
+            burst: Maximum number of tokens the bucket holds
+            increase_step: Rate added after each fast successful request
+            slow_latency_factor: Latency above this multiple of the average counts as slow
+            cooldown: Seconds to pause all requests after a throttling response
+        """
+        self.name = name
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase_step = increase_step
+        self.slow_latency_factor = slow_latency_factor
+        self.cooldown = cooldown
+
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._avg_latency: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take one token and return how long the caller must wait for it"""
+        with self._lock:
+            now = time.monotonic()
+            if now > self._last_refill:
+                self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+            self._tokens -= 1
+            # _last_refill lies in the future while a cooldown is active
+            wait = max(0.0, self._last_refill - now)
+            if self._tokens < 0:
+                wait += -self._tokens / self.rate
+            return wait
+
+    async def acquire(self):
+        """Wait until the platform budget allows another request"""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def on_success(self, latency: float):
+        """Record a successful request and its latency"""
+        with self._lock:
+            if self._avg_latency is None:
+                self._avg_latency = latency
+            if latency > self._avg_latency * self.slow_latency_factor:
+                self.rate = max(self.min_rate, self.rate * 0.8)
+            else:
+                self.rate = min(self.max_rate, self.rate + self.increase_step)
+            self._avg_latency = 0.8 * self._avg_latency + 0.2 * latency
+
+    def on_throttle(self, reason: str = ""):
+        """Record a 429 or risk-control response: halve the rate and pause"""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+            self._last_refill = max(self._last_refill, time.monotonic() + self.cooldown)
+        logger.warning(f"[{self.name}] Throttled{f' ({reason})' if reason else ''}, "
+                       f"slowing down to {self.rate:.2f} req/s")
+
+
+_rate_limiters: Dict[str, AdaptiveRateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(platform: str) -> AdaptiveRateLimiter:
+    """Return the process-wide rate limiter for a platform"""
+    limiter = _rate_limiters.get(platform)
+    if limiter is None:
+        with _rate_limiters_lock:
+            limiter = _rate_limiters.get(platform)
+            if limiter is None:
+                rate, min_rate, max_rate = PLATFORM_RATE_LIMITS.get(platform, DEFAULT_RATE_LIMIT)
+                limiter = AdaptiveRateLimiter(platform, rate=rate, min_rate=min_rate, max_rate=max_rate)
+                _rate_limiters[platform] = limiter
+    return limiter
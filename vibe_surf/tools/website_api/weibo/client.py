@@ -13,6 +13,7 @@ from urllib.parse import parse_qs, unquote, urlencode
 from vibe_surf.browser.agent_browser_session import AgentBrowserSession
 from vibe_surf.logger import get_logger
 from vibe_surf.tools.website_api.base_client import BaseAPIClient
+from vibe_surf.tools.website_api.rate_limiter import get_rate_limiter
 
 from .helpers import (
     SearchType, TrendingType, TrendingConstants,
@@ -154,9 +155,16 @@ class WeiboApiClient(BaseAPIClient):
         """
         raw_response = kwargs.pop("raw_response", False)
 
+        rate_limiter = get_rate_limiter("weibo")
+        await rate_limiter.acquire()
+        start_time = time.monotonic()
         async with httpx.AsyncClient(proxy=self.proxy, timeout=self.timeout) as client:
             response = await client.request(method, url, **kwargs)
         # Handle common error status codes
+        if response.status_code in (403, 429):
+            rate_limiter.on_throttle(f"status {response.status_code}")
+        elif response.is_success:
+            rate_limiter.on_success(time.monotonic() - start_time)
         if response.status_code == 403:
             raise AuthenticationError("Access forbidden - may need login or verification")
         elif response.status_code == 429:
@@ -386,15 +394,17 @@ class WeiboApiClient(BaseAPIClient):
             fetch_interval: float = 1.0,
             include_sub_comments: bool = False,
             max_comments: int = 1000,
+            callback: Optional[Callable] = None,
     ) -> List[Dict]:
         """
         Fetch all comments for a post including sub-comments
         
         Args:
             mid: Weibo post ID
-            fetch_interval: Interval between requests in seconds
+            fetch_interval: Deprecated, requests are paced by the adaptive platform rate limiter
             include_sub_comments: Whether to include sub-comments
             max_comments: Maximum comments to fetch
+            callback: Callback function after fetching each batch
             
         Returns:
             List of all simplified comments
@@ -458,7 +468,9 @@ class WeiboApiClient(BaseAPIClient):
             if len(batch_comments) > remaining_slots:
                 batch_comments = batch_comments[:remaining_slots]
 
-            await asyncio.sleep(fetch_interval)
+            if callback:
+                await callback(batch_comments)
+
             all_comments.extend(batch_comments)
 
         logger.info(f"Fetched {len(all_comments)} comments for post {mid}")
@@ -588,6 +600,7 @@ class WeiboApiClient(BaseAPIClient):
             user_id: str,
             fetch_interval: float = 1.0,
             max_posts: int = 1000,
+            callback: Optional[Callable] = None,
     ) -> List[Dict]:
         """
         Fetch all posts by a user
@@ -596,6 +609,7 @@ class WeiboApiClient(BaseAPIClient):
             user_id: User ID
             fetch_interval: Interval between requests in seconds
             max_posts: Maximum posts to fetch
+            callback: Callback function after fetching each batch
             
         Returns:
             List of all simplified user posts
@@ -666,6 +680,9 @@ class WeiboApiClient(BaseAPIClient):
 
             posts_to_add = posts[:remaining_slots]
 
+            if callback:
+                await callback(posts_to_add)
+
             all_posts.extend(posts_to_add)
             await asyncio.sleep(fetch_interval)
 
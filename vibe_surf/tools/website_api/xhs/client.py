@@ -12,6 +12,7 @@ from xhshow import Xhshow
 from vibe_surf.browser.agent_browser_session import AgentBrowserSession
 from vibe_surf.logger import get_logger
 from vibe_surf.tools.website_api.base_client import BaseAPIClient
+from vibe_surf.tools.website_api.rate_limiter import get_rate_limiter
 
 from .helpers import (
     generate_trace_id, create_session_id, create_signature_headers,
@@ -192,16 +193,24 @@ class XiaoHongShuApiClient(BaseAPIClient):
         """
         raw_response = kwargs.pop("raw_response", False)
 
+        rate_limiter = get_rate_limiter("xhs")
+        await rate_limiter.acquire()
+        start_time = time.monotonic()
         async with httpx.AsyncClient(proxy=self.proxy) as client:
             response = await client.request(method, url, timeout=self.timeout, **kwargs)
 
         # Handle verification challenges
         if response.status_code in [471, 461]:
+            rate_limiter.on_throttle(f"status {response.status_code}")
             verify_type = response.headers.get("Verifytype", "")
             verify_uuid = response.headers.get("Verifyuuid", "")
             error_msg = f"Verification challenge detected, Verifytype: {verify_type}, Verifyuuid: {verify_uuid}"
             logger.error(error_msg)
             raise AuthenticationError(error_msg)
+        if response.status_code == 429:
+            rate_limiter.on_throttle("status 429")
+        elif response.is_success:
+            rate_limiter.on_success(time.monotonic() - start_time)
 
         if raw_response:
             return response.text
@@ -457,6 +466,7 @@ class XiaoHongShuApiClient(BaseAPIClient):
             xsec_token: str,
             fetch_interval: float = 1.0,
             max_comments: int = 50,
+            callback: Optional[Callable] = None,
     ) -> List[Dict]:
         """
         Fetch all comments for content (including pagination)
@@ -464,8 +474,9 @@ class XiaoHongShuApiClient(BaseAPIClient):
         Args:
             content_id: Content ID
             security_token: Security token
-            fetch_interval: Interval between requests in seconds
+            fetch_interval: Deprecated, requests are paced by the adaptive platform rate limiter
             max_comments: Maximum comments to fetch
+            callback: Callback function after fetching each batch
 
         Returns:
             List of all simplified comments
@@ -524,7 +535,9 @@ class XiaoHongShuApiClient(BaseAPIClient):
             if len(batch_comments) > remaining_slots:
                 batch_comments = batch_comments[:remaining_slots]
 
-            await asyncio.sleep(fetch_interval)
+            if callback:
+                await callback(batch_comments)
+
             all_comments.extend(batch_comments)
 
         logger.info(f"Fetched {len(all_comments)} comments for content {content_id}")
@@ -624,6 +637,7 @@ class XiaoHongShuApiClient(BaseAPIClient):
             user_id: str,
             fetch_interval: float = 1.0,
             max_content: int = 1000,
+            callback: Optional[Callable] = None,
     ) -> List[Dict]:
         """
         Fetch all content by user
@@ -632,6 +646,7 @@ class XiaoHongShuApiClient(BaseAPIClient):
             user_id: User ID
             fetch_interval: Interval between requests in seconds
             max_content: Maximum content items to fetch
+            callback: Callback function after fetching each batch
 
         Returns:
             List of all simplified user content
@@ -701,6 +716,9 @@ class XiaoHongShuApiClient(BaseAPIClient):
 
             content_to_add = batch_content[:remaining_slots]
 
+            if callback:
+                await callback(content_to_add)
+
             all_content.extend(content_to_add)
             await asyncio.sleep(fetch_interval)
 
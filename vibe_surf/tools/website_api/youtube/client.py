@@ -15,6 +15,7 @@ from youtube_transcript_api import YouTubeTranscriptApi
 from vibe_surf.browser.agent_browser_session import AgentBrowserSession
 from vibe_surf.logger import get_logger
 from vibe_surf.tools.website_api.base_client import BaseAPIClient
+from vibe_surf.tools.website_api.rate_limiter import get_rate_limiter
 
 from .helpers import (
     SearchType, SortType, Duration, UploadDate,
@@ -207,10 +208,17 @@ class YouTubeApiClient(BaseAPIClient):
         """
         raw_response = kwargs.pop("raw_response", False)
 
+        rate_limiter = get_rate_limiter("youtube")
+        await rate_limiter.acquire()
+        start_time = time.monotonic()
         async with httpx.AsyncClient(proxy=self.proxy, timeout=self.timeout) as client:
             response = await client.request(method, url, **kwargs)
 
         # Handle common error status codes
+        if response.status_code == 429:
+            rate_limiter.on_throttle("status 429")
+        elif response.is_success:
+            rate_limiter.on_success(time.monotonic() - start_time)
         if response.status_code == 403:
             raise AuthenticationError("Access forbidden - may need login or verification")
         elif response.status_code == 429:
@@ -520,7 +528,8 @@ class YouTubeApiClient(BaseAPIClient):
             max_comments: int = 200,
             continuation_token: Optional[str] = None,
             sort_by: int = 0,  # 0 = popular, 1 = recent
-            sleep_time: float = 0.1
+            sleep_time: float = 0.1,
+            callback: Optional[Callable] = None,
     ) -> List[Dict]:
         """
         Get comments for a YouTube video with full pagination support
@@ -530,7 +539,8 @@ class YouTubeApiClient(BaseAPIClient):
             max_comments: Maximum number of comments to fetch (0 for all)
             continuation_token: Token for pagination
             sort_by: Comment sorting (0=popular, 1=recent)
-            sleep_time: Sleep time between requests
+            sleep_time: Deprecated, requests are paced by the adaptive platform rate limiter
+            callback: Callback function after fetching each batch
 
         Returns:
             List of simplified comment information
@@ -641,14 +651,12 @@ class YouTubeApiClient(BaseAPIClient):
 
                 # Reverse to maintain chronological order (YouTube returns in reverse)
                 batch_comments.reverse()
+                if callback and batch_comments:
+                    await callback(batch_comments)
                 comments.extend(batch_comments)
 
                 logger.info(f"Fetched {len(batch_comments)} comments, total: {len(comments)}")
 
-                # Sleep between requests to avoid rate limiting
-                if continuations and sleep_time > 0:
-                    await asyncio.sleep(sleep_time)
-
             return comments[:max_comments] if max_comments > 0 else comments
 
         except Exception as e:
@@ -834,7 +842,8 @@ class YouTubeApiClient(BaseAPIClient):
             self,
             video_id: str,
             sort_by: int = 1,  # 0 = popular, 1 = recent
-            sleep_time: float = 0.1
+            sleep_time: float = 0.1,
+            callback: Optional[Callable] = None,
     ) -> List[Dict]:
         """
         Get all comments for a YouTube video (no limit)
@@ -842,7 +851,8 @@ class YouTubeApiClient(BaseAPIClient):
         Args:
             video_id: YouTube video ID
             sort_by: Comment sorting (0=popular, 1=recent)
-            sleep_time: Sleep time between requests
+            sleep_time: Deprecated, requests are paced by the adaptive platform rate limiter
+            callback: Callback function after fetching each batch
 
         Returns:
             List of all comments for the video
@@ -851,7 +861,8 @@ class YouTubeApiClient(BaseAPIClient):
             video_id=video_id,
             max_comments=0,  # 0 means no limit
             sort_by=sort_by,
-            sleep_time=sleep_time
+            sleep_time=sleep_time,
+            callback=callback,
         )
 
     def _extract_continuation_tokens(self, data: Any) -> List[str]:
@@ -1,5 +1,6 @@
 import asyncio
 import json
+import time
 from typing import Any, Callable, Dict, List, Optional, Union
 from urllib.parse import urlencode
 import httpx
@@ -8,6 +9,7 @@ from tenacity import retry, stop_after_attempt, wait_fixed
 from vibe_surf.browser.agent_browser_session import AgentBrowserSession
 from vibe_surf.logger import get_logger
 from vibe_surf.tools.website_api.base_client import BaseAPIClient
+from vibe_surf.tools.website_api.rate_limiter import get_rate_limiter
 
 from .helpers import (
     SearchTime, SearchType, SearchSort,
@@ -135,7 +137,7 @@ class ZhiHuClient(BaseAPIClient):
         if not d_c0:
             raise Exception("d_c0 not found in cookies")
         
-        sign_res = sign(url, self.default_headers["cookie"])
+        sign_res = await sign(url, self.default_headers["cookie"])
         headers = self.default_headers.copy()
         headers['x-zst-81'] = sign_res.get("x-zst-81", "")
         headers['x-zse-96'] = sign_res.get("x-zse-96", "")
@@ -156,9 +158,17 @@ class ZhiHuClient(BaseAPIClient):
         """
         return_response = kwargs.pop('return_response', False)
 
+        rate_limiter = get_rate_limiter("zhihu")
+        await rate_limiter.acquire()
+        start_time = time.monotonic()
         async with httpx.AsyncClient(proxy=self.proxy) as client:
             response = await client.request(method, url, timeout=self.timeout, **kwargs)
 
+        if response.status_code in (403, 429):
+            rate_limiter.on_throttle(f"status {response.status_code}")
+        elif response.is_success:
+            rate_limiter.on_success(time.monotonic() - start_time)
+
         if response.status_code != 200:
             logger.error(f"[ZhiHuClient.request] Request Url: {url}, Request error: {response.text}")
             if response.status_code == 403:
@@ -353,7 +363,7 @@ class ZhiHuClient(BaseAPIClient):
         Args:
             content_id: Content ID
             content_type: Content type (answer, article, zvideo)
-            crawl_interval: Delay between requests
+            crawl_interval: Deprecated, requests are paced by the adaptive platform rate limiter
             callback: Callback function after fetching each batch
             
         Returns:
@@ -388,7 +398,6 @@ class ZhiHuClient(BaseAPIClient):
                 result.extend(sub_comments)
             if len(result) >= max_comments:
                 break
-            await asyncio.sleep(crawl_interval)
             
         return result
 
@@ -407,45 +416,64 @@ class ZhiHuClient(BaseAPIClient):
             content_id: Content ID
             content_type: Content type (answer, article, zvideo)
             comments: List of parent comment dictionaries
-            crawl_interval: Delay between requests
+            crawl_interval: Deprecated, requests are paced by the adaptive platform rate limiter
             callback: Callback function after fetching each batch
             
         Returns:
             List of all sub-comment dictionaries
         """
-        all_sub_comments: List[Dict] = []
-        
         # Create content dict for extractor
         content = {"content_id": content_id, "content_type": content_type}
-        
-        for parent_comment in comments:
-            if parent_comment.get("sub_comment_count", 0) == 0:
-                continue
 
-            is_end: bool = False
-            offset: str = ""
-            limit: int = 10
+        # Threads of different parents are independent, fetch them concurrently
+        threads = await asyncio.gather(*(
+            self._get_comment_thread(content, parent_comment, callback)
+            for parent_comment in comments
+            if parent_comment.get("sub_comment_count", 0) != 0
+        ))
+        return [sub_comment for thread in threads for sub_comment in thread]
+
+    async def _get_comment_thread(
+        self,
+        content: Dict,
+        parent_comment: Dict,
+        callback: Optional[Callable] = None,
+    ) -> List[Dict]:
+        """
+        Page through all sub-comments of one parent comment
+        
+        Args:
+            content: Content dict passed to the extractor
+            parent_comment: Parent comment dictionary
+            callback: Callback function after fetching each batch
             
-            while not is_end:
-                child_comment_res = await self.get_child_comments(parent_comment["comment_id"], offset, limit)
-                if not child_comment_res:
-                    break
-                    
-                paging_info = child_comment_res.get("paging", {})
-                is_end = paging_info.get("is_end", True)
-                offset = self._extractor.extract_offset(paging_info)
-                sub_comments = self._extractor.extract_comments(content, child_comment_res.get("data", []))
-
-                if not sub_comments:
-                    break
-
-                if callback:
-                    await callback(sub_comments)
-
-                all_sub_comments.extend(sub_comments)
-                await asyncio.sleep(crawl_interval)
-                
-        return all_sub_comments
+        Returns:
+            List of sub-comment dictionaries
+        """
+        thread_comments: List[Dict] = []
+        is_end: bool = False
+        offset: str = ""
+        limit: int = 10
+
+        while not is_end:
+            child_comment_res = await self.get_child_comments(parent_comment["comment_id"], offset, limit)
+            if not child_comment_res:
+                break
+
+            paging_info = child_comment_res.get("paging", {})
+            is_end = paging_info.get("is_end", True)
+            offset = self._extractor.extract_offset(paging_info)
+            sub_comments = self._extractor.extract_comments(content, child_comment_res.get("data", []))
+
+            if not sub_comments:
+                break
+
+            if callback:
+                await callback(sub_comments)
+
+            thread_comments.extend(sub_comments)
+
+        return thread_comments
 
     async def get_creator_info(self, url_token: str) -> Optional[Dict]:
         """
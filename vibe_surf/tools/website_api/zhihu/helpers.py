@@ -6,18 +6,16 @@ from typing import Dict, List, Tuple, Optional
 from enum import Enum
 from urllib.parse import parse_qs, urlparse
 
-try:
-    import execjs
-    HAS_EXECJS = True
-except ImportError:
-    HAS_EXECJS = False
-
 try:
     from parsel import Selector
     HAS_PARSEL = True
 except ImportError:
     HAS_PARSEL = False
 
+from vibe_surf.tools.website_api.js_signer import get_js_signing_service
+
+ZHIHU_JS_PATH = os.path.join(os.path.dirname(__file__), 'zhihu.js')
+
 
 class SearchTime(Enum):
     """Search time range constants"""
@@ -142,7 +140,7 @@ class VerificationError(ZhihuError):
     pass
 
 
-def sign(url: str, cookies: str) -> Dict:
+async def sign(url: str, cookies: str) -> Dict:
     """
     Zhihu sign algorithm using zhihu.js in the same directory
     
@@ -153,22 +151,11 @@ def sign(url: str, cookies: str) -> Dict:
     Returns:
         Dictionary with x-zst-81 and x-zse-96 signatures
     """
-    if not HAS_EXECJS:
+    if not os.path.exists(ZHIHU_JS_PATH):
         return {"x-zst-81": "", "x-zse-96": ""}
-    
+
     try:
-        # Load the zhihu.js file from the same directory
-        js_file_path = os.path.join(os.path.dirname(__file__), 'zhihu.js')
-        
-        if not os.path.exists(js_file_path):
-            return {"x-zst-81": "", "x-zse-96": ""}
-        
-        with open(js_file_path, mode="r", encoding="utf-8-sig") as f:
-            js_content = f.read()
-        
-        js_context = execjs.compile(js_content)
-        sign_result = js_context.call("get_sign", url, cookies)
-        return sign_result
+        return await get_js_signing_service().call(ZHIHU_JS_PATH, "get_sign", url, cookies)
     except Exception as e:
         return {"x-zst-81": "", "x-zse-96": ""}
 
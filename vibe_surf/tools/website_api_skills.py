@@ -3,9 +3,12 @@ Unified Website API Skills Handler
 Supports: Xiaohongshu (XHS), Weibo, Zhihu, Douyin, YouTube
 """
 
+import hashlib
+import inspect
 import json
 from datetime import datetime
-from typing import Any, Dict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 from json_repair import repair_json
 
 from browser_use.agent.views import ActionResult
@@ -60,6 +63,128 @@ PLATFORMS = {
 }
 
 
+class _TargetReached(BaseException):
+    """
+    Raised from the streaming callback once enough items have been saved.
+
+    Derives from BaseException so the clients' broad ``except Exception``
+    handlers let it through and the crawl actually stops.
+    """
+    pass
+
+
+class NdjsonResultSink:
+    """
+    Append paginated API results to an NDJSON file as each batch arrives.
+
+    Every batch is flushed to disk immediately, so an interrupted crawl leaves
+    a valid partial file. Opening an existing file resumes it: a truncated last
+    line is dropped and items already saved are not written again.
+    """
+
+    def __init__(self, filepath: Path, max_items: Optional[int] = None, preview_size: int = 5):
+        """
+        Args:
+            filepath: Target .jsonl file
+            max_items: Stop the crawl once this many items are saved
+            preview_size: Number of items kept in memory for the result preview
+        """
+        self.filepath = filepath
+        self.max_items = max_items
+        self.preview_size = preview_size
+        self.count = 0
+        self.resumed_count = 0
+        self.preview: List[Any] = []
+        self._seen = set()
+        self._file = None
+
+    @property
+    def done(self) -> bool:
+        return self.max_items is not None and self.count >= self.max_items
+
+    def open(self):
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        if self.filepath.exists():
+            self._load_existing()
+            self.resumed_count = self.count
+        self._file = open(self.filepath, "a", encoding="utf-8")
+
+    def _load_existing(self):
+        """Index items of a partial file and cut off a line left half-written by a crash"""
+        valid_bytes = 0
+        with open(self.filepath, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    item = json.loads(line)
+                except json.JSONDecodeError:
+                    break
+                valid_bytes += len(line)
+                self._remember(item, self._item_key(item))
+        with open(self.filepath, "r+b") as f:
+            f.truncate(valid_bytes)
+
+    @staticmethod
+    def _item_key(item: Any) -> bytes:
+        return hashlib.sha1(json.dumps(item, sort_keys=True, ensure_ascii=False).encode("utf-8")).digest()
+
+    def _remember(self, item: Any, key: bytes):
+        self._seen.add(key)
+        self.count += 1
+        if len(self.preview) < self.preview_size:
+            self.preview.append(item)
+
+    async def write_batch(self, items: List[Any]):
+        """Callback passed to paginated client methods"""
+        if self.done:
+            raise _TargetReached()
+
+        lines = []
+        for item in items:
+            key = self._item_key(item)
+            if key in self._seen:
+                continue
+            self._remember(item, key)
+            lines.append(json.dumps(item, ensure_ascii=False))
+            if self.done:
+                break
+
+        if lines:
+            self._file.write("\n".join(lines) + "\n")
+            self._file.flush()
+            logger.info(f"Saved {self.count} items to {self.filepath.name}")
+
+        if self.done:
+            raise _TargetReached()
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+def _format_items(title: str, items: List[Any], total: int) -> str:
+    """Render a markdown preview of list results"""
+    display_count = min(5, len(items))
+    md_content = f"## {title}\n\n"
+    md_content += f"Showing {display_count} of {total} results:\n\n"
+    for i, item in enumerate(items[:display_count]):
+        md_content += f"### Result {i + 1}\n"
+        if not isinstance(item, dict):
+            md_content += f"{item}\n\n"
+            continue
+        for key, value in item.items():
+            if not value:
+                continue
+            if isinstance(value, str) and len(value) > 200:
+                md_content += f"- **{key}**: {value[:200]}...\n"
+            else:
+                md_content += f"- **{key}**: {value}\n"
+        md_content += "\n"
+    return md_content
+
+
 async def get_api_params(params: GetApiParamsAction) -> ActionResult:
     """
     Get API parameters for a specific platform
@@ -141,6 +266,45 @@ async def call_api(
             return ActionResult(error=f"Unknown method '{params.method}' for {config['name']}")
         
         method = getattr(client, params.method)
+        title = f"{config['name']} {params.method.replace('_', ' ').title()}"
+        data_dir = file_system.get_dir() / "data"
+
+        # Paginated methods report each batch through a callback, stream those to NDJSON
+        if "callback" in inspect.signature(method).parameters:
+            method_params.pop("callback", None)
+            base_dir = file_system.get_dir().resolve()
+            if params.resume_file:
+                filepath = (base_dir / params.resume_file).resolve()
+                if filepath.parent != data_dir.resolve() or filepath.suffix != ".jsonl":
+                    return ActionResult(error=f"Invalid resume file: {params.resume_file}")
+            else:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                filepath = data_dir.resolve() / f"{platform}_{params.method}_{timestamp}.jsonl"
+
+            sink = NdjsonResultSink(filepath, max_items=params.max_items)
+            sink.open()
+            stopped_early = sink.done
+            try:
+                if not stopped_early:
+                    await method(**method_params, callback=sink.write_batch)
+            except _TargetReached:
+                stopped_early = True
+            finally:
+                sink.close()
+
+            md_content = _format_items(title, sink.preview, sink.count)
+            if sink.resumed_count:
+                md_content += f"> Resumed from {sink.resumed_count} previously saved results.\n"
+            if stopped_early:
+                md_content += f"> Stopped after reaching the target of {params.max_items} results.\n"
+
+            relative_path = str(filepath.relative_to(base_dir))
+            md_content += f"\n> 📁 Full data saved to: [{filepath.name}]({relative_path}) (one JSON object per line)\n"
+            md_content += f"> 💡 Pass it as resume_file to continue an interrupted crawl.\n"
+
+            logger.info(f"{config['name']} streamed {sink.count} items with method: {params.method}")
+            return ActionResult(extracted_content=md_content)
+
         result = await method(**method_params)
 
         # Check if result is None
@@ -155,7 +319,7 @@ async def call_api(
         # Save result to file
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"{platform}_{params.method}_{timestamp}.json"
-        filepath = file_system.get_dir() / "data" / filename
+        filepath = data_dir / filename
         filepath.parent.mkdir(exist_ok=True)
 
         with open(filepath, "w", encoding="utf-8") as f:
@@ -163,19 +327,7 @@ async def call_api(
 
         # Format result as markdown
         if isinstance(result, list):
-            display_count = min(5, len(result))
-            md_content = f"## {config['name']} {params.method.replace('_', ' ').title()}\n\n"
-            md_content += f"Showing {display_count} of {len(result)} results:\n\n"
-            for i, item in enumerate(result[:display_count]):
-                md_content += f"### Result {i + 1}\n"
-                for key, value in item.items():
-                    if not value:
-                        continue
-                    if isinstance(value, str) and len(value) > 200:
-                        md_content += f"- **{key}**: {value[:200]}...\n"
-                    else:
-                        md_content += f"- **{key}**: {value}\n"
-                md_content += "\n"
+            md_content = _format_items(title, result, len(result))
         elif isinstance(result, dict):
             md_content = f"## {config['name']} {params.method.replace('_', ' ').title()}\n\n"
             for key, value in result.items():
@@ -62,7 +62,7 @@ class QwenASRComponent(Component):
         ),
     ]
 
-    def transcribe_audio(self) -> Message:
+    async def transcribe_audio(self) -> Message:
         """Transcribe audio/video file using Qwen3-ASR-Flash"""
         
         if not self.api_key:
@@ -105,7 +105,7 @@ class QwenASRComponent(Component):
         
         # Process audio
         try:
-            result_path = processor.run(
+            result_path = await processor.arun(
                 input_file=resolved_path,
                 context=context,
                 save_srt=self.save_srt,
@@ -167,7 +167,7 @@ class QwenMTComponent(Component):
         ),
     ]
 
-    def translate_content(self) -> Message:
+    async def translate_content(self) -> Message:
         """Translate text or SRT file using Qwen-MT"""
 
         if not self.api_key:
@@ -215,7 +215,7 @@ class QwenMTComponent(Component):
                     output_file = os.path.join(output_dir, f"{base_name}.{target_lang_code}.srt")
 
                 # Translate SRT
-                result_path = processor.translate_srt(
+                result_path = await processor.atranslate_srt(
                     srt_file=resolved_path,
                     target_language=target_lang_code,
                     output_file=output_file
@@ -237,7 +237,7 @@ class QwenMTComponent(Component):
                     raise ValueError("Text cannot be empty")
 
                 # Translate text
-                translated_text = processor.run(
+                translated_text = await processor.arun(
                     text=text,
                     target_language=target_lang_code
                 )
@@ -248,3 +248,5 @@ class QwenMTComponent(Component):
         except Exception as e:
             self.status = f"✗ Translation failed: {str(e)}"
             raise e
+        finally:
+            processor.close()